@@ -0,0 +1,245 @@
+"""
+Benchmark harness: solves seeded generated instances with every configured method, repeats
+each measurement, stores the timings as a JSON baseline and flags slowdowns against the
+previous baseline.
+
+    uv run python -m src.benchmark                      # the problem selected in the configuration
+    uv run python -m src.benchmark sat --sizes 20 40 60 --repetitions 7
+
+The instances come from src/helpers/instance_generators.py, count of them for every size. One
+measurement is the total time a method spends on all instances of one size, and the repetitions
+go round all methods and sizes in turn, so a slow stretch on the machine is spread over all of
+them instead of hitting one. Everything runs in this process, one call at a time.
+
+A (method, size) pair is reported as a slowdown when its median time grew by at least
+min_slowdown and a one-sided Mann-Whitney U test says the new times are larger with p < alpha.
+The test only compares ranks, so it doesn't assume the timings are normally distributed. The
+baseline is only compared against when it was generated with the same sizes, count and seed.
+A run that finds a slowdown keeps the previous baseline unless --accept is given, so the
+slowdown is reported again until it is fixed. The exit code is 1 when a slowdown was found.
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from src.helpers.constants import CONFIGURATION_FILE_PATH, RESULTS_FOLDER, parse_config
+from src.helpers.instance_generators import (knapsack_instances, random_ksat_instances,
+                                             gnp_coloring_instances, gnp_hamiltonian_instances)
+from src.helpers.parallel_runner import solve_instances
+from src.helpers.project_selection_enum import ProjectSelection
+from src.helpers.search_budget import TIMEOUT
+from src.sat import SatSolver
+from src.graph_coloring import GraphColoring
+from src.knapsack_garcias import Knapsack
+from src.hamiltonian import HamiltonianSolver
+
+BENCHMARK_FOLDER = os.path.join(RESULTS_FOLDER, "benchmarks")
+
+# Per instance budget, so a size that is too large for brute force can't hang the benchmark
+DEFAULT_TIME_LIMIT = 10.0
+
+# Solver class, instance generator, size of a parsed instance and default sizes of every problem.
+# The default sizes keep the brute force methods at a few seconds per instance at most
+PROBLEMS = {
+    ProjectSelection.bin_packing.name: (Knapsack, knapsack_instances,
+                                        lambda instance: sum(instance[2].values()), [10, 14, 18]),
+    ProjectSelection.sat.name: (SatSolver, random_ksat_instances, lambda instance: instance[1], [15, 20, 25, 30]),
+    ProjectSelection.graph_coloring.name: (GraphColoring, gnp_coloring_instances,
+                                           lambda instance: instance[2], [10, 15, 20]),
+    ProjectSelection.hamiltonian.name: (HamiltonianSolver, gnp_hamiltonian_instances,
+                                        lambda instance: instance[1], [8, 11, 14]),
+}
+
+# Above this many pairs of measurements the U statistic is compared to its normal approximation
+_EXACT_U_LIMIT = 400
+
+
+@lru_cache(maxsize=None)
+def _u_counts(m: int, n: int) -> tuple:
+    """
+    Number of orderings of m + n distinct values that give U = 0, 1, ..., m * n, where U counts
+    the pairs in which one of the m values is larger than one of the n values.
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    # The largest value is either one of the m, larger than all n others, or one of the n
+    with_m, with_n = _u_counts(m - 1, n), _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, ways in enumerate(with_m):
+        counts[u + n] += ways
+    for u, ways in enumerate(with_n):
+        counts[u] += ways
+    return tuple(counts)
+
+
+def mann_whitney_greater(baseline: List[float], current: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test p-value for current being larger than baseline.
+    Ties count as half a pair, and the p-value is then rounded towards not significant.
+    """
+    m, n = len(current), len(baseline)
+    if m == 0 or n == 0:
+        return 1.0
+    u = sum(1.0 if c > b else 0.5 if c == b else 0.0 for c in current for b in baseline)
+    if m * n > _EXACT_U_LIMIT:
+        mean = m * n / 2
+        deviation = math.sqrt(m * n * (m + n + 1) / 12)
+        return 0.5 * math.erfc((u - mean - 0.5) / deviation / math.sqrt(2))
+    counts = _u_counts(m, n)
+    return sum(counts[math.floor(u):]) / sum(counts)
+
+
+def run_benchmark(problem: str, sizes: List[int], count: int = 5, repetitions: int = 5, seed: int = 0,
+                  run_options: Optional[Dict[str, Any]] = None,
+                  config_path: str = CONFIGURATION_FILE_PATH) -> Dict[str, Any]:
+    """
+    Generates count instances of every size, solves all of them repetitions times with every
+    method selected in the configuration file and returns the timings as a baseline dictionary.
+    """
+    solver_class, generate, instance_size, _ = PROBLEMS[problem]
+    options = dict(run_options or {})
+    options.update(workers=1, streaming=False, cache=False, plot=False, resume=False, parquet=False, stats=False)
+
+    with tempfile.TemporaryDirectory() as folder:
+        input_path = os.path.join(folder, f"{problem}_benchmark.cnf")
+        with open(input_path, "w") as f:
+            f.write(generate(sizes, count=count, seed=seed))
+        solver = solver_class(input_path, results_folder_path=folder, run_options=options, config_path=config_path)
+
+    by_size = {size: [] for size in sizes}
+    for instance in solver.solution_instances:
+        by_size[instance_size(instance)].append(instance)
+    methods = solver.selected_methods()
+    results = {label: {str(size): {"times": [], "timeouts": 0} for size in sizes} for _, label, _ in methods}
+
+    for repetition in range(repetitions):
+        for _, label, method_name in methods:
+            for size in sizes:
+                outcomes = list(solve_instances(solver, [solver.instance_task(method_name, instance)
+                                                         for instance in by_size[size]]))
+                entry = results[label][str(size)]
+                entry["times"].append(sum(outcome[2] for outcome in outcomes))
+                if repetition == 0:
+                    entry["timeouts"] = sum(outcome[0] == TIMEOUT for outcome in outcomes)
+        print(f"Repetition {repetition + 1}/{repetitions} done")
+
+    for sizes_results in results.values():
+        for entry in sizes_results.values():
+            entry["median"] = statistics.median(entry["times"])
+
+    return {
+        "problem": problem,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "generator": {"sizes": list(sizes), "count": count, "seed": seed},
+        "run_options": {key: options.get(key) for key in ("time_limit_seconds", "node_limit")},
+        "repetitions": repetitions,
+        "results": results,
+    }
+
+
+def find_slowdowns(baseline: Dict[str, Any], current: Dict[str, Any],
+                   alpha: float = 0.05, min_slowdown: float = 0.1) -> List[Dict[str, Any]]:
+    """
+    The (method, size) pairs of current that are significantly slower than in baseline, see the
+    module docstring. Pairs missing from either run are skipped.
+    """
+    slowdowns = []
+    for label, sizes_results in current["results"].items():
+        for size, entry in sizes_results.items():
+            previous = baseline["results"].get(label, {}).get(size)
+            if previous is None or previous["median"] <= 0:
+                continue
+            ratio = entry["median"] / previous["median"]
+            p_value = mann_whitney_greater(previous["times"], entry["times"])
+            if ratio >= 1 + min_slowdown and p_value < alpha:
+                slowdowns.append({"method": label, "size": size, "ratio": ratio, "p_value": p_value,
+                                  "baseline_median": previous["median"], "median": entry["median"]})
+    return slowdowns
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, result: Dict[str, Any]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+
+def parse_arguments(argv = None):
+    parser = argparse.ArgumentParser(description="Benchmark the configured solver methods on generated instances")
+    parser.add_argument("problem", nargs="?", choices=sorted(PROBLEMS), default=None,
+                        help="problem to benchmark, defaults to the one selected in the configuration file")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None,
+                        help="instance sizes: coins, variables or vertices")
+    parser.add_argument("--count", type=int, default=5, help="instances generated per size")
+    parser.add_argument("--repetitions", type=int, default=5, help="measurements per method and size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the instance generator")
+    parser.add_argument("--time-limit", type=float, default=DEFAULT_TIME_LIMIT,
+                        help="wall-clock budget in seconds per instance, searches past it count as timeouts")
+    parser.add_argument("--node-limit", type=int, default=None,
+                        help="search node budget per instance, like the solver option")
+    parser.add_argument("--baseline", default=None,
+                        help="baseline JSON file, defaults to results/benchmarks/<problem>_baseline.json")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level of the slowdown test")
+    parser.add_argument("--min-slowdown", type=float, default=0.1,
+                        help="smallest relative growth of the median time reported, 0.1 is 10%%")
+    parser.add_argument("--no-save", action="store_true", help="only compare, keep the baseline file as it is")
+    parser.add_argument("--accept", action="store_true",
+                        help="replace the baseline with this run even when it found slowdowns")
+    return parser.parse_args(argv)
+
+
+def main(argv = None) -> int:
+    args = parse_arguments(argv)
+    problem = args.problem
+    if problem is None:
+        selection, _ = parse_config(CONFIGURATION_FILE_PATH)
+        problem = selection["name"]
+    sizes = args.sizes or PROBLEMS[problem][3]
+    baseline_path = args.baseline or os.path.join(BENCHMARK_FOLDER, f"{problem}_baseline.json")
+
+    result = run_benchmark(problem, sizes, args.count, args.repetitions, args.seed,
+                           {"time_limit_seconds": args.time_limit, "node_limit": args.node_limit})
+    for label, sizes_results in result["results"].items():
+        for size, entry in sizes_results.items():
+            timeouts = f", {entry['timeouts']} timeouts" if entry["timeouts"] else ""
+            print(f"{label:>12} size {size:>4}: median {entry['median']:.6f}s{timeouts}")
+
+    slowdowns = []
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path} yet")
+    elif baseline["generator"] != result["generator"] or baseline["run_options"] != result["run_options"]:
+        print(f"Baseline {baseline_path} was generated with other settings, not comparing")
+    else:
+        slowdowns = find_slowdowns(baseline, result, args.alpha, args.min_slowdown)
+        for slowdown in slowdowns:
+            print(f"SLOWDOWN {slowdown['method']} size {slowdown['size']}: "
+                  f"{slowdown['baseline_median']:.6f}s -> {slowdown['median']:.6f}s "
+                  f"(x{slowdown['ratio']:.2f}, p = {slowdown['p_value']:.4f})")
+        if not slowdowns:
+            print(f"No significant slowdown against the baseline from {baseline['created']}")
+
+    if not args.no_save and (not slowdowns or args.accept):
+        save_baseline(baseline_path, result)
+        print(f"Baseline written to {baseline_path}")
+    return 1 if slowdowns else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
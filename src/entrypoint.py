@@ -1,15 +1,76 @@
 import os
+import argparse
 from src.helpers.project_selection_enum import ProjectSelection
 from src.helpers.constants import CONFIGURATION_FILE_PATH, parse_config, INPUT_FILE
 from src.sat import SatSolver
 from src.graph_coloring import GraphColoring
 from src.knapsack_garcias import Knapsack
+from src.hamiltonian import HamiltonianSolver
 from src.helpers.automation_helpers import brief_about_project
 
-def main():
+
+def parse_arguments(argv = None):
+    """
+    Command line flags, anything left unset falls back to the "Run Options" in the configuration file.
+    """
+    parser = argparse.ArgumentParser(description="Project 1 solvers")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes to solve instances with, 0 uses every core")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="wall-clock budget in seconds per instance, searches past it are recorded as TIMEOUT")
+    parser.add_argument("--node-limit", type=int, default=None,
+                        help="search node budget per instance, searches past it are recorded as TIMEOUT")
+    parser.add_argument("--streaming", action="store_true", default=None,
+                        help="read and solve one instance at a time instead of loading the whole input file")
+    parser.add_argument("--parser", choices=["text", "mmap"], default=None,
+                        help="input parser, mmap uses the memory-mapped block tokenizer")
+    parser.add_argument("--cache", action="store_true", default=None,
+                        help="load parsed instances from the binary instance cache, building it on the first run")
+    parser.add_argument("--max-flips", type=int, default=None,
+                        help="flip budget per instance for the local search SAT solver")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for the local search SAT solver and graph colorer")
+    parser.add_argument("--report-incumbents", action="store_true", default=None,
+                        help="print every improvement the anytime best case searches find")
+    parser.add_argument("--preprocess", action="store_true", default=None,
+                        help="simplify every SAT instance before solving it")
+    parser.add_argument("--tabu-iterations", type=int, default=None,
+                        help="move budget per instance for the tabu search graph colorer")
+    parser.add_argument("--no-plot", dest="plot", action="store_false", default=None,
+                        help="skip drawing the runtime charts, matplotlib is then never imported")
+    parser.add_argument("--resume", action="store_true", default=None,
+                        help="keep the existing result files and only solve the instances missing from them")
+    parser.add_argument("--parquet", action="store_true", default=None,
+                        help="also write every result file as Parquet with typed columns")
+    parser.add_argument("--stats", action="store_true", default=None,
+                        help="add search statistics (nodes, prunes, depth, peak memory, ...) to every result row")
+    args = parser.parse_args(argv)
+    # Streaming reads the instances with the line by line iterators, without the cache or the mmap parser
+    if args.streaming and (args.cache or args.parser == "mmap"):
+        parser.error("--streaming can't be combined with --cache or --parser mmap")
+    return args
+
+
+def main(argv = None):
     """
     Entry point for the project1_toc package.
     """
+    args = parse_arguments(argv)
+    run_options = {"workers": args.workers,
+                   "time_limit_seconds": args.time_limit,
+                   "node_limit": args.node_limit,
+                   "streaming": args.streaming,
+                   "parser": args.parser,
+                   "cache": args.cache,
+                   "max_flips": args.max_flips,
+                   "seed": args.seed,
+                   "report_incumbents": args.report_incumbents,
+                   "preprocess": args.preprocess,
+                   "tabu_iterations": args.tabu_iterations,
+                   "plot": args.plot,
+                   "resume": args.resume,
+                   "parquet": args.parquet,
+                   "stats": args.stats}
 
     if not os.path.exists(CONFIGURATION_FILE_PATH):
         brief_about_project()
@@ -17,13 +78,13 @@ def main():
 
 
     if selection["name"] == ProjectSelection.sat.name:
-        solver = SatSolver(INPUT_FILE)
+        solver = SatSolver(INPUT_FILE, run_options=run_options)
     elif selection["name"] == ProjectSelection.bin_packing.name:
-        solver = Knapsack(INPUT_FILE)
+        solver = Knapsack(INPUT_FILE, run_options=run_options)
     elif selection["name"] == ProjectSelection.hamiltonian.name:
-        solver = None
+        solver = HamiltonianSolver(INPUT_FILE, run_options=run_options)
     elif selection["name"] == ProjectSelection.graph_coloring.name:
-        solver = GraphColoring(INPUT_FILE)
+        solver = GraphColoring(INPUT_FILE, run_options=run_options)
     
     if solver:
         solver.run()
@@ -43,7 +43,435 @@ instance_id,n_vertices,n_edges,k,method,colorable,time_seconds,coloring
 
 from src.helpers.graph_coloring_helper import GraphColoringAbstractClass
 import itertools
+import random
+import time
+from array import array
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Tuple
+import numpy as np
+from src.helpers.parallel_runner import resolve_workers
+from src.helpers.search_budget import SearchTimeout
+
+# Colorings checked together as one NumPy block in the brute force search
+_BRUTEFORCE_BLOCK_SIZE = 1 << 15
+# Below this many colorings a process pool costs more than it saves
+_BRUTEFORCE_PARALLEL_COLORINGS = 1 << 30
+
+
+def _bruteforce_low_vertices(n: int, k: int) -> int:
+    """
+        Number of low vertices whose colorings make up one brute force block
+    """
+    low = 0
+    while low < n and k ** (low + 1) <= _BRUTEFORCE_BLOCK_SIZE:
+        low += 1
+    return low
+
+
+def _bruteforce_colorings(n: int, edges: List[Tuple[int, int]], k: int, start: int, stop: int,
+                          deadline: Optional[float] = None, budget = None) -> Optional[int]:
+    """
+        Checks the colorings of blocks [start, stop) and returns the number of the first proper one, or None.
+
+        Coloring number x gives vertex i the i-th digit of x in base k, so the low vertices change inside
+        a block and their colors are fixed arrays, while the high vertices are constant in a block and
+        come from the block number. Edges between low vertices are the same in every block and are
+        checked once, an edge between two high vertices rules out a block with one compare, and the
+        edges from a low to a high vertex are all checked at once by picking rows out of a
+        precomputed (low vertex, color) table of "differs from color" masks.
+    """
+    low = _bruteforce_low_vertices(n, k)
+    block_size = k ** low
+    index = np.arange(block_size)
+    # colors[i] is the color of low vertex i in every coloring of a block
+    colors = np.array([(index // k ** i) % k for i in range(low)], dtype=np.int8).reshape(low, block_size)
+    differs = colors[:, None, :] != np.arange(k, dtype=np.int8)[None, :, None]
+
+    base = np.ones(block_size, dtype=bool)
+    mixed_low, mixed_high, high_edges = [], [], []
+    for u, v in edges:
+        if u < low and v < low:
+            base &= colors[u] != colors[v]
+        elif u < low or v < low:
+            mixed_low.append(min(u, v))
+            mixed_high.append(max(u, v) - low)
+        else:
+            high_edges.append((u - low, v - low))
+    if not base.any():
+        return None
+    mixed_low = np.array(mixed_low, dtype=np.intp)
+    mixed_high = np.array(mixed_high, dtype=np.intp)
+    n_high = n - low
+
+    for block in range(start, stop):
+        if budget is not None:
+            budget.charge(block_size)
+        elif deadline is not None and time.perf_counter() > deadline:
+            raise SearchTimeout("time limit reached")
+        high = [(block // k ** i) % k for i in range(n_high)]
+        if any(high[a] == high[b] for a, b in high_edges):
+            continue
+        if len(mixed_low):
+            proper = base & differs[mixed_low, np.array(high, dtype=np.intp)[mixed_high]].all(axis=0)
+        else:
+            proper = base
+        if proper.any():
+            return block * block_size + int(proper.argmax())
+    return None
+
+
+def _bruteforce_chunk(task) -> Optional[int]:
+    return _bruteforce_colorings(*task)
+
+
+def _adjacency_bitsets(n_vertices: int, edges: List[Tuple[int]]) -> Tuple[int, List[int], bool]:
+    """
+        Builds the graph once as one integer bitset per vertex, bit u of adjacency[v] is set when u, v
+        share an edge. Returns (n, adjacency, has_self_loop), n also covers endpoints past n_vertices.
+    """
+    n = max([n_vertices] + [max(u, v) + 1 for u, v in edges])
+    adjacency = [0] * n
+    has_self_loop = False
+    for u, v in edges:
+        if u == v:
+            has_self_loop = True
+            continue
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
+    return n, adjacency, has_self_loop
+
+
+def _csr_adjacency(n_vertices: int, edges: List[Tuple[int]]) -> Tuple[int, array, array, bool]:
+    """
+        Builds the graph as CSR arrays: the neighbors of v are neighbors[offsets[v]:offsets[v + 1]].
+        Duplicate edges are dropped. Returns (n, offsets, neighbors, has_self_loop).
+    """
+    n = max([n_vertices] + [max(u, v) + 1 for u, v in edges])
+    pairs = set()
+    has_self_loop = False
+    for u, v in edges:
+        if u == v:
+            has_self_loop = True
+        elif u < v:
+            pairs.add((u, v))
+        else:
+            pairs.add((v, u))
+    degree = array("i", [0]) * n
+    for u, v in pairs:
+        degree[u] += 1
+        degree[v] += 1
+    offsets = array("i", [0]) * (n + 1)
+    for v in range(n):
+        offsets[v + 1] = offsets[v] + degree[v]
+    neighbors = array("i", [0]) * offsets[n]
+    fill = array("i", offsets)
+    for u, v in pairs:
+        neighbors[fill[u]] = v
+        fill[u] += 1
+        neighbors[fill[v]] = u
+        fill[v] += 1
+    return n, offsets, neighbors, has_self_loop
+
+
+def _dsatur_buckets(n: int, offsets: array, neighbors: array) -> List[int]:
+    """
+        Greedy DSATUR over CSR arrays with a bucket queue keyed by saturation, so picking the most
+        saturated vertex never scans the graph. Vertices start in their bucket in descending degree
+        order (Welsh-Powell), which breaks the saturation ties toward high degree.
+    """
+    colors = [-1] * n
+    # Bitset of the colors around every vertex, its bit count is the saturation
+    around = [0] * n
+    # buckets[s] holds the uncolored vertices of saturation s, a dict keeps them in insertion order
+    buckets = [dict() for _ in range(n + 1)]
+    for v in sorted(range(n), key=lambda u: offsets[u] - offsets[u + 1]):
+        buckets[0][v] = None
+    top = 0
+    for _ in range(n):
+        while not buckets[top]:
+            top -= 1
+        bucket = buckets[top]
+        v = next(iter(bucket))
+        del bucket[v]
+        color = (~around[v] & (around[v] + 1)).bit_length() - 1
+        colors[v] = color
+        bit = 1 << color
+        for index in range(offsets[v], offsets[v + 1]):
+            u = neighbors[index]
+            if colors[u] < 0 and not around[u] & bit:
+                saturation = around[u].bit_count()
+                del buckets[saturation][u]
+                buckets[saturation + 1][u] = None
+                around[u] |= bit
+                if saturation + 1 > top:
+                    top = saturation + 1
+    return colors
+
+
+def _tabucol(n: int, offsets: array, neighbors: array, colors: List[int], k: int,
+             iterations: int, rnd: random.Random, budget) -> Optional[List[int]]:
+    """
+        TabuCol local search for a proper k-coloring starting from colors, returns None when it does
+        not find one within iterations moves.
+
+        conflicts[v * k + c] counts the neighbors of v with color c. Every move recolors a conflicting
+        vertex to the color that removes the most conflicts, moving a vertex back to a color it just
+        left is tabu for a while unless it beats the best coloring seen.
+    """
+    colors = [color if color < k else rnd.randrange(k) for color in colors]
+    conflicts = array("i", [0]) * (n * k)
+    for v in range(n):
+        for index in range(offsets[v], offsets[v + 1]):
+            conflicts[v * k + colors[neighbors[index]]] += 1
+    # Vertices with a neighbor of the same color
+    conflicting = {v: None for v in range(n) if conflicts[v * k + colors[v]]}
+    total = sum(conflicts[v * k + colors[v]] for v in conflicting) // 2
+    best_total = total
+    tabu_until = array("q", [0]) * (n * k)
+
+    check_interval = budget.check_interval
+    nodes = 0
+    try:
+        for step in range(iterations):
+            if total == 0:
+                return colors
+            nodes += 1
+            if nodes == check_interval:
+                budget.charge(nodes)
+                nodes = 0
+
+            best_delta = None
+            moves = []
+            for v in conflicting:
+                row = v * k
+                current = conflicts[row + colors[v]]
+                for color in range(k):
+                    if color == colors[v]:
+                        continue
+                    delta = conflicts[row + color] - current
+                    # Aspiration: a tabu move is allowed when it beats the best coloring so far
+                    if tabu_until[row + color] > step and total + delta >= best_total:
+                        continue
+                    if best_delta is None or delta < best_delta:
+                        best_delta = delta
+                        moves = [(v, color)]
+                    elif delta == best_delta:
+                        moves.append((v, color))
+            if not moves:
+                continue
+            v, color = moves[rnd.randrange(len(moves))] if len(moves) > 1 else moves[0]
+
+            old = colors[v]
+            tabu_until[v * k + old] = step + int(0.6 * total) + rnd.randrange(10) + 1
+            colors[v] = color
+            total += best_delta
+            best_total = min(best_total, total)
+            for index in range(offsets[v], offsets[v + 1]):
+                u = neighbors[index]
+                row = u * k
+                conflicts[row + old] -= 1
+                conflicts[row + color] += 1
+                if conflicts[row + colors[u]]:
+                    conflicting[u] = None
+                else:
+                    conflicting.pop(u, None)
+            if conflicts[v * k + color]:
+                conflicting[v] = None
+            else:
+                conflicting.pop(v, None)
+    finally:
+        if budget.stats is not None:
+            budget.record(nodes)
+    return colors if total == 0 else None
+
+
+def _bits(mask: int):
+    """
+        Positions of the set bits of mask, lowest first
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _peel_low_degree(n: int, adjacency: List[int], k: int) -> Tuple[int, List[int]]:
+    """
+        Repeatedly removes vertices with fewer than k neighbors left, they can always be colored
+        after the rest of the graph. Returns the bitset of the remaining core and the removed
+        vertices in removal order.
+    """
+    core = (1 << n) - 1
+    removed = []
+    queue = [v for v in range(n) if adjacency[v].bit_count() < k]
+    while queue:
+        v = queue.pop()
+        if not (core >> v) & 1:
+            continue
+        core ^= 1 << v
+        removed.append(v)
+        for u in _bits(adjacency[v] & core):
+            if (adjacency[u] & core).bit_count() == k - 1:
+                queue.append(u)
+    return core, removed
+
+
+def _color_peeled(colors: List[int], adjacency: List[int], removed: List[int]):
+    """
+        Gives the peeled vertices, last removed first, the lowest color none of their neighbors has
+    """
+    for v in reversed(removed):
+        taken = 0
+        for u in _bits(adjacency[v]):
+            if colors[u] >= 0:
+                taken |= 1 << colors[u]
+        colors[v] = (~taken & (taken + 1)).bit_length() - 1
+
+
+def _dsatur_greedy(n: int, adjacency: List[int]) -> List[int]:
+    """
+        DSATUR without backtracking: colors the most saturated vertex next with its lowest free color
+    """
+    colors = [-1] * n
+    # Bitset of the colors around every vertex
+    around = [0] * n
+    uncolored = (1 << n) - 1
+    for _ in range(n):
+        v = max(_bits(uncolored), key=lambda u: (around[u].bit_count(), (adjacency[u] & uncolored).bit_count()))
+        color = (~around[v] & (around[v] + 1)).bit_length() - 1
+        colors[v] = color
+        uncolored ^= 1 << v
+        for u in _bits(adjacency[v] & uncolored):
+            around[u] |= 1 << color
+    return colors
+
+
+def _greedy_clique(n: int, adjacency: List[int]) -> List[int]:
+    """
+        Largest clique found by growing one from every vertex, always adding the candidate adjacent to
+        the most other candidates. Any clique is a lower bound on the number of colors.
+    """
+    best = []
+    for v in sorted(range(n), key=lambda u: -adjacency[u].bit_count()):
+        if adjacency[v].bit_count() < len(best):
+            break
+        clique = [v]
+        candidates = adjacency[v]
+        while candidates:
+            u = max(_bits(candidates), key=lambda w: (adjacency[w] & candidates).bit_count())
+            clique.append(u)
+            candidates &= adjacency[u]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def _dsatur_search(n: int, adjacency: List[int], k: int, budget, clique: List[int] = ()) -> Optional[List[int]]:
+    """
+        DSATUR backtracking with forward checking behind coloring_backtracking and coloring_bestcase.
+        Returns a proper coloring with colors 0..k - 1, or None when there is none.
+        The vertices of clique, which have to get different colors anyway, are colored first.
+    """
+    core, removed = _peel_low_degree(n, adjacency, k)
+    colors = [-1] * n
+    domains = [(1 << k) - 1] * n
+    # Uncolored vertices of the core
+    free = core
+    # DSATUR key kept up to date so the next vertex is one C level min() away:
+    # domain size * weight - uncolored neighbors, colored and peeled vertices are never picked
+    weight = n + 1
+    done = k * weight + weight
+    score = [done] * n
+    for v in _bits(core):
+        score[v] = k * weight - (adjacency[v] & core).bit_count()
+    # trail holds (vertex, color bit) for every domain bit removed by forward checking
+    trail = []
+    # One frame per colored vertex: vertex, colors left to try, trail length, used colors before it, its score
+    frames = []
+    used = 0
+
+    # Clique vertices left in the core get colors 0, 1, ... up front, for good
+    for color, v in enumerate(v for v in clique if (core >> v) & 1):
+        if not (domains[v] >> color) & 1:
+            return None
+        colors[v] = color
+        used = color + 1
+        free ^= 1 << v
+        score[v] = done
+        bit = 1 << color
+        for u in _bits(adjacency[v] & free):
+            score[u] += 1
+            if domains[u] & bit:
+                domains[u] ^= bit
+                score[u] -= weight
+                if not domains[u]:
+                    return None
+
+    check_interval = budget.check_interval
+    nodes = 0
+    prunes = 0
+    deepest = 0
+    descend = True
+    try:
+        while True:
+            if descend:
+                if not free:
+                    break
+                v = min(range(n), key=score.__getitem__)
+                # Symmetry breaking: of the colors nobody has yet only the lowest is tried
+                candidates = domains[v] & ((1 << min(used + 1, k)) - 1)
+                frames.append([v, candidates, len(trail), used, score[v]])
+                deepest = max(deepest, len(frames))
+                free ^= 1 << v
+                score[v] = done
+                for u in _bits(adjacency[v] & free):
+                    score[u] += 1
+                descend = False
+
+            if not frames:
+                return None
+            frame = frames[-1]
+            v, candidates, mark, used, own_score = frame
+            # Undo the forward checking of the color tried last
+            while len(trail) > mark:
+                u, bit = trail.pop()
+                domains[u] |= bit
+                score[u] += weight
+            if not candidates:
+                frames.pop()
+                colors[v] = -1
+                for u in _bits(adjacency[v] & free):
+                    score[u] -= 1
+                free |= 1 << v
+                score[v] = own_score
+                continue
+
+            nodes += 1
+            if nodes == check_interval:
+                budget.charge(nodes)
+                nodes = 0
+            bit = candidates & -candidates
+            frame[1] = candidates ^ bit
+            colors[v] = bit.bit_length() - 1
+            used = max(used, colors[v] + 1)
+            wiped_out = False
+            for u in _bits(adjacency[v] & free):
+                if domains[u] & bit:
+                    domains[u] ^= bit
+                    score[u] -= weight
+                    trail.append((u, bit))
+                    if not domains[u]:
+                        wiped_out = True
+                        prunes += 1
+                        break
+            descend = not wiped_out
+    finally:
+        if budget.stats is not None:
+            budget.record(nodes, prunes=prunes, max_depth=deepest)
+
+    _color_peeled(colors, adjacency, removed)
+    return colors
 
 
 class GraphColoring(GraphColoringAbstractClass):
@@ -57,13 +485,204 @@ class GraphColoring(GraphColoringAbstractClass):
 
 
     def coloring_backtracking(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
-        pass
+        """
+            Generates a backtracking solution with DSATUR ordering and forward checking
+
+            The graph is built once as adjacency bitsets, and every uncolored vertex keeps a k bit
+            domain of the colors it can still take. Vertices with fewer than k neighbors are peeled off
+            first, since they can always be colored at the end. At each step the vertex with the smallest
+            domain (the most saturated one) is colored next, ties going to the one with the most uncolored
+            neighbors. Coloring a vertex removes its color from its uncolored neighbors' domains, and the
+            branch is abandoned as soon as one of them is left empty. Colors that are not used yet are
+            interchangeable, so only the lowest of them is ever tried.
+            The search runs on an explicit stack, the removed domain bits are kept on a trail and put
+            back when the search backtracks.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v) edges
+            - k: number of colors
+
+            Return
+            Tuple[
+                bool: True if the graph can be colored with k colors or False if it can't,
+                List[int]: the color 0..k - 1 of every vertex, empty when there is no k-coloring
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> coloring_backtracking(4, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)], 3)
+            (True, [0, 1, 2, 0])
+            >>> coloring_backtracking(3, [(0, 1), (1, 2), (0, 2)], 2)
+            (False, [])
+        """
+        n, adjacency, has_self_loop = _adjacency_bitsets(n_vertices, edges)
+        if has_self_loop or (k <= 0 and n > 0):
+            return False, []
+        colors = _dsatur_search(n, adjacency, k, self.budget)
+        if colors is None:
+            return False, []
+        return True, colors[:n_vertices]
 
     def coloring_bruteforce(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
-        pass
+        """
+            Generates a brute force solution by checking every one of the k^n colorings
+
+            The colorings are counted in base k, vertex 0 being the lowest digit, and checked in NumPy
+            blocks of up to 32768: every edge becomes one vectorized compare of the endpoint color arrays
+            and a coloring is proper when all of them hold. Blocks are checked in order, so the answer
+            is always the first proper coloring in that count. With more than one worker and enough
+            colorings the blocks are split into chunks that run on a process pool. The chunks check the
+            time limit themselves, and every chunk that comes back is charged to the budget, so the node
+            limit stops the search at the next finished chunk.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v) edges
+            - k: number of colors
+
+            Return
+            Tuple[
+                bool: True if the graph can be colored with k colors or False if it can't,
+                List[int]: the color 0..k - 1 of every vertex, empty when there is no k-coloring
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> coloring_bruteforce(4, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)], 3)
+            (True, [0, 1, 2, 0])
+            >>> coloring_bruteforce(3, [(0, 1), (1, 2), (0, 2)], 2)
+            (False, [])
+        """
+        n, adjacency, has_self_loop = _adjacency_bitsets(n_vertices, edges)
+        if has_self_loop or (k <= 0 and n > 0):
+            return False, []
+        if n == 0:
+            return True, []
+        k = min(k, n)
+        edges = [(u, v) for u in range(n) for v in _bits(adjacency[u] >> (u + 1) << (u + 1))]
+
+        n_blocks = k ** (n - _bruteforce_low_vertices(n, k))
+        workers = resolve_workers(self.run_options["workers"])
+
+        # Nested pools are avoided, inside a worker process the blocks are checked serially
+        if workers > 1 and k ** n >= _BRUTEFORCE_PARALLEL_COLORINGS and multiprocessing.parent_process() is None:
+            deadline = self.budget.deadline
+            chunk = max(1, n_blocks // (workers * 8))
+            tasks = [(n, edges, k, start, min(start + chunk, n_blocks), deadline)
+                     for start in range(0, n_blocks, chunk)]
+            block_size = k ** _bruteforce_low_vertices(n, k)
+            found = None
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_bruteforce_chunk, task) for task in tasks]
+                try:
+                    # Chunks are checked in order so the answer is the same as the serial search
+                    for (_, _, _, start, stop, _), future in zip(tasks, futures):
+                        found = future.result()
+                        if found is not None:
+                            break
+                        self.budget.charge((stop - start) * block_size)
+                finally:
+                    for future in futures:
+                        future.cancel()
+        else:
+            found = _bruteforce_colorings(n, edges, k, 0, n_blocks, budget=self.budget)
+
+        if found is None:
+            return False, []
+        return True, [(found // k ** i) % k for i in range(n)][:n_vertices]
 
     def coloring_simple(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
-        pass
+        """
+            Generates a quick heuristic solution: greedy DSATUR, then a short TabuCol search
+
+            The graph is stored as CSR arrays. A greedy DSATUR pass with a bucket queue colors the graph
+            in near linear time, and if it needs more than k colors, the vertices with colors past k are
+            recolored at random and TabuCol moves conflicting vertices between the k colors until no
+            edge has both ends the same color. Nothing is ever undone, so this is fast but it can't
+            prove that no k-coloring exists: when the "tabu_iterations" run option is used up the
+            instance is written as TIMEOUT. The "seed" run option makes the result reproducible.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v) edges
+            - k: number of colors
+
+            Return
+            Tuple[
+                bool: True if a k-coloring was found, False only when none can exist (a self loop or k < 1),
+                List[int]: the color 0..k - 1 of every vertex, empty when there is no k-coloring
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> coloring_simple(4, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)], 3)
+            (True, [1, 0, 2, 1])
+        """
+        n, offsets, neighbors, has_self_loop = _csr_adjacency(n_vertices, edges)
+        if has_self_loop or (k <= 0 and n > 0):
+            return False, []
+        colors = _dsatur_buckets(n, offsets, neighbors)
+        if max(colors, default=-1) >= k:
+            rnd = random.Random(self.run_options["seed"])
+            iterations = self.run_options["tabu_iterations"]
+            colors = _tabucol(n, offsets, neighbors, colors, k, iterations, rnd, self.budget)
+            if colors is None:
+                # Local search cannot prove there is no k-coloring, running out of moves is reported like a timeout
+                raise SearchTimeout(f"tabu iteration limit of {iterations} reached")
+        return True, colors[:n_vertices]
 
     def coloring_bestcase(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
-        pass
+        """
+            Generates a best case solution: a coloring with the fewest colors possible (the chromatic number)
+
+            A DSATUR greedy coloring gives the first upper bound and a greedily grown clique the lower
+            bound, since every clique vertex needs its own color. While the bounds differ, the DSATUR
+            backtracking search looks for a coloring with one color less than the best one so far, with
+            the clique colored up front. Every coloring it finds tightens the upper bound, and the search
+            stops as soon as the bounds meet or no coloring with fewer colors exists.
+            This way, if the graph can be colored with k colors we return True, but if it can't,
+            we still return the coloring with the fewest colors, like knapsack_bestcase returns the
+            closest fit. When the run budget is used up the instance is written as TIMEOUT together
+            with the best coloring found so far.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v) edges
+            - k: number of colors
+
+            Return
+            Tuple[
+                bool: True if the graph can be colored with k colors or False if it can't,
+                List[int]: the color of every vertex in a coloring with the fewest colors
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> coloring_bestcase(4, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)], 3)
+            (True, [0, 1, 2, 0])
+            >>> coloring_bestcase(3, [(0, 1), (1, 2), (0, 2)], 2)
+            (False, [0, 1, 2])
+            - 3 colors are needed, a triangle can't be colored with 2
+        """
+        n, adjacency, has_self_loop = _adjacency_bitsets(n_vertices, edges)
+        if has_self_loop:
+            return False, []
+        if n == 0:
+            return True, []
+
+        best = _dsatur_greedy(n, adjacency)
+        upper = max(best) + 1
+        clique = _greedy_clique(n, adjacency)
+        lower = len(clique)
+        while upper > lower:
+            try:
+                colors = _dsatur_search(n, adjacency, upper - 1, self.budget, clique)
+            except SearchTimeout as error:
+                error.incumbent = best[:n_vertices]
+                raise
+            if colors is None:
+                break
+            best = colors
+            upper = max(colors) + 1
+        return upper <= k, best[:n_vertices]
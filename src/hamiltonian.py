@@ -0,0 +1,570 @@
+"""
+Hamiltonian Cycle / Traveling Salesman Solver - DIMACS-like Multi-instance Format
+----------------------------------------------------------
+Project 1: Tough Problems & The Wonderful World of NP
+
+INPUT FORMAT (multi-instance file):
+-----------------------------------
+Each instance starts with a comment and a problem definition:
+
+c <instance_id> <status?>
+p edge <n_vertices> <n_edges>
+u,v,weight
+x,y,weight
+...
+
+The weight is optional and defaults to 1, so an unweighted file asks for any Hamiltonian cycle
+and a weighted one for the lightest (a traveling salesman tour over the given edges).
+
+Example:
+c 1 ?
+p edge 4 5
+1,2,3
+2,3,1
+3,4,2
+4,1,5
+1,3,1
+c 2 ?
+p edge 4 3
+1,2
+2,3
+3,4
+
+OUTPUT:
+-------
+A CSV file named 'resultsfile.csv' with columns:
+instance_id, n_vertices, n_edges, method, hamiltonian, time_seconds, tour, tour_weight
+
+The tour lists every vertex once (0-based) starting at vertex 0, the cycle closes back to it.
+
+EXAMPLE OUTPUT
+--------------
+instance_id,n_vertices,n_edges,method,hamiltonian,time_seconds,tour,tour_weight
+1,4,5,BruteForce,YES,0.000041,"[0, 3, 2, 1]",11
+2,4,3,BruteForce,NO,0.000008,[],
+"""
+
+from src.helpers.hamiltonian_helper import HamiltonianAbstractClass
+from collections import deque
+from array import array
+from typing import List, Optional, Dict, Tuple
+from src.helpers.search_budget import SearchTimeout
+
+# Largest graph solved with the Held-Karp dynamic program, its tables take 12 * 2^(n-1) * (n-1) bytes,
+# about 27 MB at 18 vertices and gigabytes from 25 on
+_HELD_KARP_MAX_VERTICES = 18
+# Neighbors per vertex, lightest first, that the local search tries moves with
+_LOCAL_SEARCH_NEIGHBORS = 10
+# Longest segment Or-opt moves
+_OR_OPT_MAX_SEGMENT = 3
+
+
+def _weighted_graph(n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[int, List[int], List[Dict[int, int]]]:
+    """
+        Builds the graph as adjacency bitsets plus a dict of edge weights per vertex.
+        Parallel edges keep the lightest weight and self loops are dropped, neither matters for a cycle.
+    """
+    n = max([n_vertices] + [max(u, v) + 1 for u, v, _ in edges])
+    adjacency = [0] * n
+    weights = [dict() for _ in range(n)]
+    for u, v, weight in edges:
+        if u == v:
+            continue
+        if v not in weights[u] or weight < weights[u][v]:
+            weights[u][v] = weight
+            weights[v][u] = weight
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
+    return n, adjacency, weights
+
+
+def _bits(mask: int):
+    """
+        Positions of the set bits of mask, lowest first
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _connected(adjacency: List[int], allowed: int, start: int) -> bool:
+    """
+        Whether every vertex of the allowed bitset can be reached from start inside it
+    """
+    reached = frontier = 1 << start
+    while frontier:
+        grown = 0
+        for v in _bits(frontier):
+            grown |= adjacency[v]
+        frontier = grown & allowed & ~reached
+        reached |= frontier
+    return reached & allowed == allowed
+
+
+def _trivially_decided(n: int, adjacency: List[int]) -> Optional[Tuple[bool, List[int]]]:
+    """
+        Answers the cases that need no search: graphs with fewer than 3 vertices, a vertex with fewer
+        than two neighbors or more than one component. Returns None when a search is needed.
+    """
+    if n == 0:
+        return True, []
+    if n == 1:
+        return True, [0]
+    if n == 2 or any(adjacency[v].bit_count() < 2 for v in range(n)):
+        return False, []
+    if not _connected(adjacency, (1 << n) - 1, 0):
+        return False, []
+    return None
+
+
+def _held_karp(n: int, adjacency: List[int], weights: List[Dict[int, int]], budget) -> Optional[Tuple[int, List[int]]]:
+    """
+        Held-Karp dynamic program: cost[S, v] is the lightest path that starts at vertex 0, visits exactly
+        the vertices of S and ends at v in S. Subsets are visited in increasing order, so every subset
+        is final before it is extended. Returns (weight, tour) of the lightest Hamiltonian cycle or None.
+    """
+    m = n - 1
+    full = (1 << m) - 1
+    unreached = (1 << 63) - 1
+    # Vertex v >= 1 is bit v - 1 of S, cost and parent are flat arrays indexed by S * m + (v - 1)
+    cost = array("q", [unreached]) * ((1 << m) * m)
+    parent = array("i", [-1]) * ((1 << m) * m)
+    shifted = [adjacency[v] >> 1 for v in range(n)]
+    for j in _bits(shifted[0]):
+        cost[(1 << j) * m + j] = weights[0][j + 1]
+
+    check_interval = budget.check_interval
+    nodes = 0
+    try:
+        for mask in range(1, full + 1):
+            nodes += 1
+            if nodes == check_interval:
+                budget.charge(nodes)
+                nodes = 0
+            base = mask * m
+            outside = full & ~mask
+            for j in _bits(mask):
+                current = cost[base + j]
+                if current == unreached:
+                    continue
+                row = weights[j + 1]
+                for i in _bits(shifted[j + 1] & outside):
+                    index = (mask | (1 << i)) * m + i
+                    candidate = current + row[i + 1]
+                    if candidate < cost[index]:
+                        cost[index] = candidate
+                        parent[index] = j
+    finally:
+        if budget.stats is not None:
+            budget.record(nodes)
+
+    best, last = unreached, -1
+    for j in _bits(shifted[0]):
+        if cost[full * m + j] != unreached and cost[full * m + j] + weights[0][j + 1] < best:
+            best, last = cost[full * m + j] + weights[0][j + 1], j
+    if last < 0:
+        return None
+    tour = []
+    mask = full
+    while last >= 0:
+        tour.append(last + 1)
+        last, mask = parent[mask * m + last], mask ^ (1 << last)
+    tour.append(0)
+    tour.reverse()
+    return best, tour
+
+
+def _cycle_search(n: int, adjacency: List[int], weights: List[Dict[int, int]], budget,
+                  optimize: bool = False, incumbent: Optional[Tuple[int, List[int]]] = None) -> Optional[Tuple[int, List[int]]]:
+    """
+        Backtracking over paths from vertex 0 with degree and connectivity pruning.
+
+        After every step, each unvisited vertex still needs two neighbors among the unvisited vertices
+        and the two path ends, the unvisited vertices and the path ends have to stay connected, and
+        vertex 0 needs an unvisited neighbor numbered above the second vertex of the path to close the
+        cycle through (every cycle is only searched in one direction). The next vertex is the one with
+        the fewest unvisited neighbors. With optimize the search keeps going after the first cycle
+        and also cuts paths that cannot beat the incumbent, see the bound below. Returns (weight, tour) of the best cycle found or None.
+    """
+    everything = (1 << n) - 1
+    lightest = [min(row.values()) for row in weights]
+    lightest_two = [sum(sorted(row.values())[:2]) for row in weights]
+    best = incumbent
+    best_weight = incumbent[0] if incumbent is not None else None
+
+    path = [0]
+    visited = 1
+    path_weight = 0
+    # Sums over the unvisited vertices of their lightest edge and of their two lightest edges
+    rest = sum(lightest) - lightest[0]
+    rest_two = sum(lightest_two) - lightest_two[0]
+
+    def ordered(v: int) -> List[int]:
+        # Popped from the end, so the vertex with the fewest unvisited neighbors goes last
+        candidates = list(_bits(adjacency[v] & ~visited))
+        candidates.sort(key=lambda u: -(adjacency[u] & ~visited).bit_count())
+        return candidates
+
+    def feasible(v: int) -> bool:
+        unvisited = everything & ~visited
+        ends = (1 << v) | 1
+        for u in _bits(unvisited):
+            if (adjacency[u] & (unvisited | ends)).bit_count() < 2:
+                return False
+        if not adjacency[v] & unvisited:
+            return False
+        closing = adjacency[0] & unvisited & ~((2 << path[1]) - 1)
+        if not closing:
+            return False
+        return _connected(adjacency, unvisited | (1 << v), v)
+
+    frames = [ordered(0)]
+    check_interval = budget.check_interval
+    nodes = 0
+    prunes = 0
+    deepest = 0
+    try:
+        while frames:
+            nodes += 1
+            if nodes == check_interval:
+                try:
+                    budget.charge(nodes)
+                except SearchTimeout as error:
+                    error.incumbent = best[1] if best is not None else None
+                    raise
+                nodes = 0
+
+            candidates = frames[-1]
+            if not candidates:
+                frames.pop()
+                if frames:
+                    v = path.pop()
+                    visited ^= 1 << v
+                    path_weight -= weights[path[-1]][v]
+                    rest += lightest[v]
+                    rest_two += lightest_two[v]
+                continue
+
+            v = candidates.pop()
+            path_weight += weights[path[-1]][v]
+            path.append(v)
+            visited |= 1 << v
+            rest -= lightest[v]
+            rest_two -= lightest_two[v]
+
+            extend = False
+            if visited == everything:
+                if 0 in weights[v] and path[1] < v:
+                    total = path_weight + weights[v][0]
+                    if best_weight is None or total < best_weight:
+                        best, best_weight = (total, list(path)), total
+                        if not optimize:
+                            return best
+            elif optimize and best_weight is not None and path_weight + max(
+                    rest + lightest[v], -(-(rest_two + lightest[v] + lightest[0]) // 2)) >= best_weight:
+                # The rest of the cycle leaves v and every unvisited vertex once, and it touches every unvisited
+                # vertex twice and v and 0 once, where each of its edges has two ends
+                pass
+            else:
+                extend = feasible(v)
+
+            if extend:
+                frames.append(ordered(v))
+                deepest = max(deepest, len(frames))
+            else:
+                if visited != everything:
+                    # Cut by the bound or the feasibility checks, not a finished path
+                    prunes += 1
+                path.pop()
+                visited ^= 1 << v
+                path_weight -= weights[path[-1]][v]
+                rest += lightest[v]
+                rest_two += lightest_two[v]
+    finally:
+        if budget.stats is not None:
+            budget.record(nodes, prunes=prunes, max_depth=deepest)
+    return best
+
+
+def _local_search(n: int, weights: List[Dict[int, int]], budget) -> Tuple[bool, int, List[int]]:
+    """
+        Nearest neighbor tour improved with 2-opt and Or-opt moves until none of them helps.
+
+        A missing edge costs more than any tour made of real edges, so the search first gets rid of
+        missing edges and then of weight. Moves are only tried with each vertex's lightest neighbors,
+        and a vertex is only looked at again after a move changed one of its tour edges.
+        Returns (every tour edge exists, weight, tour starting at 0).
+    """
+    missing = n * max(max(row.values(), default=0) for row in weights) + 1
+
+    def d(a: int, b: int) -> int:
+        return weights[a].get(b, missing)
+
+    near = [sorted(row, key=row.get)[:_LOCAL_SEARCH_NEIGHBORS] for row in weights]
+
+    # Nearest neighbor construction, jumping to any unvisited vertex when stuck
+    tour = [0]
+    unvisited = dict.fromkeys(range(1, n))
+    while unvisited:
+        current = tour[-1]
+        step = next((u for u in near[current] if u in unvisited), None)
+        if step is None:
+            step = min((u for u in weights[current] if u in unvisited), key=weights[current].get, default=None)
+        if step is None:
+            step = next(iter(unvisited))
+        del unvisited[step]
+        tour.append(step)
+    position = array("i", [0]) * n
+    for index, v in enumerate(tour):
+        position[v] = index
+
+    def succ(v: int) -> int:
+        return tour[position[v] + 1 - n]
+
+    def pred(v: int) -> int:
+        return tour[position[v] - 1]
+
+    def reverse(a: int, b: int):
+        # Reverses the tour from position a forward to position b, or the rest of the cycle if shorter
+        length = (b - a) % n + 1
+        if 2 * length > n:
+            a, b, length = (b + 1) % n, (a - 1) % n, n - length
+        for offset in range(length // 2):
+            i, j = (a + offset) % n, (b - offset) % n
+            tour[i], tour[j] = tour[j], tour[i]
+            position[tour[i]] = i
+            position[tour[j]] = j
+
+    def two_opt(t1: int) -> Optional[Tuple[int, ...]]:
+        for forward in (True, False):
+            t2 = succ(t1) if forward else pred(t1)
+            removed = d(t1, t2)
+            for t3 in near[t1]:
+                gain = removed - d(t1, t3)
+                if gain <= 0:
+                    break
+                t4 = succ(t3) if forward else pred(t3)
+                if t3 == t2 or t4 == t1:
+                    continue
+                if gain + d(t3, t4) - d(t2, t4) > 0:
+                    if forward:
+                        reverse(position[t2], position[t3])
+                    else:
+                        reverse(position[t3], position[t2])
+                    return t1, t2, t3, t4
+        return None
+
+    def or_opt(t1: int) -> Optional[Tuple[int, ...]]:
+        # Moves the segment of 1 to 3 vertices starting at t1 between two other neighbors
+        segment = [t1]
+        for _ in range(_OR_OPT_MAX_SEGMENT):
+            first, last = segment[0], segment[-1]
+            before, after = pred(first), succ(last)
+            if after == before or len(segment) >= n - 2:
+                return None
+            removed = d(before, first) + d(last, after) - d(before, after)
+            for end, other in ((first, last), (last, first)):
+                for c in near[end]:
+                    if c in segment:
+                        continue
+                    c_next = succ(c)
+                    if c_next in segment:
+                        continue
+                    # Insert between c and its successor with end next to c
+                    if removed - (d(c, end) + d(other, c_next) - d(c, c_next)) > 0:
+                        rest = [v for v in tour[position[last] + 1:] + tour[:position[last] + 1] if v not in segment]
+                        inserted = segment if end == first else segment[::-1]
+                        at = rest.index(c) + 1
+                        tour[:] = rest[:at] + inserted + rest[at:]
+                        for index, v in enumerate(tour):
+                            position[v] = index
+                        return tuple(segment) + (before, after, c, c_next)
+            segment.append(succ(last))
+        return None
+
+    queue = deque(range(n))
+    queued = bytearray([1]) * n
+    check_interval = budget.check_interval
+    nodes = 0
+    try:
+        while queue:
+            nodes += 1
+            if nodes == check_interval:
+                budget.charge(nodes)
+                nodes = 0
+            t1 = queue.popleft()
+            queued[t1] = 0
+            touched = two_opt(t1) or or_opt(t1)
+            if touched:
+                for v in touched:
+                    if not queued[v]:
+                        queued[v] = 1
+                        queue.append(v)
+    finally:
+        if budget.stats is not None:
+            budget.record(nodes)
+
+    start = position[0]
+    tour[:] = tour[start:] + tour[:start]
+    total = sum(d(u, v) for u, v in zip(tour, tour[1:] + tour[:1]))
+    return total < missing, total, tour
+
+
+class HamiltonianSolver(HamiltonianAbstractClass):
+    """
+        NOTE: The output of the CSV file should be same as EXAMPLE OUTPUT above otherwise you will loose marks
+        For this you dont need to save anything just make sure to return exact related output.
+
+        For ease look at the Abstract Solver class and basically we are having the run method which does the saving
+        of the CSV file just focus on the logic
+    """
+
+    def hamiltonian_backtracking(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        """
+            Generates a backtracking solution that grows a path from vertex 0 one vertex at a time
+
+            A partial path is abandoned as soon as it can no longer be closed into a Hamiltonian cycle:
+            when an unvisited vertex is left with fewer than two usable neighbors, or the unvisited
+            vertices fall apart into pieces the path can't all reach. The next vertex tried is the
+            one with the fewest unvisited neighbors, since it is the hardest one to fit in later.
+            The search runs on an explicit stack and returns the first cycle it finds.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v, weight) edges
+
+            Return
+            Tuple[
+                bool: True if the graph has a Hamiltonian cycle or False if it doesn't,
+                List[int]: the vertices in cycle order starting at 0, empty when there is no cycle
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> hamiltonian_backtracking(4, [(0, 1, 1), (1, 2, 1), (2, 3, 1), (3, 0, 1)])
+            (True, [0, 1, 2, 3])
+            >>> hamiltonian_backtracking(4, [(0, 1, 1), (1, 2, 1), (2, 3, 1)])
+            (False, [])
+        """
+        n, adjacency, weights = _weighted_graph(n_vertices, edges)
+        decided = _trivially_decided(n, adjacency)
+        if decided is not None:
+            return decided
+        found = _cycle_search(n, adjacency, weights, self.budget)
+        if found is None:
+            return False, []
+        return True, found[1]
+
+    def hamiltonian_bruteforce(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        """
+            Generates an exact solution with the Held-Karp dynamic program
+
+            Instead of trying all (n - 1)! orders of the vertices, the lightest path from vertex 0 through
+            every subset of the vertices is computed once for each possible last vertex, so the work is
+            2^n * n^2. The lightest of those paths over all the vertices that closes back to 0 is the
+            lightest Hamiltonian cycle, which makes this exact but only practical up to about 20 vertices.
+            The tables grow as 2^n * n, so graphs with more than 18 vertices are solved exactly with the
+            branch-and-bound search of hamiltonian_bestcase instead, which is limited by the run budget
+            rather than by memory.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v, weight) edges
+
+            Return
+            Tuple[
+                bool: True if the graph has a Hamiltonian cycle or False if it doesn't,
+                List[int]: the vertices of the lightest cycle in order starting at 0, empty when there is none
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> hamiltonian_bruteforce(4, [(0, 1, 3), (1, 2, 1), (2, 3, 2), (3, 0, 5), (0, 2, 1)])
+            (True, [0, 3, 2, 1])
+        """
+        n, adjacency, weights = _weighted_graph(n_vertices, edges)
+        decided = _trivially_decided(n, adjacency)
+        if decided is not None:
+            return decided
+        if n <= _HELD_KARP_MAX_VERTICES:
+            found = _held_karp(n, adjacency, weights, self.budget)
+        else:
+            found = _cycle_search(n, adjacency, weights, self.budget, optimize=True)
+        if found is None:
+            return False, []
+        return True, found[1]
+
+    def hamiltonian_simple(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        """
+            Generates a quick heuristic tour with nearest neighbor construction and 2-opt / Or-opt moves
+
+            The tour starts at vertex 0 and always moves on to the lightest unvisited neighbor. It is then
+            improved with 2-opt moves (reversing a stretch of the tour) and Or-opt moves (moving a run of
+            up to 3 vertices elsewhere), only trying each vertex's 10 lightest neighbors, until no move
+            helps. This scales to large graphs but it can't prove that there is no Hamiltonian cycle:
+            if the final tour still needs an edge the graph doesn't have, the instance is written as TIMEOUT.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v, weight) edges
+
+            Return
+            Tuple[
+                bool: True if a Hamiltonian cycle was found, False only when none can exist,
+                List[int]: the vertices in cycle order starting at 0, empty otherwise
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> hamiltonian_simple(4, [(0, 1, 3), (1, 2, 1), (2, 3, 2), (3, 0, 5), (0, 2, 1)])
+            (True, [0, 1, 2, 3])
+        """
+        n, adjacency, weights = _weighted_graph(n_vertices, edges)
+        decided = _trivially_decided(n, adjacency)
+        if decided is not None:
+            return decided
+        complete, _, tour = _local_search(n, weights, self.budget)
+        if not complete:
+            # Local search cannot prove there is no cycle, a tour it can't close is reported like a timeout
+            raise SearchTimeout("local search did not find a Hamiltonian cycle")
+        return True, tour
+
+    def hamiltonian_bestcase(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        """
+            Generates a best case solution: the lightest Hamiltonian cycle (an optimal traveling salesman tour)
+
+            Graphs with up to 18 vertices are solved with the Held-Karp dynamic program. Larger ones start
+            from the local search tour of hamiltonian_simple as the incumbent and run the backtracking
+            search as a branch-and-bound: a path is cut when its weight plus a lower bound on the rest of the
+            cycle, from the lightest edges at the vertices it still has to visit, can't beat the incumbent. When the run budget is used up the
+            instance is written as TIMEOUT together with the best tour found so far.
+
+            Params
+            - n_vertices: number of vertices, numbered 0..n_vertices - 1
+            - edges: list of (u, v, weight) edges
+
+            Return
+            Tuple[
+                bool: True if the graph has a Hamiltonian cycle or False if it doesn't,
+                List[int]: the vertices of the lightest cycle in order starting at 0, empty when there is none
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> hamiltonian_bestcase(4, [(0, 1, 3), (1, 2, 1), (2, 3, 2), (3, 0, 5), (0, 2, 1)])
+            (True, [0, 3, 2, 1])
+        """
+        n, adjacency, weights = _weighted_graph(n_vertices, edges)
+        decided = _trivially_decided(n, adjacency)
+        if decided is not None:
+            return decided
+        if n <= _HELD_KARP_MAX_VERTICES:
+            found = _held_karp(n, adjacency, weights, self.budget)
+        else:
+            complete, total, tour = _local_search(n, weights, self.budget)
+            incumbent = (total, tour) if complete else None
+            found = _cycle_search(n, adjacency, weights, self.budget, optimize=True, incumbent=incumbent)
+        if found is None:
+            return False, []
+        return True, found[1]
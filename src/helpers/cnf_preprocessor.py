@@ -0,0 +1,228 @@
+"""
+CNF preprocessing applied to an instance before it reaches a SAT solver method.
+
+The formula is simplified with unit propagation, pure literal elimination, subsumption,
+self-subsuming resolution (strengthening) and bounded variable elimination, repeated until
+nothing changes. The variables that are left are renumbered 1..n so the exponential
+searches only see the variables that still matter.
+
+Every step that removes a variable pushes (witness literal, clause) pairs onto a
+reconstruction stack. A solution of the reduced formula is turned back into a solution of
+the original one by walking the stack backwards and making the witness true whenever its
+clause is not satisfied yet.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import defaultdict
+
+# Variables are only eliminated when every resolvent is at most this long
+_MAX_RESOLVENT_LENGTH = 16
+# Variables with more positive x negative occurrences than this are never tried for elimination
+_MAX_RESOLUTION_PAIRS = 400
+# Upper bound on the simplification rounds
+_MAX_ROUNDS = 10
+
+
+class PreprocessedFormula:
+    """
+    Reduced formula over variables 1..n_vars plus what is needed to map its solutions back.
+    When unsat is True preprocessing already derived the empty clause and clauses is empty.
+    """
+
+    def __init__(self, n_vars: int, clauses: List[List[int]], unsat: bool,
+                 original_n_vars: int, variables: List[int], stack: List[Tuple[int, List[int]]]):
+        self.n_vars = n_vars
+        self.clauses = clauses
+        self.unsat = unsat
+        self.original_n_vars = original_n_vars
+        # variables[i - 1] is the original number of reduced variable i
+        self.variables = variables
+        self.stack = stack
+
+    def reconstruct(self, assignment: Dict[int, bool]) -> Dict[int, bool]:
+        """
+        Turns a satisfying assignment of the reduced formula into one of the original formula.
+        """
+        values = {v: False for v in range(1, self.original_n_vars + 1)}
+        for new, old in enumerate(self.variables, 1):
+            values[old] = assignment.get(new, False)
+        for witness, clause in reversed(self.stack):
+            if not any(values[abs(x)] == (x > 0) for x in clause):
+                values[abs(witness)] = witness > 0
+        return values
+
+
+class _Simplifier:
+    """
+    Clauses are sets of literals indexed by position, removed clauses become None.
+    occurs[lit] holds the positions of the live clauses containing lit.
+    """
+
+    def __init__(self, clauses: Iterable[List[int]]):
+        self.clauses: List[Optional[Set[int]]] = []
+        self.occurs = defaultdict(set)
+        self.units: List[int] = []
+        self.stack: List[Tuple[int, List[int]]] = []
+        self.unsat = False
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def add_clause(self, literals: Iterable[int]):
+        clause = set(literals)
+        if any(-x in clause for x in clause):
+            return
+        if not clause:
+            self.unsat = True
+            return
+        c = len(self.clauses)
+        self.clauses.append(clause)
+        for x in clause:
+            self.occurs[x].add(c)
+        if len(clause) == 1:
+            self.units.append(c)
+
+    def remove_clause(self, c: int):
+        for x in self.clauses[c]:
+            self.occurs[x].discard(c)
+        self.clauses[c] = None
+
+    def remove_literal(self, c: int, x: int):
+        clause = self.clauses[c]
+        clause.discard(x)
+        self.occurs[x].discard(c)
+        if not clause:
+            self.unsat = True
+        elif len(clause) == 1:
+            self.units.append(c)
+
+    def assign(self, x: int):
+        """
+        Makes x true for good: its clauses are satisfied and -x is dropped from the rest.
+        """
+        self.stack.append((x, [x]))
+        for c in list(self.occurs[x]):
+            self.remove_clause(c)
+        for c in list(self.occurs[-x]):
+            self.remove_literal(c, -x)
+
+    def propagate(self) -> bool:
+        """
+        Unit propagation, returns False once the empty clause is derived.
+        """
+        while self.units and not self.unsat:
+            clause = self.clauses[self.units.pop()]
+            if clause is not None and len(clause) == 1:
+                self.assign(next(iter(clause)))
+        return not self.unsat
+
+    def pure_literals(self) -> bool:
+        changed = False
+        for x in [x for x, clauses in self.occurs.items() if clauses]:
+            if self.occurs[x] and not self.occurs[-x]:
+                self.assign(x)
+                changed = True
+        return changed
+
+    def subsume(self) -> bool:
+        """
+        Removes every clause that contains another clause, and strengthens D to D - {-x}
+        whenever some clause C with x in C has C - {x} inside D (self-subsuming resolution).
+        """
+        changed = False
+        clauses = self.clauses
+        occurs = self.occurs
+        order = sorted((c for c, clause in enumerate(clauses) if clause is not None), key=lambda c: len(clauses[c]))
+        for c in order:
+            clause = clauses[c]
+            if clause is None:
+                continue
+            # Every clause C is in has the least frequent literal of C too
+            rarest = min(clause, key=lambda x: len(occurs[x]))
+            for d in list(occurs[rarest]):
+                if d != c and len(clauses[d]) >= len(clause) and clause <= clauses[d]:
+                    self.remove_clause(d)
+                    changed = True
+            for x in list(clause):
+                for d in list(occurs[-x]):
+                    other = clauses[d]
+                    if d != c and len(other) >= len(clause) and all(y in other for y in clause if y != x):
+                        self.remove_literal(d, -x)
+                        changed = True
+                        if self.unsat:
+                            return True
+        return changed
+
+    def eliminate(self, x: int) -> bool:
+        """
+        Replaces the clauses of variable x by all their resolvents on x, if that does not
+        add clauses or produce long ones.
+        """
+        clauses = self.clauses
+        positive = list(self.occurs[x])
+        negative = list(self.occurs[-x])
+        if not positive or not negative or len(positive) * len(negative) > _MAX_RESOLUTION_PAIRS:
+            return False
+        resolvents = []
+        for p in positive:
+            for n in negative:
+                resolvent = (clauses[p] | clauses[n]) - {x, -x}
+                if any(-y in resolvent for y in resolvent):
+                    continue
+                if len(resolvent) > _MAX_RESOLVENT_LENGTH:
+                    return False
+                resolvents.append(resolvent)
+                if len(resolvents) > len(positive) + len(negative):
+                    return False
+
+        for c in negative:
+            self.stack.append((-x, sorted(clauses[c], key=abs)))
+            self.remove_clause(c)
+        for c in positive:
+            self.stack.append((x, sorted(clauses[c], key=abs)))
+            self.remove_clause(c)
+        for resolvent in resolvents:
+            self.add_clause(resolvent)
+        return True
+
+    def eliminate_variables(self) -> bool:
+        changed = False
+        occurs = self.occurs
+        variables = {abs(x) for x, clauses in occurs.items() if clauses}
+        for v in sorted(variables, key=lambda v: len(occurs[v]) + len(occurs[-v])):
+            if self.eliminate(v):
+                changed = True
+                if self.unsat:
+                    break
+        return changed
+
+    def run(self):
+        if not self.propagate():
+            return
+        for _ in range(_MAX_ROUNDS):
+            changed = self.pure_literals()
+            changed = self.subsume() or changed
+            if not self.propagate():
+                return
+            changed = self.eliminate_variables() or changed
+            if not self.propagate():
+                return
+            if not changed:
+                return
+
+
+def preprocess(n_vars: int, clauses: Iterable[List[int]]) -> PreprocessedFormula:
+    """
+    Simplifies a CNF formula and returns the reduced formula with its variables renumbered.
+    """
+    clauses = [list(clause) for clause in clauses]
+    original_n_vars = max([n_vars] + [abs(x) for clause in clauses for x in clause])
+    simplifier = _Simplifier(clauses)
+    simplifier.run()
+    if simplifier.unsat:
+        return PreprocessedFormula(0, [], True, original_n_vars, [], simplifier.stack)
+
+    remaining = [clause for clause in simplifier.clauses if clause is not None]
+    variables = sorted({abs(x) for clause in remaining for x in clause})
+    number = {old: new for new, old in enumerate(variables, 1)}
+    reduced = [sorted((number[x] if x > 0 else -number[-x] for x in clause), key=abs) for clause in remaining]
+    return PreprocessedFormula(len(variables), reduced, False, original_n_vars, variables, simplifier.stack)
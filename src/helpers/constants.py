@@ -7,6 +7,7 @@ CONFIGURATION_FILE_PATH = os.path.join(CONFIG_FOLDER_PATH, "student_config.json"
 RESULTS_FOLDER = os.path.join(BASE_PATH, "results")
 INPUT_FOLDER = os.path.join(BASE_PATH, 'input')
 TEST_FOLDER = os.path.join(BASE_PATH, 'tests')
+CACHE_FOLDER = os.path.join(BASE_PATH, '.instance_cache')
 input_file = "data_knapsack_binpacking_file_garcias.cnf"
 test_file = "check_knapsack_binpacking_tests.cnf"
 test_bestcase_file = "check_bestcase_knapsack_binpacking_tests.cnf"
@@ -14,6 +15,25 @@ INPUT_FILE = os.path.join(INPUT_FOLDER, input_file)
 TEST_FILE = os.path.join(TEST_FOLDER, test_file)
 TEST_BESTCASE_FILE = os.path.join(TEST_FOLDER, test_bestcase_file)
 
+# Defaults for the optional "Run Options" section of the configuration file
+DEFAULT_RUN_OPTIONS = {
+    "workers": 1,
+    "time_limit_seconds": None,
+    "node_limit": None,
+    "streaming": False,
+    "parser": "text",
+    "cache": False,
+    "max_flips": 1000000,
+    "seed": 0,
+    "report_incumbents": False,
+    "preprocess": False,
+    "tabu_iterations": 10000,
+    "plot": True,
+    "resume": False,
+    "parquet": False,
+    "stats": False,
+}
+
 def parse_config(config_path):
     if not os.path.exists(config_path):
         raise Exception("Please make sure the configuration file exists!!!")
@@ -24,3 +44,17 @@ def parse_config(config_path):
     sub_problem = data["Sub Problem"]
     return selection, sub_problem
 
+def parse_run_options(config_path, overrides = None):
+    """
+    Returns the run options from the configuration file merged over the defaults,
+    with any non-None overrides (e.g. from command line flags) applied last.
+    """
+    options = dict(DEFAULT_RUN_OPTIONS)
+    if os.path.exists(config_path):
+        with open(config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
+            data = json.load(conf_buffer)
+        options.update(data.get("Run Options", {}))
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            options[key] = value
+    return options
@@ -1,127 +1,202 @@
 import os
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from collections import defaultdict
 
-def parse_multi_instance_dimacs(path: str) -> Tuple[str, int, List[List[int]]]:
+
+def _stripped_lines(path: str) -> Iterator[str]:
     """
-    Parses a DIMACS-like file containing multiple CNF instances.
-    Returns a list of (instance_id, n_vars, clauses) tuples.
+    Yields the non-empty lines of a file one at a time, stripped, without reading the whole file.
+    """
+    with open(path) as f:
+        for ln in f:
+            ln = ln.strip()
+            if ln:
+                yield ln
+
+
+def iter_multi_instance_dimacs(path: str) -> Iterator[Tuple[str, int, List[List[int]]]]:
+    """
+    Streams a DIMACS-like file containing multiple CNF instances.
+    Yields one (instance_id, n_vars, clauses) tuple at a time.
     """
 
     if not os.path.exists(path = path):
         raise Exception(f"File path: {path} does not exists!!")
 
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    lines = _stripped_lines(path)
+    n_instances = 0
+    line = next(lines, None)
+    while line is not None:
         if line.startswith("c "):
             # Example: c 3 2 ?
             parts = line.split()
-            instance_id = parts[1] if len(parts) > 1 else str(len(instances) + 1)
-            i += 1
-            if i >= len(lines):
+            instance_id = parts[1] if len(parts) > 1 else str(n_instances + 1)
+            line = next(lines, None)
+            if line is None:
                 break
             # Expect next line: p cnf n_vars n_clauses
-            if not lines[i].startswith("p cnf"):
-                raise ValueError(f"Expected 'p cnf' after {line}")
-            _, _, n_vars_str, n_clauses_str = lines[i].split()
+            if not line.startswith("p cnf"):
+                raise ValueError(f"Expected 'p cnf' after {' '.join(parts)}")
+            _, _, n_vars_str, n_clauses_str = line.split()
             n_vars = int(n_vars_str)
             n_clauses = int(n_clauses_str)
-            i += 1
+            line = next(lines, None)
             clauses = []
             # Read next n_clauses lines (allow commas)
             for _ in range(n_clauses):
-                if i >= len(lines) or lines[i].startswith("c "):
+                if line is None or line.startswith("c "):
                     break
-                clause = [int(x) for x in lines[i].replace(",", " ").split() if x != "0"]
+                clause = [int(x) for x in line.replace(",", " ").split() if x != "0"]
                 if clause:
                     clauses.append(clause)
-                i += 1
-            instances.append((instance_id, n_vars, clauses))
+                line = next(lines, None)
+            n_instances += 1
+            yield (instance_id, n_vars, clauses)
         else:
-            i += 1
-    return instances
+            line = next(lines, None)
 
 
-def parse_multi_instance_graph(path: str):
+def parse_multi_instance_dimacs(path: str) -> List[Tuple[str, int, List[List[int]]]]:
     """
-    Parse file into list of (instance_id, k, n_vertices, edges)
-    Each instance starts with `c` and `p edge` lines.
+    Parses a DIMACS-like file containing multiple CNF instances.
+    Returns a list of (instance_id, n_vars, clauses) tuples.
     """
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
+    return list(iter_multi_instance_dimacs(path))
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+
+def iter_multi_instance_graph(path: str):
+    """
+    Streams a file of graph instances, yielding one (instance_id, k, n_vertices, edges) at a time.
+    Each instance starts with `c` and `p edge` lines.
+    """
+    lines = _stripped_lines(path)
+    n_instances = 0
+    line = next(lines, None)
+    while line is not None:
         if line.startswith("c "):
             parts = line.split()
-            instance_id = parts[1] if len(parts) > 1 else str(len(instances) + 1)
+            instance_id = parts[1] if len(parts) > 1 else str(n_instances + 1)
             k = int(parts[2]) if len(parts) > 2 else 3
-            i += 1
-            if i >= len(lines) or not lines[i].startswith("p cnf"):
-                raise ValueError(f"Expected 'p cnf' after line: {line}")
-            _, _, n_vertices_str, n_edges_str = lines[i].split()
+            header = line
+            line = next(lines, None)
+            if line is None or not line.startswith("p cnf"):
+                raise ValueError(f"Expected 'p cnf' after line: {header}")
+            _, _, n_vertices_str, n_edges_str = line.split()
             n_vertices = int(n_vertices_str)
             n_edges = int(n_edges_str)
-            i += 1
+            line = next(lines, None)
             edges = []
             # Read next n_edges lines (edge pairs)
             for _ in range(n_edges):
-                if i >= len(lines) or lines[i].startswith("c "):
+                if line is None or line.startswith("c "):
                     break
-                parts = lines[i].replace(",", " ").split()
+                parts = line.replace(",", " ").split()
                 if len(parts) >= 2:
                     u, v = int(parts[0]), int(parts[1])
                     edges.append((u - 1, v - 1))  # use 0-based indexing
-                i += 1
-            instances.append((instance_id, k, n_vertices, edges))
+                line = next(lines, None)
+            n_instances += 1
+            yield (instance_id, k, n_vertices, edges)
         else:
-            i += 1
+            line = next(lines, None)
 
-    return instances
 
-def parse_multi_instance_knapsack(path: str):
+def parse_multi_instance_graph(path: str):
     """
-    Parse file into list of (instance_id, target, n_coins, solvable)
-    Each instance starts with `c` and `p knap` lines.
+    Parse file into list of (instance_id, k, n_vertices, edges)
+    Each instance starts with `c` and `p edge` lines.
     """
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
+    return list(iter_multi_instance_graph(path))
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+
+def iter_multi_instance_knapsack(path: str):
+    """
+    Streams a file of knapsack instances, yielding one (instance_id, target, coins, solvable) at a time.
+    Each instance starts with `c` and `p knap` lines.
+    """
+    lines = _stripped_lines(path)
+    line = next(lines, None)
+    while line is not None:
         if line.startswith("c "):
             parts = line.split()
             instance_id = parts[1]
             target = int(parts[2])
             solvable = 1 if "S" in parts[3] else 0
             solvable = -1 if "N" in parts[3] else 0
-            i += 1
-            if i >= len(lines) or not lines[i].startswith("p knap"):
-                raise ValueError(f"Expected 'p knap' after line: {line}")
-            _, _, unique_coins_str= lines[i].split()
+            header = line
+            line = next(lines, None)
+            if line is None or not line.startswith("p knap"):
+                raise ValueError(f"Expected 'p knap' after line: {header}")
+            _, _, unique_coins_str= line.split()
             unique_coins = int(unique_coins_str)
-            i += 1
+            line = next(lines, None)
             coins = defaultdict(int)
             # Read next n_coins lines
             for _ in range(unique_coins):
-                if i >= len(lines) or lines[i].startswith("c "):
+                if line is None or line.startswith("c "):
                     break
-                parts = lines[i].replace(",", " ").split()
+                parts = line.replace(",", " ").split()
                 if len(parts) >= 2:
                     coin = int(parts[0])
                     coins[coin] = int(parts[1])
-                i += 1
-            instances.append((instance_id, target, coins, solvable))
+                line = next(lines, None)
+            yield (instance_id, target, coins, solvable)
+        else:
+            line = next(lines, None)
+
+
+def parse_multi_instance_knapsack(path: str):
+    """
+    Parse file into list of (instance_id, target, n_coins, solvable)
+    Each instance starts with `c` and `p knap` lines.
+    """
+    return list(iter_multi_instance_knapsack(path))
+
+
+def iter_multi_instance_hamiltonian(path: str):
+    """
+    Streams a file of weighted graph instances, yielding one (instance_id, n_vertices, edges) at a time.
+    Each instance starts with `c` and `p edge` lines, every edge line is `u,v` or `u,v,weight`
+    (weight 1 when left out), and the edges come back as 0-based (u, v, weight) tuples.
+    """
+    if not os.path.exists(path = path):
+        raise Exception(f"File path: {path} does not exists!!")
+
+    lines = _stripped_lines(path)
+    n_instances = 0
+    line = next(lines, None)
+    while line is not None:
+        if line.startswith("c "):
+            parts = line.split()
+            instance_id = parts[1] if len(parts) > 1 else str(n_instances + 1)
+            header = line
+            line = next(lines, None)
+            # Same problem line as DIMACS graphs, `p cnf` is accepted like in the coloring files
+            if line is None or not (line.startswith("p edge") or line.startswith("p cnf")):
+                raise ValueError(f"Expected 'p edge' after line: {header}")
+            _, _, n_vertices_str, n_edges_str = line.split()
+            n_vertices = int(n_vertices_str)
+            n_edges = int(n_edges_str)
+            line = next(lines, None)
+            edges = []
+            # Read next n_edges lines (edge pairs with an optional weight)
+            for _ in range(n_edges):
+                if line is None or line.startswith("c "):
+                    break
+                parts = line.replace(",", " ").split()
+                if len(parts) >= 2:
+                    weight = int(parts[2]) if len(parts) > 2 else 1
+                    edges.append((int(parts[0]) - 1, int(parts[1]) - 1, weight))  # use 0-based indexing
+                line = next(lines, None)
+            n_instances += 1
+            yield (instance_id, n_vertices, edges)
         else:
-            i += 1
+            line = next(lines, None)
+
 
-    return instances
\ No newline at end of file
+def parse_multi_instance_hamiltonian(path: str):
+    """
+    Parse file into list of (instance_id, n_vertices, edges)
+    Each instance starts with `c` and `p edge` lines.
+    """
+    return list(iter_multi_instance_hamiltonian(path))
@@ -0,0 +1,261 @@
+"""
+Fast parse path for the multi-instance DIMACS-like files.
+
+The text parsers in dmaics_parser.py go line by line and build a Python list per clause.
+Here the file is memory-mapped and the instance headers are located with one regex scan over
+the mapping. Each instance is then handled as one block of bytes: it is copied out of the
+mapping, its blank lines are removed with a regex and it is split into lines. The body lines
+are joined back, the 0 tokens of clause lines are removed with a regex, commas and line ends
+are replaced (three more copies of the body), and the whole body goes through one map(int, ...) call
+instead of a Python loop per line. Clause literals and edge endpoints end up in flat
+array('q') buffers shared by the whole file, with an offset table marking where each clause
+starts. Every instance only keeps a small view into those buffers.
+
+The accepted grammar is the same as the text parsers: `c` lines start an instance, the
+next line must be the `p cnf` / `p knap` header, and the following n lines are the body.
+Every body line is one clause and its 0 tokens are dropped wherever they are, like the text
+parser does. Two inputs the text parsers take are rejected with a ValueError instead:
+zeros written another way (`-0`, `00`), which the text parser keeps as a literal 0, and
+integers that don't fit in 64 bits.
+"""
+
+import mmap
+import os
+import re
+from array import array
+from collections import defaultdict
+from collections.abc import Sequence
+from itertools import compress, count
+from operator import not_, sub
+from typing import List, Tuple
+
+# Start of every instance: a line whose first token is `c`
+_INSTANCE_START = re.compile(rb"^[ \t]*c ", re.M)
+# Blank lines, removed before splitting so the body can be sliced by line count
+_BLANK_LINES = re.compile(rb"\n[ \t\r]*(?=\n)")
+# A 0 token anywhere in a line, the text parser drops these
+_ZERO_TOKENS = re.compile(rb"(?<![^ \t\r\n,])0(?![^ \t\r\n,])")
+
+
+class ClauseView(Sequence):
+    """
+    Read-only list of clauses [start, stop) stored in a flat literal buffer.
+    Clause i is literals[offsets[i]:offsets[i + 1]], indexing returns it as a list of ints.
+    """
+
+    __slots__ = ("literals", "offsets", "start", "stop")
+
+    def __init__(self, literals, offsets, start: int, stop: int):
+        self.literals = literals
+        self.offsets = offsets
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("clause index out of range")
+        clause = self.start + index
+        return list(self.literals[self.offsets[clause]:self.offsets[clause + 1]])
+
+    def __iter__(self):
+        literals = self.literals
+        offsets = self.offsets
+        for clause in range(self.start, self.stop):
+            yield list(literals[offsets[clause]:offsets[clause + 1]])
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # Only ship this instance's slice of the shared buffers to other processes
+        first = self.offsets[self.start]
+        literals = array("q", self.literals[first:self.offsets[self.stop]])
+        offsets = array("q", (offset - first for offset in self.offsets[self.start:self.stop + 1]))
+        return (ClauseView, (literals, offsets, 0, len(self)))
+
+
+class EdgeView(Sequence):
+    """
+    Read-only list of (u, v) edges [start, stop) stored as consecutive endpoints in a flat buffer.
+    """
+
+    __slots__ = ("endpoints", "start", "stop")
+
+    def __init__(self, endpoints, start: int, stop: int):
+        self.endpoints = endpoints
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("edge index out of range")
+        edge = 2 * (self.start + index)
+        return (self.endpoints[edge], self.endpoints[edge + 1])
+
+    def __iter__(self):
+        endpoints = self.endpoints
+        for edge in range(2 * self.start, 2 * self.stop, 2):
+            yield (endpoints[edge], endpoints[edge + 1])
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return (EdgeView, (array("q", self.endpoints[2 * self.start:2 * self.stop]), 0, len(self)))
+
+
+def _instance_blocks(path: str):
+    """
+    Yields (header_parts, problem_line, body_lines) for every instance of the file.
+    body_lines are the raw non-empty lines after the problem line, up to the next instance.
+    """
+    if not os.path.exists(path):
+        raise Exception(f"File path: {path} does not exists!!")
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        starts = [match.start() for match in _INSTANCE_START.finditer(buffer)]
+        starts.append(len(buffer))
+        for begin, end in zip(starts, starts[1:]):
+            lines = _BLANK_LINES.sub(b"", buffer[begin:end]).split(b"\n")
+            if not lines[-1].strip():
+                lines.pop()
+            header = lines[0].split()
+            problem = lines[1].strip() if len(lines) > 1 else None
+            yield header, problem, lines[2:]
+
+
+def _int_array(values) -> array:
+    try:
+        return array("q", values)
+    except OverflowError:
+        raise ValueError("Integer out of the 64 bit range, use the text parser for this file") from None
+
+
+def _to_ints(lines: List[bytes], drop_zeros: bool = False) -> array:
+    """
+    Converts lines of comma or space separated integers with one map(int) call, every line end becomes a 0.
+    With drop_zeros the 0 tokens of the lines are removed first, so the zeros are exactly the line ends.
+    """
+    if not lines:
+        return array("q")
+    body = b"\n".join(lines) + b"\n"
+    if drop_zeros:
+        body = _ZERO_TOKENS.sub(b" ", body)
+    body = body.replace(b",", b" ").replace(b"\n", b" 0 ")
+    values = _int_array(map(int, body.split()))
+    if drop_zeros and values.count(0) != len(lines):
+        raise ValueError("Zero literal written as -0 or 00, use the text parser for this file")
+    return values
+
+
+def fast_parse_multi_instance_dimacs(path: str) -> List[Tuple[str, int, ClauseView]]:
+    """
+    Same result as parse_multi_instance_dimacs, every clause list is a ClauseView
+    into one literal buffer for the whole file.
+    """
+    literals = array("q")
+    offsets = array("q", [0])
+    instances = []
+    for header, problem, body in _instance_blocks(path):
+        instance_id = header[1].decode() if len(header) > 1 else str(len(instances) + 1)
+        if problem is None:
+            break
+        if not problem.startswith(b"p cnf"):
+            raise ValueError(f"Expected 'p cnf' after {b' '.join(header).decode()}")
+        _, _, n_vars, n_clauses = problem.split()
+        first_clause = len(offsets) - 1
+
+        # Every 0 ends a line: the literals are the non-zero values, and the clause ends are the
+        # positions of the zeros minus the zeros before them. Repeated ends are empty lines,
+        # which are dropped like the text parser does. All of it runs in C level iterators.
+        values = _to_ints(body[:int(n_clauses)], drop_zeros=True)
+        base = len(literals)
+        ends = dict.fromkeys(map(sub, compress(count(base), map(not_, values)), count()))
+        ends.pop(base, None)
+        literals.extend(filter(None, values))
+        offsets.extend(ends)
+
+        instances.append((instance_id, int(n_vars), ClauseView(literals, offsets, first_clause, len(offsets) - 1)))
+    return instances
+
+
+def _pairs(lines: List[bytes]) -> array:
+    """
+    Returns the first two integers of every line as consecutive values of one flat buffer.
+    """
+    values = _to_ints(lines)
+    if len(values) == 3 * len(lines) and not any(values[2::3]):
+        # Every line holds exactly two numbers, drop the line-end zeros in one go
+        del values[2::3]
+        return values
+
+    # Irregular lines, take the first two numbers of each and skip lines with fewer
+    pairs = []
+    for line in lines:
+        parts = line.replace(b",", b" ").split()
+        if len(parts) >= 2:
+            pairs.append(int(parts[0]))
+            pairs.append(int(parts[1]))
+    return _int_array(pairs)
+
+
+def fast_parse_multi_instance_graph(path: str):
+    """
+    Same result as parse_multi_instance_graph, every edge list is an EdgeView
+    into one 0-based endpoint buffer for the whole file.
+    """
+    endpoints = array("q")
+    instances = []
+    for header, problem, body in _instance_blocks(path):
+        instance_id = header[1].decode() if len(header) > 1 else str(len(instances) + 1)
+        k = int(header[2]) if len(header) > 2 else 3
+        if problem is None or not problem.startswith(b"p cnf"):
+            raise ValueError(f"Expected 'p cnf' after line: {b' '.join(header).decode()}")
+        _, _, n_vertices, n_edges = problem.split()
+        first_edge = len(endpoints) // 2
+        # use 0-based indexing
+        endpoints.extend(vertex - 1 for vertex in _pairs(body[:int(n_edges)]))
+        instances.append((instance_id, k, int(n_vertices), EdgeView(endpoints, first_edge, len(endpoints) // 2)))
+    return instances
+
+
+def fast_parse_multi_instance_knapsack(path: str):
+    """
+    Same result as parse_multi_instance_knapsack.
+    """
+    instances = []
+    for header, problem, body in _instance_blocks(path):
+        instance_id = header[1].decode()
+        target = int(header[2])
+        solvable = -1 if b"N" in header[3] else 0
+        if problem is None or not problem.startswith(b"p knap"):
+            raise ValueError(f"Expected 'p knap' after line: {b' '.join(header).decode()}")
+        _, _, unique_coins = problem.split()
+        coins = defaultdict(int)
+        pairs = _pairs(body[:int(unique_coins)])
+        for index in range(0, len(pairs), 2):
+            coins[pairs[index]] = pairs[index + 1]
+        instances.append((instance_id, target, coins, solvable))
+    return instances
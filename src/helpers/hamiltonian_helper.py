@@ -0,0 +1,81 @@
+from abc import abstractmethod
+from src.helpers.dmaics_parser import parse_multi_instance_hamiltonian, iter_multi_instance_hamiltonian
+from typing import List, Tuple, Dict, Any, Optional, Iterable
+from src.helpers.project_selection_enum import SubProblemSelection
+from src.helpers.solver_runtime import SolverRuntime
+from src.helpers.search_budget import TIMEOUT
+
+
+def tour_weight(edges: Iterable[Tuple[int, int, int]], tour: List[int]) -> Optional[int]:
+    """
+    Total weight of the closed tour, None when two consecutive vertices share no edge.
+    Between two vertices the lightest of their edges counts.
+    """
+    weights = {}
+    for u, v, weight in edges:
+        key = (min(u, v), max(u, v))
+        weights[key] = min(weight, weights.get(key, weight))
+    if len(tour) < 2:
+        return 0 if tour else None
+    total = 0
+    for u, v in zip(tour, tour[1:] + tour[:1]):
+        key = (min(u, v), max(u, v))
+        if key not in weights:
+            return None
+        total += weights[key]
+    return total
+
+
+class HamiltonianAbstractClass(SolverRuntime):
+
+    result_file_name = "hamiltonian_results"
+    cache_kind = "hamiltonian"
+    column_kinds = {**SolverRuntime.column_kinds, "n_vertices": "int", "n_edges": "int",
+                    "hamiltonian": "answer", "tour": "int_list", "tour_weight": "int"}
+
+    def parse_input_text(self):
+        # Weighted edge lines vary in length, so there is no mmap tokenizer for them and
+        # the "parser" run option does not apply
+        return parse_multi_instance_hamiltonian(self.input_path)
+
+    def iter_input_file(self):
+        return iter_multi_instance_hamiltonian(self.input_path)
+
+    def result_header(self, sub_problem):
+        return ["instance_id", "n_vertices", "n_edges",
+                "method", "hamiltonian", "time_seconds", "tour", "tour_weight"]
+
+    @abstractmethod
+    def hamiltonian_backtracking(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        pass
+
+    @abstractmethod
+    def hamiltonian_bruteforce(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        pass
+
+    @abstractmethod
+    def hamiltonian_simple(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        pass
+
+    @abstractmethod
+    def hamiltonian_bestcase(self, n_vertices: int, edges: List[Tuple[int, int, int]]) -> Tuple[bool, List[int]]:
+        pass
+
+    # (sub problem, method label, solver method) in the order the results are written
+    methods = [
+        (SubProblemSelection.brute_force, "BruteForce", "hamiltonian_bruteforce"),
+        (SubProblemSelection.btracking, "BackTracking", "hamiltonian_backtracking"),
+        (SubProblemSelection.simple, "Simple", "hamiltonian_simple"),
+        (SubProblemSelection.best_case, "BestCase", "hamiltonian_bestcase"),
+    ]
+
+    def instance_args(self, instance) -> Tuple:
+        instance_id, n_vertices, edges = instance
+        return (n_vertices, edges)
+
+    def format_row(self, instance, label: str, bt_ok, bt_assign, bt_time: float) -> List[Any]:
+        instance_id, n_vertices, edges = instance
+        weight = tour_weight(edges, bt_assign) if bt_assign else None
+        return [instance_id, n_vertices, len(edges),
+                label, bt_ok if bt_ok == TIMEOUT else "YES" if bt_ok else "NO",
+                f"{bt_time:.6f}", str(bt_assign), "" if weight is None else weight]
@@ -0,0 +1,206 @@
+"""
+On-disk cache of parsed instance files.
+
+The first run on an input file parses it as usual and writes a compiled copy to CACHE_FOLDER.
+Later runs memory-map that copy instead of parsing the text again: clause literals, edge
+endpoints and coins are read straight out of the mapping as integer buffers and wrapped in
+the same ClauseView / EdgeView sequences the mmap parser produces.
+
+A cache file is named after the absolute input path and the parser that produced it (both
+give the same instances, but an input only the text parser accepts must not be served to a
+run that asked for the mmap parser, see fast_parser.py). It stores the input's mtime and size, if either changed the entry is stale and
+gets rebuilt automatically.
+
+File layout: MAGIC, an 8 byte little-endian header length, a JSON header with the source
+stats, per-instance metadata and the position of every buffer, then the raw buffers
+aligned to 8 bytes.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Tuple
+from src.helpers.constants import CACHE_FOLDER
+from src.helpers.fast_parser import ClauseView, EdgeView
+
+MAGIC = b"TOCINST1"
+_ALIGNMENT = 8
+
+
+def cache_path(path: str, kind: str, cache_folder: str = CACHE_FOLDER, parser: str = "text") -> str:
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(cache_folder, f"{os.path.basename(path)}.{kind}.{parser}.{digest}.bin")
+
+
+def _source_stats(path: str) -> Dict[str, int]:
+    stats = os.stat(path)
+    return {"mtime_ns": stats.st_mtime_ns, "size": stats.st_size}
+
+
+def _share_buffers(views: List[Any], view_type: type, attributes: Tuple[str, ...]) -> bool:
+    if not views or not all(isinstance(view, view_type) for view in views):
+        return False
+    return all(getattr(view, name) is getattr(views[0], name) for view in views for name in attributes)
+
+
+def _as_array(buffer, typecode: str) -> array:
+    return buffer if isinstance(buffer, array) else array(typecode, buffer)
+
+
+def _pack(kind: str, instances: List[Tuple]) -> Tuple[List[Any], Dict[str, array]]:
+    """
+    Flattens parsed instances into JSON-able metadata plus integer buffers.
+    """
+    meta = []
+    if kind == "dimacs" and _share_buffers([clauses for _, _, clauses in instances], ClauseView, ("literals", "offsets")):
+        # Straight from the mmap parser, the shared buffers can be written as they are
+        first = instances[0][2]
+        meta = [[instance_id, n_vars, clauses.start, clauses.stop] for instance_id, n_vars, clauses in instances]
+        return meta, {"literals": _as_array(first.literals, "q"), "offsets": _as_array(first.offsets, "q")}
+    if kind == "graph" and _share_buffers([edges for _, _, _, edges in instances], EdgeView, ("endpoints",)):
+        meta = [[instance_id, k, n_vertices, edges.start, edges.stop] for instance_id, k, n_vertices, edges in instances]
+        return meta, {"endpoints": _as_array(instances[0][3].endpoints, "q")}
+
+    if kind == "dimacs":
+        literals = array("q")
+        offsets = array("q", [0])
+        for instance_id, n_vars, clauses in instances:
+            first = len(offsets) - 1
+            for clause in clauses:
+                literals.extend(clause)
+                offsets.append(len(literals))
+            meta.append([instance_id, n_vars, first, len(offsets) - 1])
+        return meta, {"literals": literals, "offsets": offsets}
+    if kind == "graph":
+        endpoints = array("q")
+        for instance_id, k, n_vertices, edges in instances:
+            first = len(endpoints) // 2
+            for u, v in edges:
+                endpoints.append(u)
+                endpoints.append(v)
+            meta.append([instance_id, k, n_vertices, first, len(endpoints) // 2])
+        return meta, {"endpoints": endpoints}
+    if kind == "knapsack":
+        pairs = array("q")
+        for instance_id, target, coins, solvable in instances:
+            first = len(pairs) // 2
+            for coin, count in coins.items():
+                pairs.append(coin)
+                pairs.append(count)
+            meta.append([instance_id, target, solvable, first, len(pairs) // 2])
+        return meta, {"pairs": pairs}
+    if kind == "hamiltonian":
+        triples = array("q")
+        for instance_id, n_vertices, edges in instances:
+            first = len(triples) // 3
+            for edge in edges:
+                triples.extend(edge)
+            meta.append([instance_id, n_vertices, first, len(triples) // 3])
+        return meta, {"triples": triples}
+    raise ValueError(f"Unknown instance kind: {kind}")
+
+
+def _unpack(kind: str, meta: List[Any], buffers: Dict[str, Any]) -> List[Tuple]:
+    """
+    Rebuilds the instance tuples the parsers return, on top of the mapped buffers.
+    """
+    if kind == "dimacs":
+        literals, offsets = buffers["literals"], buffers["offsets"]
+        return [(instance_id, n_vars, ClauseView(literals, offsets, first, stop))
+                for instance_id, n_vars, first, stop in meta]
+    if kind == "graph":
+        endpoints = buffers["endpoints"]
+        return [(instance_id, k, n_vertices, EdgeView(endpoints, first, stop))
+                for instance_id, k, n_vertices, first, stop in meta]
+    if kind == "knapsack":
+        pairs = buffers["pairs"]
+        instances = []
+        for instance_id, target, solvable, first, stop in meta:
+            coins = defaultdict(int)
+            for index in range(2 * first, 2 * stop, 2):
+                coins[pairs[index]] = pairs[index + 1]
+            instances.append((instance_id, target, coins, solvable))
+        return instances
+    if kind == "hamiltonian":
+        triples = buffers["triples"]
+        return [(instance_id, n_vertices, [tuple(triples[index:index + 3]) for index in range(3 * first, 3 * stop, 3)])
+                for instance_id, n_vertices, first, stop in meta]
+    raise ValueError(f"Unknown instance kind: {kind}")
+
+
+def write_cache(path: str, kind: str, instances: List[Tuple], cache_folder: str = CACHE_FOLDER, parser: str = "text") -> str:
+    meta, buffers = _pack(kind, instances)
+    layout = {}
+    position = 0
+    for name, buffer in buffers.items():
+        layout[name] = [buffer.typecode, position, len(buffer)]
+        size = len(buffer) * buffer.itemsize
+        position += size + (-size % _ALIGNMENT)
+    header = json.dumps({"kind": kind, "parser": parser, "source": _source_stats(path),
+                         "instances": meta, "buffers": layout}).encode()
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % _ALIGNMENT)
+
+    os.makedirs(cache_folder, exist_ok=True)
+    target = cache_path(path, kind, cache_folder, parser)
+    # Write next to the target and rename, so a crashed run never leaves a half written entry
+    fd, temp_path = tempfile.mkstemp(dir=cache_folder, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for buffer in buffers.values():
+            data = buffer.tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % _ALIGNMENT))
+    os.replace(temp_path, target)
+    return target
+
+
+def read_cache(path: str, kind: str, cache_folder: str = CACHE_FOLDER, parser: str = "text"):
+    """
+    Returns the cached instances for path, or None when there is no valid, up to date entry.
+    """
+    entry = cache_path(path, kind, cache_folder, parser)
+    if not os.path.exists(entry) or os.path.getsize(entry) < len(MAGIC) + 8:
+        return None
+    with open(entry, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapping[:len(MAGIC)] != MAGIC:
+        return None
+    (header_length,) = struct.unpack("<Q", mapping[len(MAGIC):len(MAGIC) + 8])
+    data_start = len(MAGIC) + 8 + header_length
+    try:
+        header = json.loads(mapping[len(MAGIC) + 8:data_start])
+    except ValueError:
+        return None
+    if header.get("kind") != kind or header.get("parser") != parser or header.get("source") != _source_stats(path):
+        return None
+
+    # The views keep the mapping alive for as long as any instance uses it
+    view = memoryview(mapping)
+    buffers = {}
+    for name, (typecode, offset, length) in header["buffers"].items():
+        itemsize = array(typecode).itemsize
+        start = data_start + offset
+        buffers[name] = view[start:start + length * itemsize].cast(typecode)
+    return _unpack(kind, header["instances"], buffers)
+
+
+def cached_instances(path: str, kind: str, parse: Callable[[], List[Tuple]], cache_folder: str = CACHE_FOLDER,
+                     parser: str = "text") -> List[Tuple]:
+    """
+    Loads the instances of path from the cache, or parses them with parse() and caches the result.
+    kind is one of "dimacs", "graph", "knapsack" or "hamiltonian", parser is the "parser" run
+    option parse() uses, entries of the other parser are never reused.
+    """
+    instances = read_cache(path, kind, cache_folder, parser)
+    if instances is not None:
+        return instances
+    instances = parse()
+    write_cache(path, kind, instances, cache_folder, parser)
+    return instances
@@ -0,0 +1,137 @@
+"""
+Seeded random instance generators for the benchmarks.
+
+Every generator returns the text of a multi instance input file in the same format the
+dmaics_parser readers take, with `count` instances of every size in sizes, in the order of
+sizes. The same seed always gives the same file, so benchmark runs on different commits
+solve exactly the same instances.
+
+The default parameters put the instances where they are hard for their size:
+- knapsack: coin values with about as many bits as there are coins and a target of half the
+  total, the density 1 region of subset sum, as long as the target stays below KNAPSACK_MAX_TARGET
+- k-SAT: clause to variable ratio at the satisfiability threshold (4.26 for 3-SAT)
+- coloring: G(n, p) with an average degree of 4.6, close to the 3-colorability threshold
+- Hamiltonian cycle: G(n, p) just above the (ln n + ln ln n) / n Hamiltonicity threshold
+"""
+
+import math
+import random
+from typing import Iterable, List, Optional
+
+# Clause to variable ratio at the satisfiability threshold, by clause length
+SAT_THRESHOLD_RATIOS = {2: 1.0, 3: 4.26, 4: 9.93, 5: 21.12}
+
+# Largest target of the default knapsack instances. knapsack_simple keeps a bit and a parent entry
+# for every sum up to the target, which has to fit in memory next to the search methods
+KNAPSACK_MAX_TARGET = 1 << 20
+
+# Average degree of the default coloring graphs, close to where random graphs stop being 3-colorable
+COLORING_AVERAGE_DEGREE = 4.6
+
+
+def knapsack_instances(sizes: Iterable[int], count: int = 1, seed: int = 0,
+                       value_bits: Optional[int] = None, target_ratio: float = 0.5) -> str:
+    """
+    Knapsack instances with size coins each, coin values drawn from 1..2^value_bits and a target
+    of target_ratio times the sum of all coins.
+    value_bits defaults to the number of coins, lowered until no target can pass KNAPSACK_MAX_TARGET,
+    so larger sizes have more coins but not wider values. An explicit value_bits is used as given.
+    """
+    rnd = random.Random(seed)
+    lines = []
+    instance_id = 0
+    for n_coins in sizes:
+        bits = value_bits if value_bits is not None else _knapsack_value_bits(n_coins, target_ratio)
+        for _ in range(count):
+            instance_id += 1
+            coins = {}
+            for _ in range(n_coins):
+                value = rnd.randint(1, 1 << bits)
+                coins[value] = coins.get(value, 0) + 1
+            target = int(sum(value * times for value, times in coins.items()) * target_ratio)
+            lines.append(f"c {instance_id} {target} ?")
+            lines.append(f"p knap {len(coins)}")
+            lines.extend(f"{value} {times}" for value, times in coins.items())
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _knapsack_value_bits(n_coins: int, target_ratio: float) -> int:
+    bits = max(n_coins, 1)
+    # The target is at most target_ratio * n_coins * 2^bits
+    while bits > 1 and target_ratio * n_coins * (1 << bits) > KNAPSACK_MAX_TARGET:
+        bits -= 1
+    return bits
+
+
+def random_ksat_instances(sizes: Iterable[int], count: int = 1, seed: int = 0,
+                          k: int = 3, ratio: Optional[float] = None) -> str:
+    """
+    Uniform random k-SAT instances with size variables each and round(ratio * size) clauses of
+    k distinct variables with random signs. ratio defaults to the threshold ratio for k.
+    """
+    if ratio is None:
+        ratio = SAT_THRESHOLD_RATIOS.get(k, 2 ** k * math.log(2))
+    rnd = random.Random(seed)
+    lines = []
+    instance_id = 0
+    for n_vars in sizes:
+        if n_vars < k:
+            raise ValueError(f"Can't build {k}-SAT clauses over {n_vars} variables")
+        n_clauses = round(ratio * n_vars)
+        for _ in range(count):
+            instance_id += 1
+            lines.append(f"c {instance_id} {k} ?")
+            lines.append(f"p cnf {n_vars} {n_clauses}")
+            for _ in range(n_clauses):
+                lines.append(",".join(str(v if rnd.random() < 0.5 else -v)
+                                      for v in rnd.sample(range(1, n_vars + 1), k)))
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _gnp_edges(n: int, p: float, rnd: random.Random) -> List[tuple]:
+    return [(u, v) for u in range(1, n + 1) for v in range(u + 1, n + 1) if rnd.random() < p]
+
+
+def gnp_coloring_instances(sizes: Iterable[int], count: int = 1, seed: int = 0,
+                           k: int = 3, p: Optional[float] = None) -> str:
+    """
+    G(n, p) graph coloring instances with size vertices each, asking for a k-coloring.
+    p defaults to an average degree of COLORING_AVERAGE_DEGREE.
+    """
+    rnd = random.Random(seed)
+    lines = []
+    instance_id = 0
+    for n in sizes:
+        edge_probability = p if p is not None else min(1.0, COLORING_AVERAGE_DEGREE / max(n - 1, 1))
+        for _ in range(count):
+            instance_id += 1
+            edges = _gnp_edges(n, edge_probability, rnd)
+            lines.append(f"c {instance_id} {k} ?")
+            lines.append(f"p cnf {n} {len(edges)}")
+            lines.extend(f"{u},{v}" for u, v in edges)
+            lines.append("")
+    return "\n".join(lines)
+
+
+def gnp_hamiltonian_instances(sizes: Iterable[int], count: int = 1, seed: int = 0,
+                              p: Optional[float] = None, max_weight: int = 100) -> str:
+    """
+    G(n, p) Hamiltonian cycle instances with size vertices each and edge weights drawn from
+    1..max_weight. p defaults to 1.5 times the Hamiltonicity threshold.
+    """
+    rnd = random.Random(seed)
+    lines = []
+    instance_id = 0
+    for n in sizes:
+        threshold = (math.log(n) + math.log(math.log(n))) / n if n > 2 else 1.0
+        edge_probability = p if p is not None else min(1.0, 1.5 * threshold)
+        for _ in range(count):
+            instance_id += 1
+            edges = _gnp_edges(n, edge_probability, rnd)
+            lines.append(f"c {instance_id} ?")
+            lines.append(f"p edge {n} {len(edges)}")
+            lines.extend(f"{u},{v},{rnd.randint(1, max_weight)}" for u, v in edges)
+            lines.append("")
+    return "\n".join(lines)
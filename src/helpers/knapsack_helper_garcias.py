@@ -1,104 +1,41 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 import os
-from src.helpers.dmaics_parser import parse_multi_instance_knapsack
-from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
-from typing import List, Tuple, Dict, Any, Optional
-import json
-import csv
-import time
-from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
-import matplotlib.pyplot as plt
+from src.helpers.dmaics_parser import parse_multi_instance_knapsack, iter_multi_instance_knapsack
+from src.helpers.fast_parser import fast_parse_multi_instance_knapsack
+from typing import List, Tuple, Dict, Any, Optional, Iterable
+from src.helpers.project_selection_enum import SubProblemSelection
+from src.helpers.solver_runtime import SolverRuntime
+from src.helpers.search_budget import TIMEOUT
+from src.helpers.result_plots import plot_knapsack_runtimes
 
 
-class KnapsackAbstractClass(ABC):
+class KnapsackAbstractClass(SolverRuntime):
 
-    def __init__(self, 
-                    file_input_path: str,
-                    result_file_name:str = "knapsack_results",
-                    results_folder_path: str = RESULTS_FOLDER):
-        self.file_input_path = file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(f"Parsed {len(self.solution_instances)} instances from {self.file_input_path}")
-        self.sub_problems = self.set_config()
+    result_file_name = "knapsack_results"
+    cache_kind = "knapsack"
+    input_path_alias = "file_input_path"
+    column_kinds = {**SolverRuntime.column_kinds, "target": "int", "n_coins": "int",
+                    "feasible": "answer", "coin_combination": "int_map"}
 
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)        
-        return sub_probs
-        
-    def parse_input_file(self):
-        return parse_multi_instance_knapsack(self.file_input_path)
-    
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(self.results_folder_path, f"output_{sub_problem}_{self.result_file_name}_garcias.csv")
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["instance_id", "target", "n_coins",
-                    "method", "feasible", "time_seconds", "coin_combination"])
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
+    def parse_input_text(self):
+        if self.run_options["parser"] == "mmap":
+            return fast_parse_multi_instance_knapsack(self.input_path)
+        return parse_multi_instance_knapsack(self.input_path)
 
-        # Plot
-        plot_filename = os.path.splitext(temp_result.replace("output_", "plot_"))[0] + ".png"
+    def iter_input_file(self):
+        return iter_multi_instance_knapsack(self.input_path)
 
-        # Extract data
-        x_green = []
-        y_green = []
-        x_red = []
-        y_red = []
+    def result_header(self, sub_problem):
+        return ["instance_id", "target", "n_coins",
+                "method", "feasible", "time_seconds", "coin_combination"]
 
-        for row in run_results:
-            n_coins = int(row[2])
-            time_sec = float(row[5])
-            feasible = row[4]
+    def result_path(self, sub_problem):
+        return os.path.join(self.results_folder_path, f"output_{sub_problem}_{self.result_file_name}_garcias.csv")
 
-            if feasible == "YES":
-                x_green.append(n_coins)
-                y_green.append(time_sec)
-            else:
-                x_red.append(n_coins)
-                y_red.append(time_sec)
+    def plot_results(self, saved_results):
+        for plot_filename in plot_knapsack_runtimes(saved_results):
+            print(f"Plot saved to {plot_filename}")
 
-        # Create plot
-        plt.figure(figsize=(8,5))
-        plt.scatter(x_green, y_green, color='green', label='Feasible')
-        plt.scatter(x_red, y_red, color='red', label='Not feasible')
-        plt.xlabel("Number of Coins (Problem Size)")
-        plt.ylabel("Time (seconds)")
-        plt.title(f"Knapsack Runtime vs Problem Size ({sub_problem})")
-        plt.legend()
-        plt.grid(True)
-        plt.tight_layout()
-
-        # Save plot to same folder as CSV
-        plt.savefig(plot_filename)
-        plt.close()
-        print(f"Plot saved to {plot_filename}")
-
-    def plot(self, plot_file_name):
-        pass
-    
     @abstractmethod
     def knapsack_backtracking(self, target: int, coins: List[int]) -> Tuple[bool, Optional[Dict[int, bool]]]:
         pass
@@ -115,61 +52,20 @@ class KnapsackAbstractClass(ABC):
     def knapsack_bestcase(self, target: int, coins: List[int]) -> Tuple[bool, Optional[Dict[int, bool]]]:
         pass
 
-    def run(self):
-        results = []
-        
-        for instance_id, target, coins, solvable in self.solution_instances:
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.knapsack_bruteforce(target, coins)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, target, sum(coins.values()),
-                        "BruteForce", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for instance_id, target, coins, solvable in self.solution_instances:
-
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.knapsack_backtracking(target, coins)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, target, sum(coins.values()),
-                        "BackTracking", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for instance_id, target, coins, solvable in self.solution_instances:
-
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.knapsack_simple(target, coins)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, target, sum(coins.values()),
-                        "Simple", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-        
-
-        for instance_id, target, coins, solvable in self.solution_instances:
-
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.knapsack_bestcase(target, coins)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, target, sum(coins.values()),
-                        "BestCase", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
\ No newline at end of file
+    # (sub problem, method label, solver method) in the order the results are written
+    methods = [
+        (SubProblemSelection.brute_force, "BruteForce", "knapsack_bruteforce"),
+        (SubProblemSelection.btracking, "BackTracking", "knapsack_backtracking"),
+        (SubProblemSelection.simple, "Simple", "knapsack_simple"),
+        (SubProblemSelection.best_case, "BestCase", "knapsack_bestcase"),
+    ]
+
+    def instance_args(self, instance) -> Tuple:
+        instance_id, target, coins, solvable = instance
+        return (target, coins)
+
+    def format_row(self, instance, label: str, bt_ok, bt_assign, bt_time: float) -> List[Any]:
+        instance_id, target, coins, solvable = instance
+        return [instance_id, target, sum(coins.values()),
+                label, bt_ok if bt_ok == TIMEOUT else "YES" if bt_ok else "NO",
+                f"{bt_time:.6f}", str(bt_assign)]
@@ -0,0 +1,115 @@
+import copy
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from src.helpers.search_budget import SearchTimeout, TIMEOUT
+
+# Solver instance shipped once to every worker process by the pool initializer
+_worker_solver = None
+
+
+def _init_worker(solver):
+    global _worker_solver
+    _worker_solver = solver
+
+
+def _worker_copy(solver):
+    """
+    Shallow copy of the solver for the pool initializer, without the parsed instances.
+    Every task carries its own args, so the workers never need the whole instance list.
+    """
+    worker = copy.copy(solver)
+    worker.solution_instances = None
+    return worker
+
+
+# Outcome of one solver call: ok, assign, time_seconds and the search statistics row or None
+Outcome = Tuple[Any, Any, float, Optional[List[Any]]]
+
+
+def _timed_call(solver, method_name: str, args: Tuple) -> Outcome:
+    """
+    Calls one solver method and measures it, so the time always comes from the process that solved it.
+    A search that runs out of its budget comes back as (TIMEOUT, incumbent or {}, time_seconds, stats).
+    With the "stats" run option the call also runs under tracemalloc for its peak memory, otherwise stats is None.
+    """
+    budget = solver.budget
+    budget.start()
+    tracing = budget.stats is not None
+    if tracing:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        ok, assign = getattr(solver, method_name)(*args)
+    except SearchTimeout as error:
+        ok, assign = TIMEOUT, error.incumbent if error.incumbent is not None else {}
+    elapsed = time.perf_counter() - t0
+    if not tracing:
+        return ok, assign, elapsed, None
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = budget.finish_stats()
+    stats.add(peak_memory_kb=peak // 1024)
+    return ok, assign, elapsed, stats.row()
+
+
+def _run_task(task: Tuple[str, Tuple]) -> Outcome:
+    method_name, args = task
+    return _timed_call(_worker_solver, method_name, args)
+
+
+def resolve_workers(workers) -> int:
+    """
+    Turns the configured worker count into a process count, 0 or "auto" means one per core.
+    """
+    if workers in (0, "auto", None):
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def solve_instances(solver, tasks: List[Tuple[str, Tuple]], workers = 1) -> Iterator[Outcome]:
+    """
+    Solves a list of (method_name, args) tasks and yields (ok, assign, time_seconds, stats) for each,
+    in the same order as the tasks, as soon as it and every task before it are solved.
+    With more than one worker the tasks are spread over a process pool, every worker
+    receives the solver once, without its instance list, and times each call itself.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1 or len(tasks) < 2:
+        for method_name, args in tasks:
+            yield _timed_call(solver, method_name, args)
+        return
+
+    workers = min(workers, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(_worker_copy(solver),)) as pool:
+        # pool.map cancels the tasks that haven't started when the caller stops early
+        yield from pool.map(_run_task, tasks, chunksize=chunksize)
+
+
+def solve_stream(solver, tasks: Iterable[Tuple[Any, str, Tuple]], workers = 1) -> Iterator[Tuple[Any, Outcome]]:
+    """
+    Streaming version of solve_instances for (instance, method_name, args) tasks.
+    Yields (instance, (ok, assign, time_seconds, stats)) in task order while the tasks are still being read,
+    with at most a few tasks per worker in flight, so memory does not grow with the input size.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        for instance, method_name, args in tasks:
+            yield instance, _timed_call(solver, method_name, args)
+        return
+
+    window_size = workers * 4
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(_worker_copy(solver),)) as pool:
+        for instance, method_name, args in tasks:
+            in_flight.append((instance, pool.submit(_run_task, (method_name, args))))
+            if len(in_flight) >= window_size:
+                instance, future = in_flight.popleft()
+                yield instance, future.result()
+        while in_flight:
+            instance, future = in_flight.popleft()
+            yield instance, future.result()
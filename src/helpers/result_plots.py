@@ -0,0 +1,61 @@
+"""
+Runtime charts drawn from the result CSVs after a run.
+
+matplotlib is only imported once the first chart is drawn, so runs with plotting turned off
+(the "plot" run option / --no-plot) never pay for the import. Charts are drawn on plain
+Figure objects with the Agg canvas instead of pyplot, which keeps no global figure state
+and never looks for a GUI backend.
+"""
+
+import csv
+import os
+from typing import List, Tuple
+from src.helpers.search_budget import TIMEOUT
+
+
+def _runtime_points(result_path: str, size_column: int, answer_column: int, time_column: int):
+    """
+    Reads (size, time) points from a result CSV, split by answer into feasible, not feasible and timed out.
+    """
+    points = {"YES": ([], []), "NO": ([], []), TIMEOUT: ([], [])}
+    with open(result_path, newline="") as f:
+        rows = csv.reader(f)
+        next(rows)
+        for row in rows:
+            xs, ys = points.get(row[answer_column], points["NO"])
+            xs.append(int(row[size_column]))
+            ys.append(float(row[time_column]))
+    return points
+
+
+def plot_knapsack_runtimes(saved_results: List[Tuple[str, str]]) -> List[str]:
+    """
+    Draws the runtime vs number of coins chart of every (result CSV, sub problem) pair in one pass
+    and saves each one next to its CSV. Returns the paths of the PNG files.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    plot_files = []
+    for result_path, sub_problem in saved_results:
+        plot_filename = os.path.splitext(result_path.replace("output_", "plot_"))[0] + ".png"
+        points = _runtime_points(result_path, size_column=2, answer_column=4, time_column=5)
+
+        figure = Figure(figsize=(8, 5))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.scatter(*points["YES"], color='green', label='Feasible')
+        axes.scatter(*points["NO"], color='red', label='Not feasible')
+        if points[TIMEOUT][0]:
+            axes.scatter(*points[TIMEOUT], color='grey', label='Timeout')
+        axes.set_xlabel("Number of Coins (Problem Size)")
+        axes.set_ylabel("Time (seconds)")
+        axes.set_title(f"Knapsack Runtime vs Problem Size ({sub_problem})")
+        axes.legend()
+        axes.grid(True)
+        figure.tight_layout()
+
+        # Save plot to same folder as CSV
+        figure.savefig(plot_filename)
+        plot_files.append(plot_filename)
+    return plot_files
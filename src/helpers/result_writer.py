@@ -0,0 +1,64 @@
+"""
+Incremental CSV writer for the result files.
+
+Every row is flushed as soon as it is written, so a run that crashes or gets killed keeps all
+the rows it finished. With resume the existing file is kept: a row cut off halfway by the
+crash is dropped, the instance ids already in the file are collected in `solved`, and new
+rows are appended after them.
+"""
+
+import csv
+import os
+from typing import Any, List, Set
+
+
+def _recover(path: str, header: List[str]) -> Set[str]:
+    """
+    Cuts a partially written last row off the file and returns the instance ids of the complete rows.
+    """
+    with open(path, "rb+") as f:
+        data = f.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            f.truncate(complete)
+    with open(path, newline="") as f:
+        rows = csv.reader(f)
+        existing_header = next(rows, None)
+        if existing_header is None:
+            return set()
+        if existing_header != header:
+            raise Exception(f"Can't resume {path}, its columns don't match this run. Remove it or run without resume")
+        return {row[0] for row in rows if len(row) == len(header)}
+
+
+class ResultWriter:
+    """
+    Writes the rows of one result CSV, appending to it when resume is on.
+    """
+
+    def __init__(self, path: str, header: List[str], resume: bool = False):
+        self.path = path
+        self.solved: Set[str] = set()
+        if resume and os.path.exists(path) and os.path.getsize(path) > 0:
+            self.solved = _recover(path, header)
+            self.file = open(path, "a", newline="")
+            self.writer = csv.writer(self.file)
+            if not self.solved and os.path.getsize(path) == 0:
+                self.write(header)
+        else:
+            self.file = open(path, "w", newline="")
+            self.writer = csv.writer(self.file)
+            self.write(header)
+
+    def write(self, row: List[Any]):
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
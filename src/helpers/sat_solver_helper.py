@@ -1,63 +1,43 @@
-from abc import ABC, abstractmethod
-import os
-from src.helpers.dmaics_parser import parse_multi_instance_dimacs
-from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
-from typing import List, Tuple, Dict, Any
-import json
-import csv
-import time
-from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
-
-
-class SatSolverAbstractClass(ABC):
-
-    def __init__(self, 
-                    cnf_file_input_path: str,
-                    result_file_name:str = "sat_solver_results",
-                    results_folder_path: str = RESULTS_FOLDER):
-        self.cnf_file_input_path = cnf_file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}")
-        self.sub_problems = self.set_config()
-
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)
-        return sub_probs
-        
-    def parse_input_file(self):
-        return parse_multi_instance_dimacs(self.cnf_file_input_path)
-    
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.cnf_file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["instance_id", "n_vars", "n_clauses", "method",
-                        "satisfiable", "time_seconds", "solution"])
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
-    
+from abc import abstractmethod
+from src.helpers.dmaics_parser import parse_multi_instance_dimacs, iter_multi_instance_dimacs
+from src.helpers.fast_parser import fast_parse_multi_instance_dimacs
+from src.helpers.cnf_preprocessor import preprocess
+from typing import List, Tuple, Dict, Any, Optional, Iterable
+from src.helpers.project_selection_enum import SubProblemSelection
+from src.helpers.solver_runtime import SolverRuntime
+from src.helpers.search_budget import TIMEOUT
+
+
+def count_satisfied(clauses: Iterable[List[int]], assignment: Dict[int, bool]) -> int:
+    """
+    Number of clauses with at least one literal made true by the assignment.
+    """
+    return sum(any(assignment.get(abs(x)) == (x > 0) for x in clause) for clause in clauses)
+
+
+class SatSolverAbstractClass(SolverRuntime):
+
+    result_file_name = "sat_solver_results"
+    cache_kind = "dimacs"
+    input_path_alias = "cnf_file_input_path"
+    column_kinds = {**SolverRuntime.column_kinds, "n_vars": "int", "n_clauses": "int", "satisfiable": "answer",
+                    "solution": "bool_map", "satisfied_clauses": "int"}
+
+    def parse_input_text(self):
+        if self.run_options["parser"] == "mmap":
+            return fast_parse_multi_instance_dimacs(self.input_path)
+        return parse_multi_instance_dimacs(self.input_path)
+
+    def iter_input_file(self):
+        return iter_multi_instance_dimacs(self.input_path)
+
+    def result_header(self, sub_problem):
+        header = ["instance_id", "n_vars", "n_clauses", "method",
+                  "satisfiable", "time_seconds", "solution"]
+        if sub_problem == SubProblemSelection.best_case.name:
+            header.append("satisfied_clauses")
+        return header
+
     @abstractmethod
     def sat_backtracking(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
         pass
@@ -74,81 +54,52 @@ class SatSolverAbstractClass(ABC):
     def sat_bestcase(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
         pass
 
-    def run(self):
-        results = []
-        
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_bruteforce(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses),
-                                 "BruteForce",
-                            "S" if bt_ok else "U", 
-                            bt_time,
-                            str(bt_assign)])
-        
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_backtracking(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses),
-                            "BackTracking",
-                            "S" if bt_ok else "U", 
-                            bt_time,
-                            str(bt_assign)])
-        
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_simple(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses), 
-                                "Simple",
-                            "S" if bt_ok else "U", 
-                            bt_time, 
-                            str(bt_assign)])
-        
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-        
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_bestcase(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses), 
-                                "BestCase",
-                            "S" if bt_ok else "U", 
-                            bt_time, 
-                            str(bt_assign)])
-        
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
-
-
-
-        
-
-
-    
-    
-
-
-    
\ No newline at end of file
+    # (sub problem, method label, solver method) in the order the results are written
+    methods = [
+        (SubProblemSelection.brute_force, "BruteForce", "sat_bruteforce"),
+        (SubProblemSelection.btracking, "BackTracking", "sat_backtracking"),
+        (SubProblemSelection.simple, "Simple", "sat_simple"),
+        (SubProblemSelection.best_case, "BestCase", "sat_bestcase"),
+    ]
+
+    # Methods whose answer only depends on satisfiability, so they can run on the preprocessed formula.
+    # The best case search counts satisfied clauses, which preprocessing does not preserve.
+    preprocessed_methods = ("sat_bruteforce", "sat_backtracking", "sat_simple")
+
+    def instance_args(self, instance) -> Tuple:
+        inst_id, n_vars, clauses = instance
+        return (n_vars, clauses)
+
+    def instance_task(self, method_name: str, instance) -> Tuple[str, Tuple]:
+        """
+        The (method name, args) call that solves one instance, routed through
+        solve_preprocessed when the "preprocess" run option is on.
+        """
+        if self.run_options["preprocess"] and method_name in self.preprocessed_methods:
+            return "solve_preprocessed", (method_name,) + self.instance_args(instance)
+        return method_name, self.instance_args(instance)
+
+    def solve_preprocessed(self, method_name: str, n_vars: int, clauses: List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        """
+        Simplifies the formula, solves what is left with the given method and maps the
+        solution back onto the original variables.
+        """
+        formula = preprocess(n_vars, clauses)
+        if formula.unsat:
+            return False, {}
+        ok, assignment = getattr(self, method_name)(formula.n_vars, formula.clauses)
+        if ok is not True:
+            return ok, assignment
+        return True, formula.reconstruct(assignment)
+
+    def format_row(self, instance, label: str, bt_ok, bt_assign, bt_time: float) -> List[Any]:
+        inst_id, n_vars, clauses = instance
+        row = [inst_id, n_vars, len(clauses),
+               label,
+               bt_ok if bt_ok == TIMEOUT else "S" if bt_ok else "U",
+               bt_time,
+               str(bt_assign)]
+        if label == "BestCase":
+            # Best case answers are MaxSAT assignments, how good one is is the number of clauses it satisfies
+            row.append(count_satisfied(clauses, bt_assign) if bt_assign else "")
+        return row
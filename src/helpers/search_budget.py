@@ -0,0 +1,110 @@
+import time
+from typing import Optional
+
+# Value written in the feasible / satisfiable column when a search ran out of budget
+TIMEOUT = "TIMEOUT"
+
+
+class SearchTimeout(Exception):
+    """
+    Raised from inside a solver loop when its wall-clock or node budget is used up.
+    Anytime solvers set incumbent to the best answer they had, it is written instead of {}.
+    """
+
+    incumbent = None
+
+
+class SearchStats:
+    """
+    Search counters of one solver call, only kept when the "stats" run option is on.
+
+    The search loops count in local variables and add their counters here once when they stop,
+    whether they found an answer, ran out of options or timed out, so the loops pay nothing per
+    node for it. nodes also gets the part the loop already charged to the budget. Counters a
+    search doesn't have stay empty in the results.
+    """
+
+    columns = ("nodes", "prunes", "max_depth", "propagations", "conflicts", "peak_memory_kb")
+
+    def __init__(self):
+        self.counters = {}
+
+    def add(self, **counters: int):
+        for name, value in counters.items():
+            if name == "max_depth":
+                self.counters[name] = max(value, self.counters.get(name, 0))
+            else:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def row(self) -> list:
+        return [self.counters.get(name, "") for name in self.columns]
+
+
+class SearchBudget:
+    """
+    Per-instance wall-clock and node-count budget for the exponential searches.
+
+    Solvers count nodes locally and call charge() every check_interval nodes,
+    so an unlimited budget costs one integer compare per node.
+    start() has to be called before every solver call to reset the clock and the counter.
+    """
+
+    check_interval = 1024
+
+    def __init__(self, time_limit: Optional[float] = None, node_limit: Optional[int] = None, stats: bool = False):
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        # Counters of the current call when the "stats" run option is on, None otherwise
+        self.stats = SearchStats() if stats else None
+        if node_limit is not None:
+            # Small node limits still have to be hit exactly
+            self.check_interval = max(1, min(self.check_interval, node_limit))
+        self.nodes = 0
+        self.deadline = None
+
+    @classmethod
+    def from_options(cls, run_options):
+        return cls(run_options.get("time_limit_seconds"), run_options.get("node_limit"), run_options.get("stats", False))
+
+    @property
+    def limited(self) -> bool:
+        return self.time_limit is not None or self.node_limit is not None
+
+    def start(self):
+        self.nodes = 0
+        if self.stats is not None:
+            self.stats = SearchStats()
+        self.deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+
+    def charge(self, nodes: int):
+        """
+        Adds visited nodes to the counter and raises SearchTimeout once a limit is passed.
+        """
+        self.nodes += nodes
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout(f"node limit of {self.node_limit} reached")
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchTimeout(f"time limit of {self.time_limit}s reached")
+
+    def expired(self) -> bool:
+        """
+        Non raising check, for anytime solvers that want to return their incumbent instead.
+        """
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            return True
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def record(self, nodes: int, **counters: int):
+        """
+        Adds the counters of a search loop that stopped to the stats. nodes is the loop's local count
+        since its last charge(), a loop stopped by charge() raising still holds the nodes it just charged.
+        """
+        self.stats.add(nodes=nodes % self.check_interval, **counters)
+
+    def finish_stats(self) -> Optional[SearchStats]:
+        """
+        The counters of the call that just ended, with the nodes charged to the budget added in.
+        """
+        if self.stats is not None:
+            self.stats.add(nodes=self.nodes)
+        return self.stats
@@ -0,0 +1,214 @@
+from abc import ABC, abstractmethod
+import os
+import json
+from contextlib import ExitStack
+from typing import List, Tuple, Dict, Any, Optional, Iterable, Iterator, Set
+from src.helpers.instance_cache import cached_instances
+from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH, parse_run_options
+from src.helpers.project_selection_enum import SubProblemSelection
+from src.helpers.parallel_runner import solve_instances, solve_stream
+from src.helpers.search_budget import SearchBudget, SearchStats
+from src.helpers.result_writer import ResultWriter
+from src.helpers.columnar_results import write_parquet
+
+
+class SolverRuntime(ABC):
+    """
+    Everything the problem solvers share: run options, the sub problems picked in the configuration,
+    loading the input file, and run(), which goes over the instances once, calls every selected
+    method on each of them and writes one CSV per sub problem. Rows are flushed as they are solved,
+    and with the "resume" run option a rerun only solves the instances missing from the CSVs.
+
+    With the "stats" run option every row also gets the search counters of its call, see SearchStats.
+
+    A problem class fills in:
+    - methods: (sub problem, method label, solver method name) in the order the results are written
+    - result_file_name and cache_kind (the instance_cache kind of its input)
+    - input_path_alias, the name the input path had in its original constructor
+    - parse_input_text / iter_input_file, instance_args, format_row and result_header
+    - column_kinds, how its result columns are typed in the Parquet output
+    - optionally plot_results, to draw charts from the finished CSVs
+    """
+
+    methods: List[Tuple[SubProblemSelection, str, str]] = []
+    result_file_name: str = "results"
+    cache_kind: str = ""
+    # Keyword and attribute name of the input path before the classes shared this constructor,
+    # still accepted and set so existing callers keep working
+    input_path_alias: Optional[str] = None
+    # Kind of every result column for the Parquet output, see columnar_results.py
+    column_kinds: Dict[str, str] = {"instance_id": "string", "method": "string", "time_seconds": "float",
+                                    **{column: "int" for column in SearchStats.columns}}
+
+    def __init__(self,
+                    input_path: Optional[str] = None,
+                    result_file_name: Optional[str] = None,
+                    results_folder_path: str = RESULTS_FOLDER,
+                    run_options: Optional[Dict[str, Any]] = None,
+                    config_path: str = CONFIGURATION_FILE_PATH,
+                    **alias):
+        if self.input_path_alias in alias:
+            if input_path is not None:
+                raise TypeError(f"Pass either input_path or {self.input_path_alias}, not both")
+            input_path = alias.pop(self.input_path_alias)
+        if alias:
+            raise TypeError(f"Unexpected keyword arguments: {', '.join(alias)}")
+        if input_path is None:
+            raise TypeError("An input file path is required")
+        self.input_path = input_path
+        if self.input_path_alias is not None:
+            setattr(self, self.input_path_alias, input_path)
+        self.results_folder_path = results_folder_path
+        if result_file_name is not None:
+            self.result_file_name = result_file_name
+        self.config_path = config_path
+        self.run_options = parse_run_options(self.config_path, run_options)
+        self.budget = SearchBudget.from_options(self.run_options)
+        if self.run_options["streaming"]:
+            # Instances are read lazily by run(), nothing is kept in memory
+            self.solution_instances = None
+            print(f"Streaming instances from {self.input_path}")
+            if self.run_options["cache"] or self.run_options["parser"] != "text":
+                print("Warning: the cache and parser run options are ignored while streaming")
+        else:
+            self.solution_instances = self.parse_input_file()
+            print(f"Parsed {len(self.solution_instances)} instances from {self.input_path}")
+        self.sub_problems = self.set_config()
+
+    def set_config(self) -> List[SubProblemSelection]:
+        if not os.path.exists(self.config_path):
+            raise Exception("Please make sure the configuration file exists!!!")
+        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
+            data = json.load(conf_buffer)
+        sub_problem = data["Project Configuration"]["Sub Problem"]
+        by_value = {selection.value: selection for selection in SubProblemSelection}
+        return [by_value[sub_prob["value"]] for sub_prob in sub_problem if sub_prob["value"] in by_value]
+
+    def parse_input_file(self):
+        if self.run_options["cache"]:
+            return cached_instances(self.input_path, self.cache_kind, self.parse_input_text,
+                                    parser=self.run_options["parser"])
+        return self.parse_input_text()
+
+    @abstractmethod
+    def parse_input_text(self) -> List[Tuple]:
+        pass
+
+    @abstractmethod
+    def iter_input_file(self) -> Iterator[Tuple]:
+        pass
+
+    @abstractmethod
+    def instance_args(self, instance) -> Tuple:
+        pass
+
+    def instance_task(self, method_name: str, instance) -> Tuple[str, Tuple]:
+        """
+        The (method name, args) call that solves one instance with the given method.
+        """
+        return method_name, self.instance_args(instance)
+
+    @abstractmethod
+    def format_row(self, instance, label: str, bt_ok, bt_assign, bt_time: float) -> List[Any]:
+        pass
+
+    @abstractmethod
+    def result_header(self, sub_problem: str) -> List[str]:
+        pass
+
+    def result_columns(self, sub_problem: str) -> List[str]:
+        """
+        The result header, followed by the search statistics columns when the "stats" run option is on.
+        """
+        header = self.result_header(sub_problem)
+        if self.run_options["stats"]:
+            return header + list(SearchStats.columns)
+        return header
+
+    def result_path(self, sub_problem: str) -> str:
+        file_name_only, ext = os.path.splitext(os.path.basename(self.input_path))
+        return os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
+
+    def results_saved(self, result_path: str, sub_problem: str):
+        """
+        Called once the CSV of a sub problem is complete.
+        """
+        print(f"\nResults written to {result_path}")
+
+    def plot_results(self, saved_results: List[Tuple[str, str]]):
+        """
+        Draws the charts for the given (result CSV, sub problem) pairs, called once all of them are written
+        unless the "plot" run option is off. Problems without charts leave this empty.
+        """
+        pass
+
+    def export_columnar(self, saved_results: List[Tuple[str, str]]):
+        """
+        Writes a typed Parquet copy next to each of the given (result CSV, sub problem) pairs.
+        """
+        for result_path, _ in saved_results:
+            print(f"Columnar results written to {write_parquet(result_path, self.column_kinds)}")
+
+    def save_results(self, run_results: Iterable[List[Any]], sub_problem: str):
+        # Write to CSV
+        result_path = self.result_path(sub_problem)
+        with ResultWriter(result_path, self.result_columns(sub_problem)) as writer:
+            for row in run_results:
+                writer.write(row)
+        self.results_saved(result_path, sub_problem)
+        if self.run_options["parquet"]:
+            self.export_columnar([(result_path, sub_problem)])
+        if self.run_options["plot"]:
+            self.plot_results([(result_path, sub_problem)])
+
+    def selected_methods(self) -> List[Tuple[SubProblemSelection, str, str]]:
+        return [method for method in self.methods if method[0] in self.sub_problems]
+
+    def solve_all(self, selected: List[Tuple[SubProblemSelection, str, str]],
+                  solved: Optional[Dict[SubProblemSelection, Set[str]]] = None) -> Iterator[Tuple[Tuple, Tuple, Tuple[Any, Any, float, Optional[List[Any]]]]]:
+        """
+        Yields (instance, (sub problem, label, method name), (ok, assign, time_seconds, stats)) for every
+        instance and every selected method, instance by instance.
+        Pairs whose instance id is in solved[sub problem] are skipped.
+        """
+        solved = solved or {}
+        workers = self.run_options["workers"]
+        if self.run_options["streaming"]:
+            tasks = (((instance, method),) + self.instance_task(method[2], instance)
+                     for instance in self.iter_input_file()
+                     for method in selected
+                     if str(instance[0]) not in solved.get(method[0], ()))
+            for (instance, method), outcome in solve_stream(self, tasks, workers):
+                yield instance, method, outcome
+            return
+
+        keys = [(instance, method) for instance in self.solution_instances for method in selected
+                if str(instance[0]) not in solved.get(method[0], ())]
+        # Every (instance, method) pair is one task, they come back in submission order
+        outcomes = solve_instances(self, [self.instance_task(method[2], instance) for instance, method in keys], workers)
+        for (instance, method), outcome in zip(keys, outcomes):
+            yield instance, method, outcome
+
+    def run(self):
+        selected = self.selected_methods()
+        resume = self.run_options["resume"]
+        with ExitStack() as stack:
+            # One CSV per sub problem, all of them are filled during the same pass over the instances
+            # and every row is flushed as soon as it is solved
+            writers = {sub_problem: stack.enter_context(ResultWriter(self.result_path(sub_problem.name),
+                                                                     self.result_columns(sub_problem.name), resume))
+                       for sub_problem, _, _ in selected}
+            solved = {sub_problem: writer.solved for sub_problem, writer in writers.items()}
+            if any(solved.values()):
+                print(f"Resuming, {sum(map(len, solved.values()))} results are already written")
+            for instance, (sub_problem, label, _), (ok, assign, t, stats) in self.solve_all(selected, solved):
+                row = self.format_row(instance, label, ok, assign, t)
+                writers[sub_problem].write(row + stats if stats is not None else row)
+        saved = [(self.result_path(sub_problem.name), sub_problem.name) for sub_problem, _, _ in selected]
+        for result_path, sub_problem in saved:
+            self.results_saved(result_path, sub_problem)
+        if self.run_options["parquet"]:
+            self.export_columnar(saved)
+        # Charts are a separate stage after solving, so one slow plot never holds up the next method
+        if self.run_options["plot"] and saved:
+            self.plot_results(saved)
@@ -47,8 +47,50 @@ instance_id,n_coins,target_value,method,feasible,time_seconds,coin_combination
 """
 
 from src.helpers.knapsack_helper_garcias import KnapsackAbstractClass
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Iterator
 from collections import defaultdict
+from array import array
+
+
+def _set_bits(value: int) -> Iterator[int]:
+    """
+        Yields the positions of the set bits of a non-negative integer, lowest first
+    """
+    bits = bin(value)[:1:-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+def _canonical_order(coins: Dict[int, int], used: Optional[Dict[int, int]]) -> Tuple[List[int], List[int]]:
+    """
+        Returns the usable denominations sorted by descending value and how many of each are still available
+    """
+    used = used or {}
+    denominations = []
+    available = []
+    for coin in sorted(coins, reverse=True):
+        left = coins[coin] - used.get(coin, 0)
+        if coin > 0 and left > 0:
+            denominations.append(coin)
+            available.append(left)
+    return denominations, available
+
+
+def _combination_dict(coins: Dict[int, int], used: Optional[Dict[int, int]],
+                      denominations: List[int], counts: List[int]) -> Dict[int, int]:
+    """
+        Merges the chosen counts with the already used coins into a {coin: count} dict in input order
+    """
+    chosen = dict(zip(denominations, counts))
+    used = used or {}
+    combination = {}
+    for coin in coins:
+        count = used.get(coin, 0) + chosen.get(coin, 0)
+        if count > 0:
+            combination[coin] = count
+    return combination
 
 
 class Knapsack(KnapsackAbstractClass):
@@ -64,15 +106,20 @@ class Knapsack(KnapsackAbstractClass):
         """
             Generates a backtracking solution by trying all possible combinations and pruning combinations that have become invalid
             
-            This recursive function tries using one of each coin recursively to try all combinations.
-            In each recursive call, it subtracts the used coin to the target.
-            If the target ever reaches exactly 0, there is a solution, but if not there isn't.
-            If the target goes below 0, then it stops checking, prunes that combination and backtracks to try a new one.
+            The search is combination-canonical: denominations are visited once each, in descending
+            value order, and at every level we only choose how many coins of that denomination to use.
+            That way every multiset of coins is explored once instead of once per ordering.
+            Largest counts are tried first so big coins close the gap quickly.
+            A branch is pruned when the remaining target is larger than what all the remaining
+            denominations can add up to (suffix-sum upper bound), and every (index, remaining target)
+            state that failed is memoized so it is never explored twice.
+            The search runs on an explicit stack with preallocated count arrays instead of recursion,
+            so large instances are not limited by Python's recursion depth.
             
             Params
             - target: amount that must be reached
             - coins: dictionary of coin values and count pairs
-            - used: dictionary of used coin values and count pairs
+            - used: dictionary of coin values and count pairs that are already committed
             
             Return
             Tuple[
@@ -95,36 +142,74 @@ class Knapsack(KnapsackAbstractClass):
             (False, {})
             - Since it's not solvable we return False and an empty dictionary
         """
-        if not used:
-            used = defaultdict(int)
-
-        if target == 0:
-            return True, dict(used)
-        
-        # If combination of coins is no longer valid, prune this combination and backtrack
-        if target < 0:
-            return False, {}
+        denominations, available = _canonical_order(coins, used)
+        n = len(denominations)
 
-        # Try each coin
-        for coin, max_count in coins.items():
+        # suffix[i] is the most the denominations from i onwards can add up to
+        suffix = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i + 1] + denominations[i] * available[i]
 
-            # Skip used up coins
-            if used[coin] >= max_count:
-                continue
+        counts = array('q', [0]) * n
+        # Explicit stack: the remaining target when each level was entered, and its next count to try
+        gap = array('q', [0]) * (n + 1)
+        next_count = array('q', [0]) * (n + 1)
+        lowest = array('q', [0]) * (n + 1)
+        failed = set()
 
-            # Choose the coin
-            used[coin] += 1
-
-            # Do the backtracking using recursion
-            feasible, solution = self.knapsack_backtracking(target - coin, coins, used)
-
-            if feasible:
-                return True, solution
+        if target < 0:
+            return False, {}
 
-            # Backtrack 
-            used[coin] -= 1
+        # Cooperative budget check, the search stops with SearchTimeout once it is used up
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        prunes = 0
+        deepest = 0
+        level = 0
+        remaining = target
+        descend = True
+        try:
+            while level >= 0:
+                nodes += 1
+                if nodes == check_interval:
+                    budget.charge(nodes)
+                    nodes = 0
+                if descend:
+                    if remaining == 0:
+                        return True, _combination_dict(coins, used, denominations, counts)
+                    # Remaining coins can't cover the gap, prune this combination and backtrack
+                    if remaining > suffix[level] or (level, remaining) in failed:
+                        prunes += 1
+                        level -= 1
+                        descend = False
+                        continue
+                    coin = denominations[level]
+                    gap[level] = remaining
+                    next_count[level] = min(available[level], remaining // coin)
+                    # Using fewer coins here only helps while the later denominations can still cover the rest
+                    lowest[level] = max(0, -(-(remaining - suffix[level + 1]) // coin))
+
+                count = next_count[level]
+                if count < lowest[level]:
+                    # Backtrack
+                    counts[level] = 0
+                    failed.add((level, gap[level]))
+                    level -= 1
+                    descend = False
+                    continue
+
+                next_count[level] = count - 1
+                counts[level] = count
+                remaining = gap[level] - denominations[level] * count
+                level += 1
+                if level > deepest:
+                    deepest = level
+                descend = True
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes, prunes=prunes, max_depth=deepest)
 
-        # No solution
         return False, {}
 
 
@@ -132,14 +217,16 @@ class Knapsack(KnapsackAbstractClass):
         """
             Generates a brute force solution by trying all valid combinations
             
-            This recursive function tries using one of each coin recursively to try all combinations.
-            In each recursive call, it subtracts the used coin to the target.
-            If the target ever reaches exactly 0, there is a solution, but if not there isn't.
+            This function picks denominations in a fixed order and tries every count
+            of each one, so it goes through every multiset of the available coins exactly once.
+            Only when a count has been chosen for every denomination do we check whether the
+            combination adds up to the target, there is no pruning at all.
+            The enumeration runs on an explicit stack with preallocated count arrays instead of recursion.
             
             Params
             - target: amount that must be reached
             - coins: dictionary of coin values and count pairs
-            - used: dictionary of used coin values and count pairs
+            - used: dictionary of coin values and count pairs that are already committed
             
             Return
             Tuple[
@@ -162,47 +249,175 @@ class Knapsack(KnapsackAbstractClass):
             (False, {})
             - Since it's not solvable we return False and an empty dictionary
         """
+        denominations, available = _canonical_order(coins, used)
+        n = len(denominations)
+        counts = array('q', [0]) * n
+        # Explicit stack: the total when each level was entered, and its next count to try
+        partial = array('q', [0]) * (n + 1)
+        next_count = array('q', [0]) * (n + 1)
+
+        # Cooperative budget check, the search stops with SearchTimeout once it is used up
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        deepest = 0
+        level = 0
+        total = 0
+        descend = True
+        try:
+            while level >= 0:
+                nodes += 1
+                if nodes == check_interval:
+                    budget.charge(nodes)
+                    nodes = 0
+                # Every denomination has a count, check the combination
+                if level == n:
+                    if total == target:
+                        return True, _combination_dict(coins, used, denominations, counts)
+                    level -= 1
+                    descend = False
+                    continue
+
+                if descend:
+                    partial[level] = total
+                    next_count[level] = 0
+
+                count = next_count[level]
+                if count > available[level]:
+                    # Restore original count
+                    counts[level] = 0
+                    level -= 1
+                    descend = False
+                    continue
+
+                next_count[level] = count + 1
+                counts[level] = count
+                total = partial[level] + denominations[level] * count
+                level += 1
+                if level > deepest:
+                    deepest = level
+                descend = True
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes, max_depth=deepest)
+
+        # If no combination worked, return False
+        return False, {}
+
+    def knapsack_simple(self, target: int, coins: Dict[int, int], used: Dict[int,int] = None) -> Tuple[bool, Optional[List[int]]]:
+        """
+            Generates a pseudo-polynomial solution with a bounded subset-sum dynamic program
+
+            Every coin count is binary split into chunks of 1, 2, 4, ... coins (plus a remainder),
+            so each denomination only adds O(log count) 0/1 items instead of count items.
+            The set of reachable sums is stored as the bits of one Python integer, so adding a
+            chunk of value w is a single shift and or over the whole table.
+            Whenever a chunk makes a sum reachable for the first time we remember that chunk in
+            a parent array, which lets us walk back from the target and rebuild the coin counts.
+            A first pass without the parent array answers infeasible targets right away, and
+            both passes stop as soon as the target bit becomes reachable.
+            Each chunk costs O(target) bit operations plus a Python step for every newly reachable
+            sum, so targets around 10^5 take milliseconds, but a target of 10^6 with a few dozen
+            denominations takes a few tenths of a second, mostly spent filling the parent array.
+            Every chunk is charged to the run budget as one node, so the time and node limits
+            stop the table from being built.
 
-        if not used:
-            used = defaultdict(int)
+            Params
+            - target: amount that must be reached
+            - coins: dictionary of coin values and count pairs
+            - used: unused, kept so every solver has the same arguments
 
+            Return
+            Tuple[
+                bool: True if you can make a combination of coins to reach target or False if you can't,
+                Optional[Dict[int,int]]: value, count pairs of each coin used and what quantity
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> coins = {1: 5, 4: 2}
+            >>> target = 6
+            knapsack_simple(target, coins)
+            (True, {1: 2, 4: 1})
+
+            >>> coins = {1: 5, 4: 2}
+            >>> target = 14
+            knapsack_simple(target, coins)
+            (False, {})
+        """
         if target == 0:
-            return True, dict(used)
-            
-        # Go through coins
-        for coin in coins:
-            # If no more coins available, continue
-            if used[coin] >= coins[coin]:
-                continue
-            
-            # If a coin is available, use and subtract the value from target
-            used[coin] += 1
-            feasible, solution = self.knapsack_bruteforce(target-coin,coins,used)
+            return True, {}
+        if target < 0:
+            return False, {}
 
-            # If we reached a solution, return
-            if feasible:
-                return True, dict(solution)
-            
-            # Restore original count
-            used[coin] -= 1
+        # Binary split every coin count into (coin, multiplicity) chunks
+        chunks = []
+        for coin, max_count in coins.items():
+            if coin <= 0 or max_count <= 0:
+                continue
+            size = 1
+            remaining = max_count
+            while remaining > 0:
+                take = min(size, remaining)
+                if coin * take <= target:
+                    chunks.append((coin, take))
+                remaining -= take
+                size <<= 1
+
+        mask = (1 << (target + 1)) - 1
+        goal = 1 << target
+        budget = self.budget
+
+        # First pass only answers feasibility, so unreachable targets never pay for the parent array
+        reachable = 1
+        for coin, take in chunks:
+            # Every chunk is a pass over the whole table, so the budget is checked for each one
+            budget.charge(1)
+            reachable = (reachable | (reachable << (coin * take))) & mask
+            if reachable & goal:
+                break
+        if not reachable & goal:
+            return False, {}
 
-        # If no solution worked, return False
-        return False, {}               
+        reachable = 1
+        # parent[s] is the index of the chunk that first reached sum s
+        parent = array('i', [-1]) * (target + 1)
 
-    def knapsack_simple(self, target: int, coins: Dict[int, int], used: Dict[int,int] = None) -> Tuple[bool, Optional[List[int]]]:
-        return False, "Not implemented"
+        for index, (coin, take) in enumerate(chunks):
+            budget.charge(1)
+            updated = (reachable | (reachable << (coin * take))) & mask
+            new_sums = updated & ~reachable
+            if not new_sums:
+                continue
+            for total in _set_bits(new_sums):
+                parent[total] = index
+            reachable = updated
+            if reachable & goal:
+                break
+
+        # Walk back through the parent array, every step uses an earlier chunk
+        counts = defaultdict(int)
+        total = target
+        while total > 0:
+            coin, take = chunks[parent[total]]
+            counts[coin] += take
+            total -= coin * take
+
+        return True, {coin: counts[coin] for coin in coins if counts[coin] > 0}
 
     def knapsack_bestcase(self, target: int, coins: Dict[int, int], used: Dict[int,int] = None, best: Dict[int,int] = None) -> Tuple[bool, Optional[List[int]]]:
         """
-            Generates a best case solution by trying all valid combinations
+            Generates a best case solution with a branch-and-bound search over coin counts
             
-            This recursive function tries using one of each coin recursively to try all combinations.
-            In each recursive call, it subtracts the used coin to the target.
-            If the target ever reaches exactly 0, there is a solution, but if not there isn't.
-            If the target goes below 0, then it stops checking, prunes that combination and backtracks to try a new one.
-            At each iteration, it keeps track of the current used coins, and if the sum of the current used coins
-            is better than the best case combination of coins, it updates the best case combination of coins to the
-            combination of the current used coins.
+            Like the backtracking search, denominations are visited once each in descending value
+            order and at every level we choose how many coins of that denomination to use.
+            The sum of the coins chosen so far is carried down the search instead of being
+            recomputed, and the best combination found so far (the incumbent) is only copied
+            when it actually improves.
+            A branch is pruned when even taking every remaining coin could not beat the incumbent,
+            and (index, remaining target) states that were already explored are skipped.
+            As soon as a combination reaches the target exactly, the search stops.
+            The search runs on an explicit stack with preallocated count arrays instead of recursion.
             This way, if we reach the target we return the combination of coins that reaches that exact target, but
             if the target is impossible to reach, we return the combination of coins that gets closest to the
             target without going past it.
@@ -210,8 +425,8 @@ class Knapsack(KnapsackAbstractClass):
             Params
             - target: amount that must be reached
             - coins: dictionary of coin values and count pairs
-            - used: dictionary of used coin values and count pairs
-            - best: dictionary of best case of used coin values and coint pairs
+            - used: dictionary of coin values and count pairs that are already committed
+            - best: optional starting incumbent of coin values and count pairs
             
             Return
             Tuple[
@@ -237,42 +452,84 @@ class Knapsack(KnapsackAbstractClass):
             given our combination of coins. We stil return false in our 
             tuple because it's not solvable.
         """
+        denominations, available = _canonical_order(coins, used)
+        n = len(denominations)
+        used_sum = sum(coin * cnt for coin, cnt in (used or {}).items())
+        limit = target - used_sum
+
+        suffix = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i + 1] + denominations[i] * available[i]
+
+        counts = array('q', [0]) * n
+        best_counts = array('q', [0]) * n
+        best_sum = 0
+        if best:
+            start_sum = sum(coin * cnt for coin, cnt in best.items()) - used_sum
+            if 0 <= start_sum <= limit:
+                best_sum = start_sum
+                best_counts = array('q', [max(0, best.get(coin, 0) - (used or {}).get(coin, 0)) for coin in denominations])
+        # Explicit stack: the running sum when each level was entered, and its next count to try
+        partial = array('q', [0]) * (n + 1)
+        next_count = array('q', [0]) * (n + 1)
+        explored = set()
+
+        if limit < 0:
+            return False, {}
 
-        if not used:
-            used = defaultdict(int)
-        if best is None:
-            best = {}
-
-        curr_sum = sum(coin*cnt for coin, cnt in used.items())
-        best_sum = sum(coin*cnt for coin, cnt in best.items()) if best else 0
-
-        # Updating best sum if necessary
-        if curr_sum > best_sum:
-            best.clear()
-            for coin, cnt in used.items():
-                if cnt > 0:
-                    best[coin] = cnt
-        
-        if target == 0:
-            return True, dict(used)
-        
-        for coin, max_cnt in coins.items():
-            # Move on if coins are used up
-            if used[coin] >= max_cnt:
-                continue
-            #Pruning
-            if target - coin < 0:
-                continue
-
-            # Choosing coin then recursing with the updated target
-            used[coin] += 1
-            feasible, solution = self.knapsack_bestcase(target - coin, coins, used, best)
-            # Bringing count back
-            used[coin] -= 1
-
-            if feasible:
-                return True, dict(solution)
+        # Cooperative budget check, the search stops with SearchTimeout once it is used up
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        prunes = 0
+        deepest = 0
+        exact = False
+        level = 0
+        curr_sum = 0
+        descend = True
+        try:
+            while level >= 0:
+                nodes += 1
+                if nodes == check_interval:
+                    budget.charge(nodes)
+                    nodes = 0
+                if descend:
+                    # Updating the incumbent if necessary
+                    if curr_sum > best_sum:
+                        best_sum = curr_sum
+                        best_counts[:] = counts
+                    if curr_sum == limit:
+                        exact = True
+                        break
+                    remaining = limit - curr_sum
+                    # Bound: even every remaining coin can't beat the incumbent
+                    if level == n or curr_sum + suffix[level] <= best_sum or (level, remaining) in explored:
+                        if level < n:
+                            prunes += 1
+                        level -= 1
+                        descend = False
+                        continue
+                    partial[level] = curr_sum
+                    next_count[level] = min(available[level], remaining // denominations[level])
+
+                count = next_count[level]
+                if count < 0:
+                    counts[level] = 0
+                    explored.add((level, limit - partial[level]))
+                    level -= 1
+                    descend = False
+                    continue
+
+                next_count[level] = count - 1
+                counts[level] = count
+                curr_sum = partial[level] + denominations[level] * count
+                level += 1
+                if level > deepest:
+                    deepest = level
+                descend = True
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes, prunes=prunes, max_depth=deepest)
 
         # If an exact sum is impossible, return the combination that got the closest
-        return False, dict(best)
-
+        return exact, _combination_dict(coins, used, denominations, best_counts)
@@ -40,9 +40,824 @@ instance_id,n_vars,n_clauses,method,satisfiable,time_seconds,solution
 4,4,10,S,0.00013304100139066577,BruteForce,"{1: True, 2: False, 3: False, 4: False}"
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from src.helpers.sat_solver_helper import SatSolverAbstractClass
 import itertools
+import heapq
+import random
+from array import array
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from src.helpers.parallel_runner import resolve_workers
+from src.helpers.search_budget import SearchTimeout
+
+# Assignments evaluated together as the bits of one Python integer in the brute force search
+_BRUTEFORCE_BLOCK_BITS = 16
+# Below this many variables a process pool costs more than it saves
+_BRUTEFORCE_PARALLEL_VARS = 22
+# Local search flips per clause spent on the starting incumbent of sat_bestcase
+_BESTCASE_FLIPS_PER_CLAUSE = 50
+
+
+def _bruteforce_blocks(n_vars: int, clauses: List[List[int]], start: int, stop: int,
+                       deadline: Optional[float] = None, budget = None) -> Optional[int]:
+    """
+        Evaluates the assignments of blocks [start, stop) bit-parallel and returns the first satisfying
+        assignment as an integer (bit v - 1 is the value of variable v), or None.
+
+        The low block_bits variables change inside a block, bit i of a mask is assignment i of the block,
+        so every literal over them is a fixed mask. The remaining variables are constant within a block
+        and are read from the block number. A clause with a true high literal is skipped, otherwise
+        it contributes the OR of its low masks, and the block is the AND over its clauses.
+    """
+    block_bits = min(n_vars, _BRUTEFORCE_BLOCK_BITS)
+    block_size = 1 << block_bits
+    full = (1 << block_size) - 1
+
+    # var_masks[j] has bit i set when variable j + 1 is True in assignment i of a block
+    var_masks = []
+    for j in range(block_bits):
+        period = ((1 << (1 << j)) - 1) << (1 << j)
+        pattern = period
+        width = 2 << j
+        while width < block_size:
+            pattern |= pattern << width
+            width <<= 1
+        var_masks.append(pattern)
+
+    # Clauses with only low variables are the same in every block
+    base = full
+    mixed = []
+    for clause in clauses:
+        low = 0
+        high = []
+        for x in clause:
+            v = abs(x)
+            if v <= block_bits:
+                low |= var_masks[v - 1] if x > 0 else full ^ var_masks[v - 1]
+            else:
+                high.append((v - block_bits - 1, x > 0))
+        if high:
+            mixed.append((low, high))
+        else:
+            base &= low
+    if not base:
+        return None
+
+    for block in range(start, stop):
+        if budget is not None:
+            budget.charge(block_size)
+        elif deadline is not None and time.perf_counter() > deadline:
+            raise SearchTimeout("time limit reached")
+        result = base
+        for low, high in mixed:
+            for shift, positive in high:
+                if ((block >> shift) & 1) == positive:
+                    break
+            else:
+                result &= low
+                if not result:
+                    break
+        if result:
+            index = (result & -result).bit_length() - 1
+            return (block << block_bits) | index
+    return None
+
+
+def _bruteforce_chunk(task) -> Optional[int]:
+    return _bruteforce_blocks(*task)
+
+
+def _luby(i: int) -> int:
+    """
+        i-th element (starting at 1) of the Luby restart sequence 1, 1, 2, 1, 1, 2, 4, 1, ...
+    """
+    size, power = 1, 1
+    while size < i:
+        power += 1
+        size = 2 * size + 1
+    while size != i:
+        size >>= 1
+        power -= 1
+        if i > size:
+            i -= size
+    return 1 << (power - 1)
+
+
+class _CdclSolver:
+    """
+        Conflict-driven clause learning search behind SatSolver.sat_backtracking
+
+        Literals are encoded as 2 * var for x and 2 * var + 1 for not x, so negation is lit ^ 1.
+        values[lit] is 1 when lit is true, -1 when it is false and 0 while its variable is unassigned.
+        Every clause with two or more literals watches clause[0] and clause[1]; the implied literal of
+        a reason clause is always clause[0]. Learned clauses are deleted by clearing them, the watch
+        lists drop empty clauses the next time they are visited.
+    """
+
+    restart_base = 100
+    var_decay = 0.95
+
+    def __init__(self, n_vars: int, clauses: List[List[int]], budget):
+        n = max([n_vars] + [abs(x) for clause in clauses for x in clause])
+        self.n_vars = n
+        self.budget = budget
+        self.values = [0] * (2 * n + 2)
+        self.level = [0] * (n + 1)
+        self.reason = [None] * (n + 1)
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        # Literals implied by unit propagation, for the search statistics
+        self.propagations = 0
+        self.watches = [[] for _ in range(2 * n + 2)]
+        self.activity = [0.0] * (n + 1)
+        self.var_inc = 1.0
+        # Saved phase as the literal sign bit, every variable starts out False
+        self.polarity = [1] * (n + 1)
+        self.seen = bytearray(n + 1)
+        self.learnts = []
+        self.learnt_lbd = []
+        self.ok = True
+
+        used = bytearray(n + 1)
+        for clause in clauses:
+            literals = []
+            tautology = False
+            for x in dict.fromkeys(clause):
+                lit = 2 * x if x > 0 else -2 * x + 1
+                if lit ^ 1 in literals:
+                    tautology = True
+                    break
+                literals.append(lit)
+            if tautology:
+                continue
+            for lit in literals:
+                used[lit >> 1] = 1
+            if not self.add_clause(literals):
+                self.ok = False
+                return
+
+        # Only variables that occur in a clause are ever decided on
+        self.order = [(0.0, var) for var in range(1, n + 1) if used[var]]
+        heapq.heapify(self.order)
+
+    def add_clause(self, literals: List[int]) -> bool:
+        values = self.values
+        if not literals:
+            return False
+        if len(literals) == 1:
+            lit = literals[0]
+            if values[lit] == -1:
+                return False
+            if values[lit] == 0:
+                self.enqueue(lit, None)
+            return True
+        self.watches[literals[0]].append(literals)
+        self.watches[literals[1]].append(literals)
+        return True
+
+    def enqueue(self, lit: int, reason: Optional[List[int]]):
+        self.values[lit] = 1
+        self.values[lit ^ 1] = -1
+        var = lit >> 1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def propagate(self) -> Optional[List[int]]:
+        """
+            Two-watched-literal unit propagation, returns a conflicting clause or None
+        """
+        values = self.values
+        watches = self.watches
+        trail = self.trail
+        level = self.level
+        reason = self.reason
+        current_level = len(self.trail_lim)
+        qhead = self.qhead
+        assigned = len(trail)
+        conflict = None
+
+        while qhead < len(trail):
+            false_lit = trail[qhead] ^ 1
+            qhead += 1
+            watchers = watches[false_lit]
+            if not watchers:
+                continue
+            kept = []
+            n_watchers = len(watchers)
+            i = 0
+            while i < n_watchers:
+                clause = watchers[i]
+                i += 1
+                # Deleted learned clause
+                if not clause:
+                    continue
+                if clause[0] == false_lit:
+                    clause[0] = clause[1]
+                    clause[1] = false_lit
+                first = clause[0]
+                if values[first] == 1:
+                    kept.append(clause)
+                    continue
+                # Look for a new literal to watch
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if values[lit] != -1:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if values[first] == -1:
+                        conflict = clause
+                        kept.extend(watchers[i:])
+                        break
+                    # Unit clause, clause[0] is implied
+                    values[first] = 1
+                    values[first ^ 1] = -1
+                    var = first >> 1
+                    level[var] = current_level
+                    reason[var] = clause
+                    trail.append(first)
+            watches[false_lit] = kept
+            if conflict is not None:
+                break
+
+        self.qhead = qhead
+        self.propagations += len(trail) - assigned
+        return conflict
+
+    def bump(self, var: int):
+        activity = self.activity
+        activity[var] += self.var_inc
+        if activity[var] > 1e100:
+            for v in range(1, self.n_vars + 1):
+                activity[v] *= 1e-100
+            self.var_inc *= 1e-100
+            self.order = [(-activity[v], v) for _, v in self.order]
+            heapq.heapify(self.order)
+
+    def analyze(self, conflict: List[int]) -> Tuple[List[int], int, int]:
+        """
+            First-UIP conflict analysis, returns (learned clause, backjump level, LBD)
+        """
+        seen = self.seen
+        level = self.level
+        reason = self.reason
+        trail = self.trail
+        current_level = len(self.trail_lim)
+
+        learnt = [0]
+        path = 0
+        index = len(trail) - 1
+        clause = conflict
+        start = 0
+        while True:
+            for k in range(start, len(clause)):
+                lit = clause[k]
+                var = lit >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = 1
+                    self.bump(var)
+                    if level[var] >= current_level:
+                        path += 1
+                    else:
+                        learnt.append(lit)
+            # Next literal of the current level on the trail that takes part in the conflict
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            p = trail[index]
+            index -= 1
+            seen[p >> 1] = 0
+            path -= 1
+            if path == 0:
+                break
+            clause = reason[p >> 1]
+            start = 1
+        learnt[0] = p ^ 1
+
+        # Drop literals implied by other literals of the clause
+        marked = learnt[1:]
+        kept = [learnt[0]]
+        for lit in marked:
+            why = reason[lit >> 1]
+            if why is None or any(not seen[other >> 1] and level[other >> 1] > 0 for other in why[1:]):
+                kept.append(lit)
+        for lit in marked:
+            seen[lit >> 1] = 0
+        learnt = kept
+
+        if len(learnt) == 1:
+            return learnt, 0, 1
+        # The literal with the highest level goes second so it is watched
+        best = max(range(1, len(learnt)), key=lambda k: level[learnt[k] >> 1])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        lbd = len({level[lit >> 1] for lit in learnt})
+        return learnt, level[learnt[1] >> 1], lbd
+
+    def backtrack(self, target_level: int):
+        if len(self.trail_lim) <= target_level:
+            return
+        values = self.values
+        reason = self.reason
+        polarity = self.polarity
+        activity = self.activity
+        order = self.order
+        limit = self.trail_lim[target_level]
+        for lit in reversed(self.trail[limit:]):
+            var = lit >> 1
+            values[lit] = 0
+            values[lit ^ 1] = 0
+            reason[var] = None
+            polarity[var] = lit & 1
+            heapq.heappush(order, (-activity[var], var))
+        del self.trail[limit:]
+        del self.trail_lim[target_level:]
+        self.qhead = limit
+        if len(order) > 4 * self.n_vars + 1024:
+            # Too many stale entries, rebuild the lazy heap
+            self.order = [(-activity[var], var) for var in {var for _, var in order}]
+            heapq.heapify(self.order)
+
+    def pick_branch_variable(self) -> int:
+        values = self.values
+        order = self.order
+        while order:
+            _, var = heapq.heappop(order)
+            if values[2 * var] == 0:
+                return var
+        return 0
+
+    def reduce_learnts(self):
+        """
+            Deletes the half of the learned clauses with the worst LBD, keeping glue clauses and reasons
+        """
+        values = self.values
+        reason = self.reason
+        ranked = sorted(zip(self.learnt_lbd, self.learnts), key=lambda item: (-item[0], -len(item[1])))
+        to_delete = len(ranked) // 2
+        kept_lbd = []
+        kept = []
+        for lbd, clause in ranked:
+            locked = values[clause[0]] == 1 and reason[clause[0] >> 1] is clause
+            if to_delete > 0 and lbd > 2 and not locked:
+                clause.clear()
+                to_delete -= 1
+            else:
+                kept_lbd.append(lbd)
+                kept.append(clause)
+        self.learnts = kept
+        self.learnt_lbd = kept_lbd
+
+    def solve(self) -> Tuple[bool, Dict[int, bool]]:
+        if not self.ok or self.propagate() is not None:
+            return False, {}
+
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        conflicts = 0
+        all_conflicts = 0
+        deepest = 0
+        restarts = 1
+        restart_limit = self.restart_base * _luby(restarts)
+        max_learnts = max(2000, len(self.order) // 3)
+
+        try:
+            while True:
+                nodes += 1
+                if nodes == check_interval:
+                    budget.charge(nodes)
+                    nodes = 0
+
+                conflict = self.propagate()
+                if conflict is not None:
+                    conflicts += 1
+                    all_conflicts += 1
+                    if not self.trail_lim:
+                        return False, {}
+                    learnt, backjump_level, lbd = self.analyze(conflict)
+                    self.backtrack(backjump_level)
+                    if len(learnt) == 1:
+                        self.enqueue(learnt[0], None)
+                    else:
+                        self.watches[learnt[0]].append(learnt)
+                        self.watches[learnt[1]].append(learnt)
+                        self.learnts.append(learnt)
+                        self.learnt_lbd.append(lbd)
+                        self.enqueue(learnt[0], learnt)
+                    self.var_inc /= self.var_decay
+
+                    if conflicts >= restart_limit:
+                        restarts += 1
+                        conflicts = 0
+                        restart_limit = self.restart_base * _luby(restarts)
+                        self.backtrack(0)
+                    continue
+
+                if len(self.learnts) >= max_learnts:
+                    self.reduce_learnts()
+                    max_learnts = int(max_learnts * 1.1)
+
+                var = self.pick_branch_variable()
+                if var == 0:
+                    values = self.values
+                    return True, {v: values[2 * v] == 1 for v in range(1, self.n_vars + 1)}
+                self.trail_lim.append(len(self.trail))
+                if len(self.trail_lim) > deepest:
+                    deepest = len(self.trail_lim)
+                self.enqueue(2 * var + self.polarity[var], None)
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes, max_depth=deepest, propagations=self.propagations, conflicts=all_conflicts)
+
+
+class _LocalSearch:
+    """
+        probSAT stochastic local search behind SatSolver.sat_simple
+
+        Literals use the same 2 * var / 2 * var + 1 encoding as _CdclSolver. The clauses live in one
+        flat literal array with a start offset per clause, and the clauses every literal occurs in
+        are a second flat array indexed by literal. For every clause the search keeps the number of
+        true literals and the XOR of the variables of its true literals, which is the only true
+        variable when the count is 1. From those the break count of every variable (satisfied clauses
+        that become unsatisfied when it flips) is kept up to date on every flip, so choosing a
+        variable never rescans the formula.
+    """
+
+    # probSAT polynomial break exponent by clause length, from the probSAT paper's tuning
+    break_exponents = {3: 2.38, 4: 3.0, 5: 3.7, 6: 5.1}
+
+    def __init__(self, n_vars: int, clauses: List[List[int]], rnd: random.Random, budget):
+        n = max([n_vars] + [abs(x) for clause in clauses for x in clause])
+        self.n_vars = n
+        self.rnd = rnd
+        self.budget = budget
+        self.ok = True
+
+        literals = array("i")
+        starts = array("i", [0])
+        occ_count = [0] * (2 * n + 2)
+        for clause in clauses:
+            clause_literals = []
+            tautology = False
+            for x in dict.fromkeys(clause):
+                lit = 2 * x if x > 0 else -2 * x + 1
+                if lit ^ 1 in clause_literals:
+                    tautology = True
+                    break
+                clause_literals.append(lit)
+            if tautology:
+                continue
+            if not clause_literals:
+                self.ok = False
+                return
+            literals.extend(clause_literals)
+            starts.append(len(literals))
+            for lit in clause_literals:
+                occ_count[lit] += 1
+        self.literals = literals
+        self.starts = starts
+        longest = max((starts[c + 1] - starts[c] for c in range(len(starts) - 1)), default=3)
+        exponent = self.break_exponents.get(longest, 2.38 if longest < 3 else 5.4)
+        # weights[b] for every possible break count b
+        self.weights = [(1 + b) ** -exponent for b in range(max(occ_count) + 1)]
+        n_clauses = len(starts) - 1
+
+        occ_starts = array("i", [0]) * (2 * n + 3)
+        for lit in range(2 * n + 2):
+            occ_starts[lit + 1] = occ_starts[lit] + occ_count[lit]
+        occ = array("i", [0]) * len(literals)
+        fill = array("i", occ_starts)
+        for c in range(n_clauses):
+            for index in range(starts[c], starts[c + 1]):
+                lit = literals[index]
+                occ[fill[lit]] = c
+                fill[lit] += 1
+        self.occ = occ
+        self.occ_starts = occ_starts
+
+        self.value = bytearray(rnd.getrandbits(1) for _ in range(n + 1))
+        self.n_true = array("i", [0]) * n_clauses
+        self.true_xor = array("i", [0]) * n_clauses
+        self.break_count = array("i", [0]) * (n + 1)
+        # Unsatisfied clauses in a list, with the position of every clause in it for O(1) removal
+        self.unsat = []
+        self.unsat_pos = array("i", [-1]) * n_clauses
+
+        value = self.value
+        for c in range(n_clauses):
+            count = 0
+            xor = 0
+            for index in range(starts[c], starts[c + 1]):
+                lit = literals[index]
+                if (lit & 1) ^ value[lit >> 1]:
+                    count += 1
+                    xor ^= lit >> 1
+            self.n_true[c] = count
+            self.true_xor[c] = xor
+            if count == 0:
+                self.unsat_pos[c] = len(self.unsat)
+                self.unsat.append(c)
+            elif count == 1:
+                self.break_count[xor] += 1
+
+    def flip(self, var: int):
+        occ, occ_starts = self.occ, self.occ_starts
+        n_true, true_xor = self.n_true, self.true_xor
+        break_count = self.break_count
+        unsat, unsat_pos = self.unsat, self.unsat_pos
+
+        self.value[var] ^= 1
+        # The literal of var that is true after the flip
+        made = 2 * var + (self.value[var] ^ 1)
+        for index in range(occ_starts[made], occ_starts[made + 1]):
+            c = occ[index]
+            count = n_true[c]
+            if count == 0:
+                last = unsat.pop()
+                if last != c:
+                    position = unsat_pos[c]
+                    unsat[position] = last
+                    unsat_pos[last] = position
+                unsat_pos[c] = -1
+                break_count[var] += 1
+            elif count == 1:
+                break_count[true_xor[c]] -= 1
+            n_true[c] = count + 1
+            true_xor[c] ^= var
+
+        broken = made ^ 1
+        for index in range(occ_starts[broken], occ_starts[broken + 1]):
+            c = occ[index]
+            count = n_true[c] - 1
+            n_true[c] = count
+            xor = true_xor[c] ^ var
+            true_xor[c] = xor
+            if count == 0:
+                unsat_pos[c] = len(unsat)
+                unsat.append(c)
+                break_count[var] -= 1
+            elif count == 1:
+                break_count[xor] += 1
+
+    def pick_variable(self, c: int) -> int:
+        """
+            probSAT choice in the unsatisfied clause c: every variable is picked with probability
+            proportional to (1 + break)^-cb, so flips that break few clauses are strongly preferred
+            but never certain
+        """
+        literals = self.literals
+        break_count = self.break_count
+        weights = self.weights
+        candidates = [literals[index] >> 1 for index in range(self.starts[c], self.starts[c + 1])]
+        return self.rnd.choices(candidates, [weights[break_count[var]] for var in candidates])[0]
+
+    def solve(self, max_flips: int) -> Tuple[bool, Dict[int, bool]]:
+        if not self.ok:
+            return False, {}
+        unsat = self.unsat
+        rnd = self.rnd
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        try:
+            for _ in range(max_flips):
+                if not unsat:
+                    break
+                nodes += 1
+                if nodes == check_interval:
+                    budget.charge(nodes)
+                    nodes = 0
+                self.flip(self.pick_variable(unsat[rnd.randrange(len(unsat))]))
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes)
+
+        if unsat:
+            # Local search cannot prove unsatisfiability, running out of flips is reported like a timeout
+            raise SearchTimeout(f"flip limit of {max_flips} reached")
+        value = self.value
+        return True, {v: value[v] == 1 for v in range(1, self.n_vars + 1)}
+
+
+    def descend(self, max_flips: int) -> Tuple[int, bytearray]:
+        """
+            Runs up to max_flips flips and returns the fewest unsatisfied clauses seen together with
+            the assignment that had them, as a starting incumbent for the MaxSAT search
+        """
+        unsat = self.unsat
+        rnd = self.rnd
+        best_unsat = len(unsat)
+        best_value = bytearray(self.value)
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        try:
+            for _ in range(max_flips):
+                if not unsat:
+                    break
+                nodes += 1
+                if nodes == check_interval:
+                    try:
+                        budget.charge(nodes)
+                    except SearchTimeout as error:
+                        error.incumbent = {v: best_value[v] == 1 for v in range(1, self.n_vars + 1)}
+                        raise
+                    nodes = 0
+                self.flip(self.pick_variable(unsat[rnd.randrange(len(unsat))]))
+                if len(unsat) < best_unsat:
+                    best_unsat = len(unsat)
+                    best_value[:] = self.value
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes)
+
+        return best_unsat, best_value
+
+
+class _MaxSatSearch:
+    """
+        Anytime branch-and-bound for MaxSAT behind SatSolver.sat_bestcase
+
+        Variables are assigned in a fixed order, most frequent first, and every clause keeps the
+        number of its true and unassigned literals plus the XOR of its unassigned literals, so the
+        falsified clause count is updated incrementally on every assignment. A clause with no true
+        literal and one unassigned literal is unit on that literal, and since every unit clause
+        belongs to a single variable, falsified + sum over variables of min(units on x, units on
+        not x) is a lower bound on the clauses any completion leaves unsatisfied. A branch is cut
+        as soon as that bound reaches the incumbent.
+    """
+
+    def __init__(self, n_vars: int, clauses: List[List[int]], budget, report = None):
+        n = max([n_vars] + [abs(x) for clause in clauses for x in clause])
+        self.n_vars = n
+        self.budget = budget
+        self.report = report
+        self.n_clauses = len(clauses)
+
+        self.occ = [[] for _ in range(2 * n + 2)]
+        self.free = array("i")
+        self.n_true = array("i")
+        self.free_xor = array("i")
+        self.falsified = 0
+        for clause in clauses:
+            literals = []
+            tautology = False
+            for x in dict.fromkeys(clause):
+                lit = 2 * x if x > 0 else -2 * x + 1
+                if lit ^ 1 in literals:
+                    tautology = True
+                    break
+                literals.append(lit)
+            if tautology:
+                continue
+            c = len(self.free)
+            xor = 0
+            for lit in literals:
+                self.occ[lit].append(c)
+                xor ^= lit
+            self.free.append(len(literals))
+            self.n_true.append(0)
+            self.free_xor.append(xor)
+            if not literals:
+                self.falsified += 1
+
+        self.units = array("i", [0]) * (2 * n + 2)
+        self.unit_bound = 0
+        for c in range(len(self.free)):
+            if self.free[c] == 1:
+                self.add_unit(self.free_xor[c], 1)
+
+        # Most frequent variables first, each first tried with the sign it has most often
+        self.order = sorted(range(1, n + 1), key=lambda v: -(len(self.occ[2 * v]) + len(self.occ[2 * v + 1])))
+        self.first_value = bytearray(int(len(self.occ[2 * v]) >= len(self.occ[2 * v + 1])) for v in range(n + 1))
+        self.value = bytearray(n + 1)
+        self.best_value = bytearray(self.first_value)
+        self.best_cost = len(self.free) + 1
+
+    def add_unit(self, lit: int, delta: int):
+        units = self.units
+        other = units[lit ^ 1]
+        before = min(units[lit], other)
+        units[lit] += delta
+        self.unit_bound += min(units[lit], other) - before
+
+    def assign(self, var: int, value: int):
+        occ, free, n_true, free_xor = self.occ, self.free, self.n_true, self.free_xor
+        self.value[var] = value
+        made = 2 * var + (value ^ 1)
+        broken = made ^ 1
+        for c in occ[made]:
+            if n_true[c] == 0 and free[c] == 1:
+                self.add_unit(made, -1)
+            n_true[c] += 1
+            free[c] -= 1
+            free_xor[c] ^= made
+        for c in occ[broken]:
+            if n_true[c] == 0 and free[c] == 1:
+                self.add_unit(broken, -1)
+            count = free[c] - 1
+            free[c] = count
+            free_xor[c] ^= broken
+            if n_true[c] == 0:
+                if count == 0:
+                    self.falsified += 1
+                elif count == 1:
+                    self.add_unit(free_xor[c], 1)
+
+    def unassign(self, var: int):
+        occ, free, n_true, free_xor = self.occ, self.free, self.n_true, self.free_xor
+        made = 2 * var + (self.value[var] ^ 1)
+        broken = made ^ 1
+        for c in occ[broken]:
+            if n_true[c] == 0:
+                if free[c] == 0:
+                    self.falsified -= 1
+                elif free[c] == 1:
+                    self.add_unit(free_xor[c], -1)
+            free[c] += 1
+            free_xor[c] ^= broken
+            if n_true[c] == 0 and free[c] == 1:
+                self.add_unit(broken, 1)
+        for c in occ[made]:
+            n_true[c] -= 1
+            free[c] += 1
+            free_xor[c] ^= made
+            if n_true[c] == 0 and free[c] == 1:
+                self.add_unit(made, 1)
+
+    def set_incumbent(self, cost: int, value: bytearray):
+        """
+            Starts from a known assignment that leaves cost clauses unsatisfied, the search then
+            tries its signs first and only looks for strictly better assignments
+        """
+        self.best_cost = cost
+        self.best_value[:] = value
+        self.first_value[:] = value
+
+    def incumbent(self) -> Dict[int, bool]:
+        best_value = self.best_value
+        return {v: best_value[v] == 1 for v in range(1, self.n_vars + 1)}
+
+    def solve(self) -> Tuple[bool, Dict[int, bool]]:
+        order = self.order
+        depth = len(order)
+        first_value = self.first_value
+        # Values tried so far at every level of the explicit stack: 0, 1 or 2
+        tried = bytearray(depth + 1)
+        budget = self.budget
+        check_interval = budget.check_interval
+        nodes = 0
+        prunes = 0
+        deepest = 0
+        level = 0
+        try:
+            while level >= 0 and self.best_cost > 0:
+                nodes += 1
+                if nodes == check_interval:
+                    try:
+                        budget.charge(nodes)
+                    except SearchTimeout as error:
+                        # Anytime: the best assignment so far goes out with the timeout
+                        error.incumbent = self.incumbent()
+                        raise
+                    nodes = 0
+
+                if level == depth:
+                    if self.falsified < self.best_cost:
+                        self.best_cost = self.falsified
+                        self.best_value[:] = self.value
+                        if self.report is not None:
+                            self.report(self.n_clauses - self.best_cost, self.n_clauses)
+                    level -= 1
+                    continue
+
+                var = order[level]
+                if tried[level]:
+                    self.unassign(var)
+                if tried[level] == 2:
+                    tried[level] = 0
+                    level -= 1
+                    continue
+                self.assign(var, first_value[var] ^ tried[level])
+                tried[level] += 1
+                # Bound: no completion of this branch can leave fewer clauses unsatisfied than the incumbent
+                if self.falsified + self.unit_bound < self.best_cost:
+                    level += 1
+                    if level > deepest:
+                        deepest = level
+                else:
+                    prunes += 1
+        finally:
+            if budget.stats is not None:
+                budget.record(nodes, prunes=prunes, max_depth=deepest)
+
+        return self.best_cost == 0, self.incumbent()
 
 
 class SatSolver(SatSolverAbstractClass):
@@ -57,13 +872,172 @@ class SatSolver(SatSolverAbstractClass):
 
 
     def sat_backtracking(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        pass
+        """
+            Generates a backtracking solution with conflict-driven clause learning (CDCL)
+
+            Instead of undoing one decision at a time, every conflict is analyzed back to its first
+            unique implication point and turned into a learned clause that rules that conflict out,
+            then the search jumps straight back to the level where the learned clause becomes unit.
+            Propagation uses two watched literals per clause, decisions follow VSIDS activity
+            (variables in recent conflicts are tried first) with saved phases, the search restarts
+            on a Luby schedule and half of the learned clauses with the worst LBD are deleted
+            whenever the learned database grows too large.
+
+            Params
+            - n_vars: number of variables, numbered 1..n_vars
+            - clauses: list of clauses, every clause a list of non-zero literals (-x is not x)
+
+            Return
+            Tuple[
+                bool: True if the formula is satisfiable or False if it isn't,
+                Dict[int, bool]: variable, value pairs of a satisfying assignment, empty when unsatisfiable
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> sat_backtracking(3, [[1, 2], [-1, 3], [-3]])
+            (True, {1: False, 2: True, 3: False})
+            >>> sat_backtracking(1, [[1], [-1]])
+            (False, {})
+        """
+        return _CdclSolver(n_vars, clauses, self.budget).solve()
 
     def sat_bruteforce(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        pass
+        """
+            Generates a brute force solution by checking every one of the 2^n assignments
+
+            Instead of building assignments one at a time with itertools, the assignments are checked
+            in blocks of 2^16: each clause becomes a 65536 bit mask of the assignments in the block that
+            satisfy it, and one AND over the clause masks checks the whole block at once.
+            Blocks are checked in order, so the answer is always the first satisfying assignment
+            when counting up with variable 1 as the lowest bit. With more than one worker and enough
+            variables the blocks are split into chunks that run on a process pool. That only happens
+            when this call is not already running inside a pool worker, which in practice means an
+            input with a single instance. The chunks check the time limit themselves, and every chunk
+            that comes back is charged to the budget, so the node limit stops the search at the next
+            finished chunk.
+
+            Params
+            - n_vars: number of variables, numbered 1..n_vars
+            - clauses: list of clauses, every clause a list of non-zero literals (-x is not x)
+
+            Return
+            Tuple[
+                bool: True if the formula is satisfiable or False if it isn't,
+                Dict[int, bool]: variable, value pairs of a satisfying assignment, empty when unsatisfiable
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> sat_bruteforce(2, [[1, 2], [-1]])
+            (True, {1: False, 2: True})
+            >>> sat_bruteforce(1, [[1], [-1]])
+            (False, {})
+        """
+        clauses = [list(clause) for clause in clauses]
+        n = max([n_vars] + [abs(x) for clause in clauses for x in clause])
+        n_blocks = 1 << max(0, n - _BRUTEFORCE_BLOCK_BITS)
+        workers = resolve_workers(self.run_options["workers"])
+
+        # Nested pools are avoided, inside a worker process the blocks are checked serially
+        if workers > 1 and n >= _BRUTEFORCE_PARALLEL_VARS and multiprocessing.parent_process() is None:
+            deadline = self.budget.deadline
+            chunk = max(1, n_blocks // (workers * 8))
+            tasks = [(n, clauses, start, min(start + chunk, n_blocks), deadline)
+                     for start in range(0, n_blocks, chunk)]
+            found = None
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_bruteforce_chunk, task) for task in tasks]
+                try:
+                    # Chunks are checked in order so the answer is the same as the serial search
+                    for (_, _, start, stop, _), future in zip(tasks, futures):
+                        found = future.result()
+                        if found is not None:
+                            break
+                        self.budget.charge((stop - start) << min(n, _BRUTEFORCE_BLOCK_BITS))
+                finally:
+                    for future in futures:
+                        future.cancel()
+        else:
+            found = _bruteforce_blocks(n, clauses, 0, n_blocks, budget=self.budget)
+
+        if found is None:
+            return False, {}
+        return True, {v: bool((found >> (v - 1)) & 1) for v in range(1, n_vars + 1)}
 
     def sat_bestcase(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        pass
+        """
+            Generates a best case (MaxSAT) solution with an anytime branch-and-bound search
+
+            Variables are assigned one at a time and the number of clauses that are already false is
+            carried down the search. A branch is pruned when that count, plus one clause for every
+            variable that has unit clauses asking for both of its values, can no longer beat the best
+            assignment found so far (the incumbent). The first incumbent comes from a short run of the
+            sat_simple local search, and the branch and bound only looks for better ones from there.
+            This way, if the formula is satisfiable we return a satisfying assignment, but if it isn't,
+            we return the assignment that satisfies the most clauses, like knapsack_bestcase returns
+            the closest fit. When the run budget is used up the instance is written as TIMEOUT together
+            with the incumbent, and the "report_incumbents" run option prints every improvement.
+
+            Params
+            - n_vars: number of variables, numbered 1..n_vars
+            - clauses: list of clauses, every clause a list of non-zero literals (-x is not x)
+
+            Return
+            Tuple[
+                bool: True if the formula is satisfiable or False if it isn't,
+                Dict[int, bool]: variable, value pairs of an assignment satisfying as many clauses as possible
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> sat_bestcase(2, [[1, 2], [-1]])
+            (True, {1: False, 2: True})
+            >>> sat_bestcase(2, [[1], [-1], [2]])
+            (False, {1: True, 2: True})
+            - 2 of the 3 clauses are satisfied, no assignment satisfies all of them
+        """
+        report = self.report_incumbent if self.run_options["report_incumbents"] else None
+        search = _MaxSatSearch(n_vars, clauses, self.budget, report)
+        # A short local search run gives the branch and bound a good incumbent to prune against
+        local_search = _LocalSearch(n_vars, clauses, random.Random(self.run_options["seed"]), self.budget)
+        if local_search.ok:
+            flips = min(self.run_options["max_flips"], _BESTCASE_FLIPS_PER_CLAUSE * len(search.free))
+            cost, value = local_search.descend(flips)
+            search.set_incumbent(cost, value)
+            if report is not None:
+                report(search.n_clauses - cost, search.n_clauses)
+        return search.solve()
+
+    def report_incumbent(self, satisfied: int, n_clauses: int):
+        print(f"  incumbent: {satisfied}/{n_clauses} clauses satisfied")
 
     def sat_simple(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        pass
\ No newline at end of file
+        """
+            Generates a solution with probSAT stochastic local search
+
+            Starts from a random assignment and keeps flipping one variable of a random unsatisfied
+            clause, preferring flips that break few satisfied clauses, until every clause is satisfied.
+            On large random 3-SAT this finds a model far faster than a complete search, but it can never
+            prove a formula unsatisfiable: when the "max_flips" run option is used up the instance is
+            written as TIMEOUT. The "seed" run option seeds every instance the same way, so results do
+            not depend on the instance order or the number of workers.
+
+            Params
+            - n_vars: number of variables, numbered 1..n_vars
+            - clauses: list of clauses, every clause a list of non-zero literals (-x is not x)
+
+            Return
+            Tuple[
+                bool: True if a satisfying assignment was found, False only for a formula with an empty clause,
+                Dict[int, bool]: variable, value pairs of a satisfying assignment, empty otherwise
+            ]
+
+            Example
+            This is just for demonstration, but it's not a valid runnable test
+            >>> sat_simple(3, [[1, 2], [-1, 3], [-3]])
+            (True, {1: False, 2: True, 3: False})
+        """
+        rnd = random.Random(self.run_options["seed"])
+        search = _LocalSearch(n_vars, clauses, rnd, self.budget)
+        return search.solve(self.run_options["max_flips"])
\ No newline at end of file
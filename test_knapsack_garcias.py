@@ -1,9 +1,14 @@
 import pytest
 import os
+import sys
+import random
 from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
 from src.helpers.constants import CONFIGURATION_FILE_PATH, parse_config, TEST_FILE, TEST_BESTCASE_FILE
 from src.knapsack_garcias import Knapsack
 from src.helpers.dmaics_parser import parse_multi_instance_knapsack
+from src.helpers.fast_parser import fast_parse_multi_instance_knapsack
+from src.helpers.search_budget import SearchTimeout
+from src.helpers.parallel_runner import solve_instances
 import json
 
 def parse_bestcase_file(filename):
@@ -112,4 +117,138 @@ def test_knapsack_simple(solver):
             pytest.skip(status)
         elif solvable != 0:
             expected = solvable == 1
-            assert bt_ok == expected
\ No newline at end of file
+            assert bt_ok == expected
+
+
+def uses_coins(target, coins, combination):
+    return (sum(coin * count for coin, count in combination.items()) == target
+            and all(0 < count <= coins.get(coin, 0) for coin, count in combination.items()))
+
+
+def closest_sum(target, coins):
+    # Every sum up to target the coins can make, for checking the best case answers
+    sums = {0}
+    for coin, count in coins.items():
+        sums = {total + coin * used for total in sums for used in range(count + 1) if total + coin * used <= target}
+    return max(sums)
+
+
+def test_searches_go_deeper_than_the_recursion_limit():
+    solver = Knapsack(TEST_FILE)
+    target = 5 * sys.getrecursionlimit()
+    coins = {1: target + 1000}
+    for method in (solver.knapsack_backtracking, solver.knapsack_bruteforce, solver.knapsack_bestcase):
+        solver.budget.start()
+        assert method(target, coins) == (True, {1: target})
+
+
+def test_knapsack_simple_large_targets():
+    solver = Knapsack(TEST_FILE)
+    rnd = random.Random(7)
+    for target in (10 ** 5, 10 ** 6):
+        coins = {rnd.randint(1000, 50000): rnd.randint(1, 10) for _ in range(40)}
+        solver.budget.start()
+        ok, combination = solver.knapsack_simple(target, coins)
+        assert ok and uses_coins(target, coins, combination)
+        # Only even coins, an odd target is out of reach
+        even = {2 * coin: count for coin, count in coins.items()}
+        solver.budget.start()
+        assert solver.knapsack_simple(2 * target + 1, even) == (False, {})
+
+
+def test_knapsack_simple_stops_at_the_budget():
+    solver = Knapsack(TEST_FILE, run_options={"node_limit": 3})
+    solver.budget.start()
+    with pytest.raises(SearchTimeout):
+        solver.knapsack_simple(10 ** 6, {coin: 5 for coin in range(1001, 1041)})
+
+
+def test_knapsack_bestcase_is_optimal():
+    solver = Knapsack(TEST_FILE)
+    rnd = random.Random(3)
+    for _ in range(200):
+        coins = {rnd.randint(2, 40): rnd.randint(1, 4) for _ in range(rnd.randint(1, 6))}
+        target = rnd.randint(1, sum(coin * count for coin, count in coins.items()) + 10)
+        best = closest_sum(target, coins)
+        solver.budget.start()
+        ok, combination = solver.knapsack_bestcase(target, coins)
+        assert ok == (best == target)
+        assert uses_coins(best, coins, combination)
+
+
+def test_knapsack_backtracking_memoizes_failed_states():
+    # Only even coins and an odd target: without the memo of failed (denomination, remaining target)
+    # states the search goes through about 490000 nodes, with it about 10000
+    solver = Knapsack(TEST_FILE, run_options={"node_limit": 20000})
+    solver.budget.start()
+    assert solver.knapsack_backtracking(1001, {60: 20, 42: 20, 30: 20, 24: 20, 18: 20, 12: 20}) == (False, {})
+
+
+def test_fast_parser_matches_text_parser():
+    assert fast_parse_multi_instance_knapsack(TEST_FILE) == parse_multi_instance_knapsack(TEST_FILE)
+
+
+class CrashingKnapsack(Knapsack):
+    """
+    Knapsack whose backtracking raises on the instance with crash_target, like a solver bug would.
+    Defined at module level so the worker processes can unpickle it.
+    """
+
+    crash_target = None
+
+    def knapsack_backtracking(self, target, coins):
+        if target == self.crash_target:
+            raise RuntimeError("solver bug")
+        return super().knapsack_backtracking(target, coins)
+
+
+class InstanceListKnapsack(Knapsack):
+    """
+    Knapsack with a method that reports whether the process solving it holds the parsed instance list.
+    """
+
+    def has_instance_list(self, target, coins):
+        return self.solution_instances is not None, {}
+
+
+def test_workers_do_not_receive_the_instance_list():
+    solver = InstanceListKnapsack(TEST_FILE, run_options={"plot": False})
+    tasks = [solver.instance_task("has_instance_list", instance) for instance in solver.solution_instances]
+    assert [ok for ok, _, _, _ in solve_instances(solver, tasks, workers=2)] == [False] * len(tasks)
+    assert [ok for ok, _, _, _ in solve_instances(solver, tasks, workers=1)] == [True] * len(tasks)
+    assert len(solver.solution_instances) == len(tasks)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rows_survive_a_crash_and_resume(tmp_path, workers):
+    (tmp_path / "complete").mkdir()
+    complete = Knapsack(TEST_FILE, results_folder_path=str(tmp_path / "complete"), run_options={"plot": False})
+    complete.run()
+    expected = {sub_problem: [line.split(",")[:5] for line in open(complete.result_path(sub_problem.name)).read().splitlines()]
+                for sub_problem, _, _ in complete.selected_methods()}
+
+    # Instance 5 has target 5, the four instances before it are solved with every method
+    crashing = CrashingKnapsack(TEST_FILE, results_folder_path=str(tmp_path), run_options={"plot": False, "workers": workers})
+    crashing.crash_target = 5
+    with pytest.raises(RuntimeError):
+        crashing.run()
+    for sub_problem, rows in expected.items():
+        written = [line.split(",")[:5] for line in open(crashing.result_path(sub_problem.name)).read().splitlines()]
+        assert written == rows[:len(written)]
+        # Header and the four instances, brute force runs before backtracking and may have written the fifth
+        assert len(written) >= 5
+        if sub_problem is SubProblemSelection.btracking:
+            assert len(written) == 5
+
+    resumed = Knapsack(TEST_FILE, results_folder_path=str(tmp_path), run_options={"plot": False, "resume": True})
+    resumed.run()
+    for sub_problem, rows in expected.items():
+        assert [line.split(",")[:5] for line in open(resumed.result_path(sub_problem.name)).read().splitlines()] == rows
+
+
+def test_original_constructor_keywords():
+    solver = Knapsack(file_input_path=TEST_FILE, run_options={"plot": False})
+    assert solver.file_input_path == solver.input_path == TEST_FILE
+    assert len(solver.solution_instances) == len(Knapsack(TEST_FILE).solution_instances)
+    with pytest.raises(TypeError):
+        Knapsack(TEST_FILE, file_input_path=TEST_FILE)
@@ -0,0 +1,65 @@
+"""
+Fixtures shared by the solver tests in this folder.
+
+A test module names the solver it tests and its instance file in this folder:
+
+    SOLVER_CLASS = SatSolver
+    INSTANCE_FILE = "check_sat_tests.cnf"
+
+and defines check_answer(instance, ok, answer, **expected), which asserts that one method
+answered one instance correctly. The solvers read test_config.json instead of the student
+configuration, so every sub problem is selected whatever the working directory holds.
+"""
+
+import os
+import pytest
+
+TESTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+TEST_CONFIG_FILE = os.path.join(TESTS_FOLDER, "test_config.json")
+
+
+def in_tests_folder(file_name: str) -> str:
+    return os.path.join(TESTS_FOLDER, file_name)
+
+
+@pytest.fixture
+def make_solver(request, tmp_path):
+    """
+    Builds the module's solver on its instance file with the given run options. input_path picks another
+    file, input_text writes one to the test's tmp_path, and solver_class builds another solver.
+    Results are written to the test's tmp_path.
+    """
+    def make(input_path = None, input_text = None, solver_class = None, **run_options):
+        module = request.module
+        if input_text is not None:
+            input_path = tmp_path / "instances.cnf"
+            input_path.write_text(input_text)
+        solver_class = solver_class or module.SOLVER_CLASS
+        return solver_class(str(input_path or in_tests_folder(module.INSTANCE_FILE)),
+                            results_folder_path=str(tmp_path),
+                            run_options=run_options,
+                            config_path=TEST_CONFIG_FILE)
+    return make
+
+
+@pytest.fixture(scope="module")
+def solver(request, tmp_path_factory):
+    """
+    The module's solver on its instance file with the default run options, shared by the module.
+    """
+    module = request.module
+    return module.SOLVER_CLASS(in_tests_folder(module.INSTANCE_FILE),
+                               results_folder_path=str(tmp_path_factory.mktemp("results")),
+                               config_path=TEST_CONFIG_FILE)
+
+
+@pytest.fixture
+def check_method(request, solver):
+    """
+    Calls method on every instance of the solver fixture and checks each answer with the module's check_answer.
+    """
+    def check(method, **expected):
+        for instance in solver.solution_instances:
+            ok, answer = method(*solver.instance_args(instance))
+            request.module.check_answer(instance, ok, answer, **expected)
+    return check
@@ -0,0 +1,79 @@
+import pytest
+from src.benchmark import mann_whitney_greater, find_slowdowns, run_benchmark
+from src.helpers.instance_generators import (knapsack_instances, random_ksat_instances,
+                                             gnp_coloring_instances, gnp_hamiltonian_instances, KNAPSACK_MAX_TARGET)
+from src.knapsack_garcias import Knapsack
+from src.sat import SatSolver
+from src.graph_coloring import GraphColoring
+from src.hamiltonian import HamiltonianSolver
+from conftest import TEST_CONFIG_FILE
+
+SOLVER_CLASS = Knapsack
+INSTANCE_FILE = "check_knapsack_binpacking_tests.cnf"
+
+
+def parsed(make_solver, text, solver_class):
+    return make_solver(input_text=text, solver_class=solver_class).solution_instances
+
+
+def test_generators_are_seeded_and_parse(make_solver):
+    assert random_ksat_instances([10, 20], count=3, seed=1) == random_ksat_instances([10, 20], count=3, seed=1)
+    assert random_ksat_instances([10], seed=1) != random_ksat_instances([10], seed=2)
+
+    knapsack = parsed(make_solver, knapsack_instances([5, 8], count=2), Knapsack)
+    assert [sum(coins.values()) for _, _, coins, _ in knapsack] == [5, 5, 8, 8]
+    assert all(0 < target < sum(value * times for value, times in coins.items()) for _, target, coins, _ in knapsack)
+
+    sat = parsed(make_solver, random_ksat_instances([10, 20], count=2), SatSolver)
+    assert [(n_vars, len(clauses)) for _, n_vars, clauses in sat] == [(10, 43), (10, 43), (20, 85), (20, 85)]
+    assert all(len({abs(literal) for literal in clause}) == 3 for _, _, clauses in sat for clause in clauses)
+
+    graphs = parsed(make_solver, gnp_coloring_instances([12], count=2, k=4), GraphColoring)
+    assert [(k, n) for _, k, n, _ in graphs] == [(4, 12), (4, 12)]
+    assert all(0 <= u < v < n for _, _, n, edges in graphs for u, v in edges)
+
+    weighted = parsed(make_solver, gnp_hamiltonian_instances([9], count=2), HamiltonianSolver)
+    assert all(n == 9 and all(1 <= w <= 100 for _, _, w in edges) for _, n, edges in weighted)
+
+
+def test_knapsack_targets_fit_the_dynamic_program(make_solver):
+    solver = make_solver(input_text=knapsack_instances([18, 40, 200], count=2))
+    assert all(0 < target <= KNAPSACK_MAX_TARGET for _, target, _, _ in solver.solution_instances)
+    # Small sizes still get values as wide as there are coins
+    assert max(coin for _, _, coins, _ in solver.solution_instances[:2] for coin in coins) > 1 << 10
+    for _, target, coins, _ in solver.solution_instances[2:4]:
+        ok, used = solver.knapsack_simple(target, coins)
+        assert ok and sum(coin * times for coin, times in used.items()) == target
+
+
+def test_mann_whitney_greater():
+    # All 5 new times above all 5 old ones is the most extreme of the 252 orderings
+    assert mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) == pytest.approx(1 / 252)
+    assert mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == 1.0
+    assert mann_whitney_greater([1, 3, 5, 7, 9], [2, 4, 6, 8, 10]) > 0.05
+    assert mann_whitney_greater([1.0] * 5, [1.0] * 5) > 0.5
+    # Normal approximation for large samples
+    assert mann_whitney_greater(list(range(30)), list(range(30, 60))) < 1e-6
+
+
+def test_find_slowdowns():
+    def run(times):
+        return {"results": {"BackTracking": {"10": {"times": times, "median": sorted(times)[len(times) // 2]}}}}
+
+    baseline = run([1.0, 1.1, 0.9, 1.0, 1.05])
+    assert find_slowdowns(baseline, run([1.0, 0.95, 1.1, 1.02, 0.98])) == []
+    # Significant but below the minimum slowdown
+    assert find_slowdowns(baseline, run([1.2, 1.15, 1.2, 1.3, 1.25]), min_slowdown=0.5) == []
+    slowdowns = find_slowdowns(baseline, run([2.0, 2.1, 1.9, 2.2, 2.05]))
+    assert [(s["method"], s["size"]) for s in slowdowns] == [("BackTracking", "10")]
+    assert slowdowns[0]["ratio"] == pytest.approx(2.05)
+
+
+def test_run_benchmark():
+    result = run_benchmark("bin_packing", [4, 6], count=2, repetitions=3, config_path=TEST_CONFIG_FILE)
+    assert result["generator"] == {"sizes": [4, 6], "count": 2, "seed": 0}
+    assert result["results"]
+    for sizes_results in result["results"].values():
+        assert set(sizes_results) == {"4", "6"}
+        assert all(len(entry["times"]) == 3 and entry["timeouts"] == 0 for entry in sizes_results.values())
+    assert find_slowdowns(result, result) == []
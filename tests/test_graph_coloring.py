@@ -0,0 +1,116 @@
+import pytest
+import itertools
+from src import graph_coloring
+from src.graph_coloring import GraphColoring
+from src.helpers.search_budget import SearchTimeout
+from src.helpers.dmaics_parser import parse_multi_instance_graph
+from src.helpers.fast_parser import fast_parse_multi_instance_graph
+
+SOLVER_CLASS = GraphColoring
+INSTANCE_FILE = "check_graph_coloring_tests.cnf"
+
+
+def is_coloring(n_vertices, edges, k, coloring):
+    return (len(coloring) == n_vertices and all(0 <= color < k for color in coloring)
+            and all(coloring[u] != coloring[v] for u, v in edges))
+
+
+def brute_force_colorable(n_vertices, edges, k):
+    return any(is_coloring(n_vertices, edges, k, list(coloring))
+               for coloring in itertools.product(range(k), repeat=n_vertices))
+
+
+def check_answer(instance, ok, coloring):
+    instance_id, k, n_vertices, edges = instance
+    assert ok == brute_force_colorable(n_vertices, edges, k), instance_id
+    if ok:
+        assert is_coloring(n_vertices, edges, k, coloring), instance_id
+    else:
+        assert coloring == []
+
+
+def test_coloring_backtracking(solver, check_method):
+    check_method(solver.coloring_backtracking)
+
+
+def test_coloring_bruteforce(solver, check_method):
+    check_method(solver.coloring_bruteforce)
+
+
+def test_coloring_bestcase(solver):
+    for instance_id, k, n_vertices, edges in solver.solution_instances:
+        ok, coloring = solver.coloring_bestcase(n_vertices, edges, k)
+        # Uncolorable instances still get a coloring with the fewest colors
+        chromatic = next(colors for colors in range(1, n_vertices + 1)
+                         if brute_force_colorable(n_vertices, edges, colors))
+        assert ok == (chromatic <= k), instance_id
+        assert is_coloring(n_vertices, edges, chromatic, coloring), instance_id
+        assert len(set(coloring)) == chromatic, instance_id
+
+
+def test_coloring_simple(make_solver):
+    solver = make_solver(tabu_iterations=1000, seed=1)
+    for instance_id, k, n_vertices, edges in solver.solution_instances:
+        if brute_force_colorable(n_vertices, edges, k):
+            ok, coloring = solver.coloring_simple(n_vertices, edges, k)
+            assert ok and is_coloring(n_vertices, edges, k, coloring), instance_id
+        else:
+            # The heuristic cannot prove there is no k-coloring, it runs out of moves instead
+            with pytest.raises(SearchTimeout):
+                solver.coloring_simple(n_vertices, edges, k)
+
+
+# Blank lines, comma and space separators, and an edge line with an extra weight column
+PARSER_INSTANCES = """c 1 3 ?
+p cnf 4 4
+
+1,2
+2 3
+
+3,4,7
+ 4 1
+c 2 2 ?
+p cnf 3 2
+1,2
+
+2,3
+"""
+
+
+def test_fast_parser_matches_text_parser(tmp_path):
+    path = tmp_path / "instances.cnf"
+    path.write_text(PARSER_INSTANCES)
+    fast = fast_parse_multi_instance_graph(str(path))
+    assert fast == parse_multi_instance_graph(str(path))
+    assert [list(edges) for _, _, _, edges in fast] == [[(0, 1), (1, 2), (2, 3), (3, 0)], [(0, 1), (1, 2)]]
+
+
+def test_coloring_bruteforce_chunks_on_a_pool(make_solver, monkeypatch):
+    # With 3 colors a block covers the colorings of vertices 0..8, so 13 vertices are 81 blocks
+    # that the pool gets in 17 chunks
+    monkeypatch.setattr(graph_coloring, "_BRUTEFORCE_PARALLEL_COLORINGS", 1)
+    pools = []
+
+    class CountingPool(graph_coloring.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(graph_coloring, "ProcessPoolExecutor", CountingPool)
+    serial = make_solver()
+    pooled = make_solver(workers=2)
+    path = [(v, v + 1) for v in range(8)]
+    # Vertex 12 has to take the color of vertex 11, or with one more edge there is no 3-coloring
+    colorable = path + [(9, 10), (10, 11), (9, 11), (9, 12), (10, 12)]
+    uncolorable = colorable + [(11, 12)]
+    for edges in (colorable, uncolorable):
+        serial.budget.start()
+        pooled.budget.start()
+        assert pooled.coloring_bruteforce(13, edges, 3) == serial.coloring_bruteforce(13, edges, 3)
+    assert len(pools) == 2
+
+    limited = make_solver(workers=2, node_limit=3 ** 9)
+    limited.budget.start()
+    with pytest.raises(SearchTimeout):
+        limited.coloring_bruteforce(13, uncolorable, 3)
+    assert len(pools) == 3
@@ -0,0 +1,70 @@
+import pytest
+import itertools
+from src.hamiltonian import HamiltonianSolver
+from src.helpers.hamiltonian_helper import tour_weight
+from src.helpers.search_budget import SearchTimeout
+
+SOLVER_CLASS = HamiltonianSolver
+INSTANCE_FILE = "check_hamiltonian_tests.cnf"
+
+
+def is_tour(n_vertices, edges, tour):
+    return sorted(tour) == list(range(n_vertices)) and tour_weight(edges, tour) is not None
+
+
+def lightest_tour_weight(n_vertices, edges):
+    weights = [tour_weight(edges, [0, *order]) for order in itertools.permutations(range(1, n_vertices))]
+    return min((weight for weight in weights if weight is not None), default=None)
+
+
+def check_answer(instance, ok, tour, lightest: bool):
+    instance_id, n_vertices, edges = instance
+    best = lightest_tour_weight(n_vertices, edges)
+    assert ok == (best is not None), instance_id
+    if ok:
+        assert is_tour(n_vertices, edges, tour), instance_id
+        if lightest:
+            assert tour_weight(edges, tour) == best, instance_id
+    else:
+        assert tour == []
+
+
+def test_hamiltonian_backtracking(solver, check_method):
+    check_method(solver.hamiltonian_backtracking, lightest=False)
+
+
+def test_hamiltonian_bruteforce(solver, check_method):
+    check_method(solver.hamiltonian_bruteforce, lightest=True)
+
+
+def test_hamiltonian_bestcase(solver, check_method):
+    check_method(solver.hamiltonian_bestcase, lightest=True)
+
+
+def test_hamiltonian_simple(solver):
+    for instance_id, n_vertices, edges in solver.solution_instances:
+        if lightest_tour_weight(n_vertices, edges) is not None:
+            ok, tour = solver.hamiltonian_simple(n_vertices, edges)
+            assert ok and is_tour(n_vertices, edges, tour), instance_id
+        elif instance_id == "4":
+            # The Petersen graph passes the degree and connectivity checks, local search can only give up
+            with pytest.raises(SearchTimeout):
+                solver.hamiltonian_simple(n_vertices, edges)
+        else:
+            assert solver.hamiltonian_simple(n_vertices, edges) == (False, []), instance_id
+
+
+def test_hamiltonian_bruteforce_past_the_held_karp_tables(make_solver):
+    # The Held-Karp tables of 40 vertices would take terabytes, the branch-and-bound search is used instead
+    n = 40
+    cycle = [(v, (v + 1) % n, 1 + v % 3) for v in range(n)]
+    solver = make_solver()
+    ok, tour = solver.hamiltonian_bruteforce(n, cycle)
+    assert ok and is_tour(n, cycle, tour) and tour_weight(cycle, tour) == sum(w for _, _, w in cycle)
+
+    # With a node limit a large dense graph runs out of budget instead of memory
+    dense = [(u, v, (u * v) % 7 + 1) for u in range(n) for v in range(u + 1, n)]
+    limited = make_solver(node_limit=1000)
+    limited.budget.start()
+    with pytest.raises(SearchTimeout):
+        limited.hamiltonian_bruteforce(n, dense)
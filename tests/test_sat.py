@@ -0,0 +1,206 @@
+import pytest
+import itertools
+import csv
+from src import sat
+from src.sat import SatSolver
+from src.helpers.project_selection_enum import SubProblemSelection
+from src.helpers.search_budget import SearchTimeout
+from src.helpers.sat_solver_helper import count_satisfied
+from src.helpers.cnf_preprocessor import preprocess
+from src.helpers.dmaics_parser import parse_multi_instance_dimacs
+from src.helpers.fast_parser import fast_parse_multi_instance_dimacs
+from src.helpers.instance_cache import cache_path, cached_instances, read_cache
+from src.entrypoint import parse_arguments
+from conftest import TEST_CONFIG_FILE, in_tests_folder
+
+SOLVER_CLASS = SatSolver
+INSTANCE_FILE = "check_sat_tests.cnf"
+
+
+def is_model(clauses, assignment):
+    return all(any(assignment[abs(x)] == (x > 0) for x in clause) for clause in clauses)
+
+
+def brute_force_satisfiable(n_vars, clauses):
+    for values in itertools.product([False, True], repeat=n_vars):
+        if is_model(clauses, dict(zip(range(1, n_vars + 1), values))):
+            return True
+    return False
+
+
+def check_answer(instance, ok, assignment):
+    instance_id, n_vars, clauses = instance
+    assert ok == brute_force_satisfiable(n_vars, clauses), instance_id
+    if ok:
+        assert is_model(clauses, assignment)
+    else:
+        assert assignment == {}
+
+
+def test_sat_backtracking(solver, check_method):
+    check_method(solver.sat_backtracking)
+
+
+def test_sat_bruteforce(solver, check_method):
+    check_method(solver.sat_bruteforce)
+
+
+def test_sat_simple(make_solver):
+    solver = make_solver(max_flips=10000, seed=1)
+    for instance_id, n_vars, clauses in solver.solution_instances:
+        if brute_force_satisfiable(n_vars, clauses):
+            ok, assignment = solver.sat_simple(n_vars, clauses)
+            assert ok and is_model(clauses, assignment), instance_id
+        else:
+            # Local search cannot prove unsatisfiability, it runs out of flips instead
+            with pytest.raises(SearchTimeout):
+                solver.sat_simple(n_vars, clauses)
+
+
+def test_sat_bestcase(solver):
+    for instance_id, n_vars, clauses in solver.solution_instances:
+        ok, assignment = solver.sat_bestcase(n_vars, clauses)
+        # Unsatisfiable instances still get the assignment that satisfies the most clauses
+        best = max(count_satisfied(clauses, dict(zip(range(1, n_vars + 1), values)))
+                   for values in itertools.product([False, True], repeat=n_vars))
+        assert ok == brute_force_satisfiable(n_vars, clauses), instance_id
+        assert count_satisfied(clauses, assignment) == best, instance_id
+
+
+def test_solve_preprocessed(solver, check_method):
+    check_method(lambda n_vars, clauses: solver.solve_preprocessed("sat_backtracking", n_vars, clauses))
+    # An implication chain 1 -> 2 -> ... -> 8 with 1 forced is solved by preprocessing alone
+    chain = [[1]] + [[-v, v + 1] for v in range(1, 8)]
+    formula = preprocess(8, chain)
+    assert formula.n_vars == 0 and formula.clauses == []
+    assert formula.reconstruct({}) == {v: True for v in range(1, 9)}
+
+
+def test_parquet_results(make_solver):
+    pytest.importorskip("pyarrow")
+    pandas = pytest.importorskip("pandas")
+    solver = make_solver(parquet=True)
+    solver.run()
+    for sub_problem, _, _ in solver.selected_methods():
+        results = pandas.read_parquet(solver.result_path(sub_problem.name).replace(".csv", ".parquet"))
+        assert list(results["instance_id"]) == ["1", "2", "3", "4"]
+        assert results["n_vars"].dtype == "int64" and results["time_seconds"].dtype == "float64"
+        # Local search runs out of flips on the unsatisfiable instances, which leaves the column empty
+        unsatisfiable = None if sub_problem is SubProblemSelection.simple else False
+        assert list(results["satisfiable"]) == [True, unsatisfiable, unsatisfiable, True]
+        for (_, n_vars, clauses), satisfiable, solution in zip(solver.solution_instances, results["satisfiable"], results["solution"]):
+            if satisfiable:
+                assert is_model(clauses, dict(solution))
+
+
+def test_search_stats_columns(make_solver):
+    solver = make_solver(stats=True)
+    solver.run()
+    for sub_problem, _, _ in solver.selected_methods():
+        with open(solver.result_path(sub_problem.name), newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 4
+        # Some instances are decided before any search node, e.g. by a conflict at the root
+        assert all(int(row["nodes"]) >= 0 and int(row["peak_memory_kb"]) >= 0 for row in rows)
+        assert any(int(row["nodes"]) > 0 for row in rows)
+        if sub_problem.name == "btracking":
+            assert all(row["propagations"] != "" for row in rows if row["satisfiable"] == "S")
+
+
+# Blank lines, comma and space separators, and trailing DIMACS zeros, which both parsers accept the same way
+PARSER_INSTANCES = """c 1 3 ?
+p cnf 3 3
+
+1,2,-3
+ -1 2 0
+
+3,-2,0
+c 2 3 ?
+p cnf 2 2
+1 2
+-1,-2
+
+"""
+
+
+def test_fast_parser_matches_text_parser(tmp_path):
+    path = tmp_path / "instances.cnf"
+    path.write_text(PARSER_INSTANCES)
+    fast = fast_parse_multi_instance_dimacs(str(path))
+    assert fast == parse_multi_instance_dimacs(str(path))
+    assert [list(clauses) for _, _, clauses in fast] == [[[1, 2, -3], [-1, 2], [3, -2]], [[1, 2], [-1, -2]]]
+
+
+def test_fast_parser_drops_zeros_like_the_text_parser(tmp_path):
+    # Every line is one clause whatever zeros it holds, and literals may pass 32 bits
+    path = tmp_path / "instances.cnf"
+    path.write_text(f"c 1 3 ?\np cnf 3 4\n1 -2 0 3\n0 {1 << 40} 0\n0\n5,0,-6\n")
+    expected = [[1, -2, 3], [1 << 40], [5, -6]]
+    assert parse_multi_instance_dimacs(str(path))[0][2] == expected
+    assert list(fast_parse_multi_instance_dimacs(str(path))[0][2]) == expected
+
+
+@pytest.mark.parametrize("clause", ["1 -0 2", "1 00", str(1 << 70)])
+def test_fast_parser_rejects_what_it_cannot_store(tmp_path, clause):
+    # The text parser keeps -0 and 00 as a literal 0 and has no integer range
+    path = tmp_path / "instances.cnf"
+    path.write_text(f"c 1 3 ?\np cnf 3 1\n{clause}\n")
+    assert len(parse_multi_instance_dimacs(str(path))[0][2]) == 1
+    with pytest.raises(ValueError):
+        fast_parse_multi_instance_dimacs(str(path))
+
+
+def test_cache_is_kept_apart_per_parser(tmp_path):
+    path = tmp_path / "instances.cnf"
+    path.write_text(f"c 1 3 ?\np cnf 3 2\n1 -2 0 3\n{1 << 40},2\n")
+    expected = [[1, -2, 3], [1 << 40, 2]]
+    text = cached_instances(str(path), "dimacs", lambda: parse_multi_instance_dimacs(str(path)), str(tmp_path))
+    fast = cached_instances(str(path), "dimacs", lambda: fast_parse_multi_instance_dimacs(str(path)), str(tmp_path), parser="mmap")
+    assert list(text[0][2]) == list(fast[0][2]) == expected
+    assert list(read_cache(str(path), "dimacs", str(tmp_path))[0][2]) == expected
+    assert list(read_cache(str(path), "dimacs", str(tmp_path), parser="mmap")[0][2]) == expected
+    assert cache_path(str(path), "dimacs", str(tmp_path)) != cache_path(str(path), "dimacs", str(tmp_path), parser="mmap")
+
+
+def test_streaming_rejects_cache_and_mmap_flags():
+    with pytest.raises(SystemExit):
+        parse_arguments(["--streaming", "--cache"])
+    with pytest.raises(SystemExit):
+        parse_arguments(["--streaming", "--parser", "mmap"])
+    assert parse_arguments(["--streaming"]).streaming
+
+
+def test_sat_bruteforce_chunks_on_a_pool(make_solver, monkeypatch):
+    # 18 variables are 4 blocks of 2^16 assignments, which the pool gets as 4 chunks
+    monkeypatch.setattr(sat, "_BRUTEFORCE_PARALLEL_VARS", 18)
+    pools = []
+
+    class CountingPool(sat.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(sat, "ProcessPoolExecutor", CountingPool)
+    serial = make_solver()
+    pooled = make_solver(workers=2)
+    # Only satisfiable with variables 17 and 18 set, so the answer is in the last chunk
+    satisfiable = [[17], [18], [1, 2]]
+    unsatisfiable = [[17], [-17, 18], [-18], [1, 2]]
+    for clauses in (satisfiable, unsatisfiable):
+        serial.budget.start()
+        pooled.budget.start()
+        assert pooled.sat_bruteforce(18, clauses) == serial.sat_bruteforce(18, clauses)
+    assert len(pools) == 2
+
+    limited = make_solver(workers=2, node_limit=1 << 16)
+    limited.budget.start()
+    with pytest.raises(SearchTimeout):
+        limited.sat_bruteforce(18, unsatisfiable)
+    assert len(pools) == 3
+
+
+def test_original_constructor_keyword():
+    path = in_tests_folder(INSTANCE_FILE)
+    solver = SatSolver(cnf_file_input_path=path, result_file_name="sat_solver_results", config_path=TEST_CONFIG_FILE)
+    assert solver.cnf_file_input_path == solver.input_path == path
+    assert len(solver.solution_instances) == 4